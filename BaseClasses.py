@@ -1,11 +1,11 @@
 from __future__ import annotations
 from argparse import Namespace
 
-import copy
 from enum import unique, IntEnum, IntFlag
 import logging
 import json
 import functools
+import itertools
 from collections import OrderedDict, Counter, deque
 from typing import List, Dict, Optional, Set, Iterable, Union, Any, Tuple, TypedDict, Callable, NamedTuple
 import typing  # this can go away when Python 3.8 support is dropped
@@ -55,6 +55,7 @@ class MultiWorld():
     completion_condition: Dict[int, Callable[[CollectionState], bool]]
     indirect_connections: Dict[Region, Set[Entrance]]
     exclude_locations: Dict[int, Options.ExcludeLocations]
+    profiler: Utils.StageProfiler  # times of each generation stage and each game's hooks, stages set by Main.main
 
     game: Dict[int, str]
 
@@ -81,6 +82,8 @@ class MultiWorld():
         self.precollected_items = {player: [] for player in self.player_ids}
         self._cached_entrances = None
         self._cached_locations = None
+        self._location_index: Optional[LocationIndex] = None
+        self._sphere_model: Optional[SphereModel] = None
         self._entrance_cache = {}
         self._location_cache: Dict[Tuple[str, int], Location] = {}
         self.required_locations = []
@@ -95,6 +98,7 @@ class MultiWorld():
         self.shuffle_ganon = True
         self.spoiler = Spoiler(self)
         self.indirect_connections = {}
+        self.profiler = Utils.StageProfiler()
         self.fix_trock_doors = self.AttributeProxy(
             lambda player: self.shuffle[player] != 'vanilla' or self.mode[player] == 'inverted')
         self.fix_skullwoods_exit = self.AttributeProxy(
@@ -321,7 +325,7 @@ class MultiWorld():
 
     def _recache(self):
         """Rebuild world cache"""
-        self._cached_locations = None
+        self.clear_location_cache()
         for region in self.regions:
             player = region.player
             self._region_cache[player][region.name] = region
@@ -364,7 +368,10 @@ class MultiWorld():
     def get_all_state(self, use_cache: bool) -> CollectionState:
         cached = getattr(self, "_all_state", None)
         if use_cache and cached:
-            return cached.copy()
+            ret = cached.copy()
+            # rules and entrances may have changed since the cached state was swept
+            ret.mark_stale()
+            return ret
 
         ret = CollectionState(self)
 
@@ -384,16 +391,15 @@ class MultiWorld():
         return [loc.item for loc in self.get_filled_locations()] + self.itempool
 
     def find_item_locations(self, item, player: int) -> List[Location]:
-        return [location for location in self.get_locations() if
-                location.item and location.item.name == item and location.item.player == player]
+        index = self.get_location_index()
+        return index.sort(index.item_locations.get((item, player), ()))
 
     def find_item(self, item, player: int) -> Location:
-        return next(location for location in self.get_locations() if
-                    location.item and location.item.name == item and location.item.player == player)
+        return next(iter(self.find_item_locations(item, player)))
 
     def find_items_in_locations(self, items: Set[str], player: int) -> List[Location]:
-        return [location for location in self.get_locations() if
-                location.item and location.item.name in items and location.item.player == player]
+        index = self.get_location_index()
+        return index.sort(location for item in items for location in index.item_locations.get((item, player), ()))
 
     def create_item(self, item_name: str, player: int) -> Item:
         return self.worlds[player].create_item(item_name)
@@ -401,6 +407,7 @@ class MultiWorld():
     def push_precollected(self, item: Item):
         self.precollected_items[item.player].append(item)
         self.state.collect(item, True)
+        self._sphere_model = None
 
     def push_item(self, location: Location, item: Item, collect: bool = True):
         assert location.can_fill(self.state, item, False), f"Cannot place {item} into {location}."
@@ -431,33 +438,55 @@ class MultiWorld():
 
     def clear_location_cache(self):
         self._cached_locations = None
+        self._location_index = None
+        self._sphere_model = None
+
+    def clear_sphere_cache(self):
+        """Drop the sphere model. Needed after changing what is collected from the start or rules after it got built,
+        placing items into locations is noticed on its own."""
+        self._sphere_model = None
+
+    def get_sphere_model(self) -> SphereModel:
+        """The spheres of the current placements, swept once and shared until placements change."""
+        index = self.get_location_index()
+        if self._sphere_model is None or self._sphere_model.placements != index.placements:
+            self._sphere_model = SphereModel(self)
+        return self._sphere_model
+
+    def _get_current_sphere_model(self) -> Optional[SphereModel]:
+        """The sphere model if one was built for the current placements, without building one."""
+        if self._sphere_model and self._location_index \
+                and self._sphere_model.placements == self._location_index.placements:
+            return self._sphere_model
+        return None
+
+    def get_location_index(self) -> LocationIndex:
+        if self._location_index is None:
+            self._location_index = LocationIndex(self.get_locations())
+        return self._location_index
 
     def get_unfilled_locations(self, player: Optional[int] = None) -> List[Location]:
-        if player is not None:
-            return [location for location in self.get_locations() if
-                    location.player == player and not location.item]
-        return [location for location in self.get_locations() if not location.item]
+        index = self.get_location_index()
+        return index.sort(index.get_unfilled(player))
 
     def get_unfilled_dungeon_locations(self):
-        return [location for location in self.get_locations() if not location.item and location.parent_region.dungeon]
+        index = self.get_location_index()
+        return index.sort(location for location in index.get_unfilled() if location.parent_region.dungeon)
 
     def get_filled_locations(self, player: Optional[int] = None) -> List[Location]:
-        if player is not None:
-            return [location for location in self.get_locations() if
-                    location.player == player and location.item is not None]
-        return [location for location in self.get_locations() if location.item is not None]
+        index = self.get_location_index()
+        return index.sort(index.get_filled(player))
 
     def get_reachable_locations(self, state: Optional[CollectionState] = None, player: Optional[int] = None) -> List[Location]:
         if state is None:
             state = self.state
-        return [location for location in self.get_locations() if
-                (player is None or location.player == player) and location.can_reach(state)]
+        locations = self.get_locations() if player is None else self.get_location_index().player_locations.get(player, [])
+        return [location for location in locations if location.can_reach(state)]
 
     def get_placeable_locations(self, state=None, player=None) -> List[Location]:
         if state is None:
             state = self.state
-        return [location for location in self.get_locations() if
-                (player is None or location.player == player) and location.item is None and location.can_reach(state)]
+        return [location for location in self.get_unfilled_locations(player) if location.can_reach(state)]
 
     def get_unfilled_locations_for_players(self, locations: List[str], players: Iterable[int]):
         for player in players:
@@ -492,6 +521,9 @@ class MultiWorld():
         else:
             if self.has_beaten_game(self.state):
                 return True
+            sphere_model = self._get_current_sphere_model()
+            if sphere_model:
+                return sphere_model.beaten_sphere is not None
             state = CollectionState(self)
         prog_locations = {location for location in self.get_locations() if location.item
                           and location.item.advancement and location not in state.locations_checked}
@@ -518,29 +550,15 @@ class MultiWorld():
         return False
 
     def get_spheres(self):
-        state = CollectionState(self)
-        locations = set(self.get_filled_locations())
-
-        while locations:
-            sphere = set()
-
-            for location in locations:
-                if location.can_reach(state):
-                    sphere.add(location)
-            yield sphere
-            if not sphere:
-                if locations:
-                    yield locations  # unreachable locations
-                break
-
-            for location in sphere:
-                state.collect(location.item, True, location)
-            locations -= sphere
+        sphere_model = self.get_sphere_model()
+        for sphere in sphere_model.spheres:
+            yield set(sphere)
+        if sphere_model.unreachable:
+            yield set()
+            yield set(sphere_model.unreachable)  # unreachable locations
 
     def fulfills_accessibility(self, state: Optional[CollectionState] = None):
         """Check if accessibility rules are fulfilled with current or supplied state."""
-        if not state:
-            state = CollectionState(self)
         players: Dict[str, Set[int]] = {
             "minimal": set(),
             "items": set(),
@@ -575,6 +593,21 @@ class MultiWorld():
 
         locations = [location for location in self.get_locations() if location_relevant(location)]
 
+        if not state:
+            # the sphere model collects every advancement item, excluded locations holding one are not swept here
+            if not any(location.progress_type == LocationProgressType.EXCLUDED and location.item.advancement
+                       for location in self.get_filled_locations()):
+                sphere_model = self.get_sphere_model()
+                missing = [location for location in locations if location not in sphere_model.location_spheres
+                           and not (location.item is None and location.can_reach(sphere_model.state))]
+                if sphere_model.beaten_sphere is not None and not any(map(location_condition, missing)):
+                    return True
+                if missing:
+                    logging.warning(f"Could not access required locations for accessibility check."
+                                    f" Missing: {missing}")
+                return False
+            state = CollectionState(self)
+
         while locations:
             sphere: List[Location] = []
             for n in range(len(locations) - 1, -1, -1):
@@ -603,27 +636,62 @@ class MultiWorld():
 PathValue = Tuple[str, Optional["PathValue"]]
 
 
+class ProgressionCounter(Counter):
+    """Counter of (item name, player) that remembers which item names of each player changed,
+    so reachability can be updated for only the connections depending on them."""
+    changes: Dict[int, Set[str]]
+
+    def __init__(self, *args, **kwargs):
+        self.changes = {}
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: Tuple[str, int], value: int):
+        self.changes.setdefault(key[1], set()).add(key[0])
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Tuple[str, int]):
+        self.changes.setdefault(key[1], set()).add(key[0])
+        super().__delitem__(key)
+
+    def copy(self) -> ProgressionCounter:
+        ret = super().copy()
+        ret.changes = {player: names.copy() for player, names in self.changes.items()}
+        return ret
+
+    def pop_changes(self, player: int) -> Set[str]:
+        """Return the item names of player that changed since the last call and forget them."""
+        return self.changes.pop(player, set())
+
+
 class CollectionState():
-    prog_items: typing.Counter[Tuple[str, int]]
+    prog_items: ProgressionCounter
     multiworld: MultiWorld
     reachable_regions: Dict[int, Set[Region]]
     blocked_connections: Dict[int, Set[Entrance]]
+    # per player, item name -> blocked connections whose access rule reads that item, None -> undeclared rules
+    blocked_dependencies: Dict[int, Dict[Optional[str], Set[Entrance]]]
     events: Set[Location]
     path: Dict[Union[Region, Entrance], PathValue]
     locations_checked: Set[Location]
     stale: Dict[int, bool]
+    # players whose region sets, and whether the path, may be written to without affecting a copy sharing them
+    _owned_players: Set[int]
+    _owns_path: bool
     additional_init_functions: List[Callable[[CollectionState, MultiWorld], None]] = []
     additional_copy_functions: List[Callable[[CollectionState, CollectionState], CollectionState]] = []
 
     def __init__(self, parent: MultiWorld):
-        self.prog_items = Counter()
+        self.prog_items = ProgressionCounter()
         self.multiworld = parent
         self.reachable_regions = {player: set() for player in parent.get_all_ids()}
         self.blocked_connections = {player: set() for player in parent.get_all_ids()}
+        self.blocked_dependencies = {player: {} for player in parent.get_all_ids()}
         self.events = set()
         self.path = {}
         self.locations_checked = set()
         self.stale = {player: True for player in parent.get_all_ids()}
+        self._owned_players = set(parent.get_all_ids())
+        self._owns_path = True
         for function in self.additional_init_functions:
             function(self, parent)
         for items in parent.precollected_items.values():
@@ -632,10 +700,26 @@ class CollectionState():
 
     def update_reachable_regions(self, player: int):
         self.stale[player] = False
+        if player not in self._owned_players:
+            self._own_player(player)
         rrp = self.reachable_regions[player]
         bc = self.blocked_connections[player]
-        queue = deque(self.blocked_connections[player])
+        changed_items = self.prog_items.pop_changes(player)
         start = self.multiworld.get_region('Menu', player)
+        dependencies: Optional[Dict[Optional[str], Set[Entrance]]] = None
+        if self.multiworld.worlds[player].incremental_reachability:
+            dependencies = self.blocked_dependencies[player]
+
+        if dependencies and start in rrp:
+            # only retry blocked connections whose access rule reads a changed item or doesn't declare what it reads
+            retry = dependencies.pop(None, set())
+            for item_name in changed_items:
+                retry |= dependencies.pop(item_name, set())
+            queue = deque(retry & bc)
+        else:
+            queue = deque(bc)
+            if dependencies is not None:
+                dependencies.clear()
 
         # init on first call - this can't be done on construction since the regions don't exist yet
         if start not in rrp:
@@ -655,23 +739,59 @@ class CollectionState():
                 bc.remove(connection)
                 bc.update(new_region.exits)
                 queue.extend(new_region.exits)
-                self.path[new_region] = (new_region.name, self.path.get(connection, None))
+                self.set_path(new_region, (new_region.name, self.path.get(connection, None)))
 
                 # Retry connections if the new region can unblock them
                 for new_entrance in self.multiworld.indirect_connections.get(new_region, set()):
                     if new_entrance in bc and new_entrance not in queue:
                         queue.append(new_entrance)
+            elif dependencies is not None:
+                # still blocked, remember which items can unblock it
+                item_dependencies = getattr(connection.access_rule, "item_dependencies", None)
+                if item_dependencies is None:
+                    dependencies.setdefault(None, set()).add(connection)
+                else:
+                    for item_name in item_dependencies:
+                        dependencies.setdefault(item_name, set()).add(connection)
+
+    def mark_stale(self) -> None:
+        """Check reachability again for every player, through all blocked connections,
+        as rules or entrances may have changed since this state was last updated."""
+        for player in self.stale:
+            self.stale[player] = True
+            self.blocked_dependencies[player] = {}
+
+    def _own_player(self, player: int) -> None:
+        """Clone the region sets of player that are still shared with a copy, so they can be written to."""
+        self._owned_players.add(player)
+        self.reachable_regions[player] = self.reachable_regions[player].copy()
+        self.blocked_connections[player] = self.blocked_connections[player].copy()
+        self.blocked_dependencies[player] = {item_name: connections.copy() for item_name, connections
+                                             in self.blocked_dependencies[player].items()}
+
+    def set_path(self, spot: Union[Region, Entrance], value: PathValue) -> None:
+        if not self._owns_path:
+            self.path = self.path.copy()
+            self._owns_path = True
+        self.path[spot] = value
 
     def copy(self) -> CollectionState:
-        ret = CollectionState(self.multiworld)
+        """Copy this state. Region sets and the path are shared with the copy
+        and only cloned, per player, once either state updates them."""
+        ret = CollectionState.__new__(CollectionState)
+        ret.multiworld = self.multiworld
         ret.prog_items = self.prog_items.copy()
-        ret.reachable_regions = {player: copy.copy(self.reachable_regions[player]) for player in
-                                 self.reachable_regions}
-        ret.blocked_connections = {player: copy.copy(self.blocked_connections[player]) for player in
-                                   self.blocked_connections}
-        ret.events = copy.copy(self.events)
-        ret.path = copy.copy(self.path)
-        ret.locations_checked = copy.copy(self.locations_checked)
+        ret.reachable_regions = self.reachable_regions.copy()
+        ret.blocked_connections = self.blocked_connections.copy()
+        ret.blocked_dependencies = self.blocked_dependencies.copy()
+        ret.stale = self.stale.copy()
+        ret.events = self.events.copy()
+        ret.path = self.path
+        ret.locations_checked = self.locations_checked.copy()
+        ret._owned_players = set()
+        ret._owns_path = False
+        self._owned_players = set()
+        self._owns_path = False
         for function in self.additional_copy_functions:
             ret = function(self, ret)
         return ret
@@ -694,7 +814,7 @@ class CollectionState():
 
     def sweep_for_events(self, key_only: bool = False, locations: Optional[Iterable[Location]] = None) -> None:
         if locations is None:
-            locations = self.multiworld.get_filled_locations()
+            locations = self.multiworld.get_location_index().get_filled()
         reachable_events = True
         # since the loop has a good chance to run more than once, only filter the events once
         locations = {location for location in locations if location.event and location not in self.events and
@@ -919,6 +1039,8 @@ class CollectionState():
             # invalidate caches, nothing can be trusted anymore now
             self.reachable_regions[item.player] = set()
             self.blocked_connections[item.player] = set()
+            self.blocked_dependencies[item.player] = {}
+            self._owned_players.add(item.player)
             self.stale[item.player] = True
 
 
@@ -972,7 +1094,7 @@ class Region:
         for entrance in self.entrances:
             if entrance.can_reach(state):
                 if not self in state.path:
-                    state.path[self] = (self.name, state.path.get(entrance, None))
+                    state.set_path(self, (self.name, state.path.get(entrance, None)))
                 return True
         return False
 
@@ -1009,7 +1131,7 @@ class Entrance:
     def can_reach(self, state: CollectionState) -> bool:
         if self.parent_region.can_reach(state) and self.access_rule(state):
             if not self.hide_path and not self in state.path:
-                state.path[self] = (self.name, state.path.get(self.parent_region, (self.parent_region.name, None)))
+                state.set_path(self, (self.name, state.path.get(self.parent_region, (self.parent_region.name, None))))
             return True
 
         return False
@@ -1085,6 +1207,104 @@ class Boss():
         return f"Boss({self.name})"
 
 
+class LocationIndex:
+    """Buckets the locations of a MultiWorld by player, by being filled or not and by the (item name, player) they
+    hold. Kept current by assignments to Location.item; rebuilt when MultiWorld.clear_location_cache is called."""
+    position: Dict[Location, int]
+    player_locations: Dict[int, List[Location]]
+    filled: Dict[int, Set[Location]]
+    unfilled: Dict[int, Set[Location]]
+    item_locations: Dict[Tuple[str, int], Set[Location]]
+    placements: int  # counts changes of held items, to tell if something built from them is outdated
+
+    def __init__(self, locations: List[Location]):
+        self.placements = 0
+        self.position = {}
+        self.player_locations = {}
+        self.filled = {}
+        self.unfilled = {}
+        self.item_locations = {}
+        for position, location in enumerate(locations):
+            self.position[location] = position
+            self.player_locations.setdefault(location.player, []).append(location)
+            self.filled.setdefault(location.player, set())
+            self.unfilled.setdefault(location.player, set())
+            location._location_index = self
+            self.add(location, location.item)
+
+    def add(self, location: Location, item: Optional[Item]) -> None:
+        self.placements += 1
+        if item is None:
+            self.unfilled[location.player].add(location)
+        else:
+            self.filled[location.player].add(location)
+            self.item_locations.setdefault((item.name, item.player), set()).add(location)
+
+    def discard(self, location: Location, item: Optional[Item]) -> None:
+        if item is None:
+            self.unfilled[location.player].discard(location)
+        else:
+            self.filled[location.player].discard(location)
+            self.item_locations.get((item.name, item.player), set()).discard(location)
+
+    def get_filled(self, player: Optional[int] = None) -> Iterable[Location]:
+        """Filled locations of player, or of all players, in no particular order."""
+        if player is None:
+            return itertools.chain.from_iterable(self.filled.values())
+        return self.filled.get(player, ())
+
+    def get_unfilled(self, player: Optional[int] = None) -> Iterable[Location]:
+        """Unfilled locations of player, or of all players, in no particular order."""
+        if player is None:
+            return itertools.chain.from_iterable(self.unfilled.values())
+        return self.unfilled.get(player, ())
+
+    def sort(self, locations: Iterable[Location]) -> List[Location]:
+        """Sort locations into the order of MultiWorld.get_locations, to keep results deterministic."""
+        return sorted(locations, key=self.position.__getitem__)
+
+
+class SphereModel:
+    """Spheres of all filled locations of a MultiWorld, swept once from a fresh CollectionState collecting the
+    advancement items found. Shared through MultiWorld.get_sphere_model until placements change."""
+    spheres: List[Set[Location]]
+    unreachable: Set[Location]
+    location_spheres: Dict[Location, int]
+    item_spheres: Dict[Tuple[str, int], int]  # (item name, player) -> first sphere holding it
+    beaten_sphere: Optional[int]  # sphere after collecting which the game is beaten, -1 for from the start
+    state: CollectionState  # after collecting all reachable spheres
+    placements: int
+
+    def __init__(self, multiworld: MultiWorld):
+        self.placements = multiworld.get_location_index().placements
+        self.spheres = []
+        self.location_spheres = {}
+        self.item_spheres = {}
+        state = CollectionState(multiworld)
+        self.beaten_sphere = -1 if multiworld.has_beaten_game(state) else None
+        locations = set(multiworld.get_filled_locations())
+        while locations:
+            sphere = {location for location in locations if location.can_reach(state)}
+            if not sphere:
+                break
+            sphere_index = len(self.spheres)
+            self.spheres.append(sphere)
+            for location in sphere:
+                self.location_spheres[location] = sphere_index
+                self.item_spheres.setdefault((location.item.name, location.item.player), sphere_index)
+                if location.item.advancement:
+                    state.collect(location.item, True, location)
+            locations -= sphere
+            if self.beaten_sphere is None and multiworld.has_beaten_game(state):
+                self.beaten_sphere = sphere_index
+        self.unreachable = locations
+        self.state = state
+
+    def reachable(self, sphere: int) -> Set[Location]:
+        """Filled locations reachable after collecting the spheres before the given one."""
+        return set().union(*self.spheres[:sphere + 1])
+
+
 class LocationProgressType(IntEnum):
     DEFAULT = 1
     PRIORITY = 2
@@ -1104,7 +1324,8 @@ class Location:
     always_allow = staticmethod(lambda item, state: False)
     access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
     item_rule = staticmethod(lambda item: True)
-    item: Optional[Item] = None
+    _item: Optional[Item] = None
+    _location_index: Optional[LocationIndex] = None
 
     def __init__(self, player: int, name: str = '', address: Optional[int] = None, parent: Optional[Region] = None):
         self.player = player
@@ -1112,6 +1333,17 @@ class Location:
         self.address = address
         self.parent_region = parent
 
+    @property
+    def item(self) -> Optional[Item]:
+        return self._item
+
+    @item.setter
+    def item(self, item: Optional[Item]) -> None:
+        if self._location_index is not None:
+            self._location_index.discard(self, self._item)
+            self._location_index.add(self, item)
+        self._item = item
+
     def can_fill(self, state: CollectionState, item: Item, check_access=True) -> bool:
         return (self.always_allow(state, item)
                 or ((self.progress_type != LocationProgressType.EXCLUDED or not (item.advancement or item.useful))
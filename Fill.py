@@ -1,7 +1,6 @@
 import logging
 import typing
 import collections
-import itertools
 from collections import Counter, deque
 
 from BaseClasses import CollectionState, Location, LocationProgressType, MultiWorld, Item, ItemClassification
@@ -285,9 +284,10 @@ def distribute_items_restrictive(world: MultiWorld) -> None:
                 early_items_count[(item.name, item.player)] -= 1
                 if early_items_count[(item.name, item.player)] == 0:
                     del early_items_count[(item.name, item.player)]
-        fill_restrictive(world, world.state, early_locations, early_rest_items, lock=True)
-        early_locations += early_priority_locations
-        fill_restrictive(world, world.state, early_locations, early_prog_items, lock=True)
+        with world.profiler.part("fill_restrictive"):
+            fill_restrictive(world, world.state, early_locations, early_rest_items, lock=True)
+            early_locations += early_priority_locations
+            fill_restrictive(world, world.state, early_locations, early_prog_items, lock=True)
         unplaced_early_items = early_rest_items + early_prog_items
         if unplaced_early_items:
             logging.warning(f"Ran out of early locations for early items. Failed to place \
@@ -326,17 +326,22 @@ def distribute_items_restrictive(world: MultiWorld) -> None:
 
     if prioritylocations:
         # "priority fill"
-        fill_restrictive(world, world.state, prioritylocations, progitempool, swap=False, on_place=mark_for_locking)
-        accessibility_corrections(world, world.state, prioritylocations, progitempool)
+        with world.profiler.part("fill_restrictive"):
+            fill_restrictive(world, world.state, prioritylocations, progitempool, swap=False,
+                             on_place=mark_for_locking)
+        with world.profiler.part("accessibility_corrections"):
+            accessibility_corrections(world, world.state, prioritylocations, progitempool)
         defaultlocations = prioritylocations + defaultlocations
 
     if progitempool:
         # "progression fill"
-        fill_restrictive(world, world.state, defaultlocations, progitempool)
+        with world.profiler.part("fill_restrictive"):
+            fill_restrictive(world, world.state, defaultlocations, progitempool)
         if progitempool:
             raise FillError(
                 f'Not enough locations for progress items. There are {len(progitempool)} more items than locations')
-        accessibility_corrections(world, world.state, defaultlocations)
+        with world.profiler.part("accessibility_corrections"):
+            accessibility_corrections(world, world.state, defaultlocations)
 
     for location in lock_later:
         if location.item:
@@ -345,14 +350,16 @@ def distribute_items_restrictive(world: MultiWorld) -> None:
 
     inaccessible_location_rules(world, world.state, defaultlocations)
 
-    remaining_fill(world, excludedlocations, filleritempool)
+    with world.profiler.part("remaining_fill"):
+        remaining_fill(world, excludedlocations, filleritempool)
     if excludedlocations:
         raise FillError(
             f"Not enough filler items for excluded locations. There are {len(excludedlocations)} more locations than items")
 
     restitempool = usefulitempool + filleritempool
 
-    remaining_fill(world, defaultlocations, restitempool)
+    with world.profiler.part("remaining_fill"):
+        remaining_fill(world, defaultlocations, restitempool)
 
     unplaced = restitempool
     unfilled = defaultlocations
@@ -467,10 +474,18 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
         }
         sphere_num: int = 1
         moved_item_count: int = 0
-
-        def get_sphere_locations(sphere_state: CollectionState,
-                                 locations: typing.Set[Location]) -> typing.Set[Location]:
-            sphere_state.sweep_for_events(key_only=True, locations=locations)
+        # small keys that are collected as soon as they are reachable, see CollectionState.sweep_for_events
+        key_locations: typing.Set[Location] = {location for location in world.get_locations()
+                                               if getattr(location.item, "locked_dungeon_item", False)}
+        # Spheres after the current one, as found while looking ahead for candidate items. They stay valid until
+        # items get swapped, so later spheres and look aheads only test reachability of locations once.
+        future_spheres: typing.List[typing.Set[Location]] = []
+
+        def get_sphere_locations(sphere_state: CollectionState, locations: typing.Set[Location],
+                                 known_sphere: typing.Optional[typing.Set[Location]] = None) -> typing.Set[Location]:
+            sphere_state.sweep_for_events(key_only=True, locations=key_locations.intersection(locations))
+            if known_sphere is not None:
+                return known_sphere.copy()
             return {loc for loc in locations if sphere_state.can_reach(loc)}
 
         def item_percentage(player: int, num: int) -> float:
@@ -480,7 +495,8 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
             # Gather non-locked locations.
             # This ensures that only shuffled locations get counted for progression balancing,
             #   i.e. the items the players will be checking.
-            sphere_locations = get_sphere_locations(state, unchecked_locations)
+            sphere_locations = get_sphere_locations(state, unchecked_locations,
+                                                    future_spheres.pop(0) if future_spheres else None)
             for location in sphere_locations:
                 unchecked_locations.remove(location)
                 if not location.locked:
@@ -514,6 +530,7 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
                     balancing_unchecked_locations = unchecked_locations.copy()
                     balancing_reachables = reachable_locations_count.copy()
                     balancing_sphere = sphere_locations.copy()
+                    balancing_depth = 0
                     candidate_items: typing.Dict[int, typing.Set[Location]] = collections.defaultdict(set)
                     while True:
                         # Check locations in the current sphere and gather progression items to swap earlier
@@ -528,7 +545,13 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
                                         location.progress_type != LocationProgressType.PRIORITY):
                                     candidate_items[player].add(location)
                                     logging.debug(f"Candidate item: {location.name}, {location.item.name}")
-                        balancing_sphere = get_sphere_locations(balancing_state, balancing_unchecked_locations)
+                        if balancing_depth < len(future_spheres):
+                            balancing_sphere = get_sphere_locations(balancing_state, balancing_unchecked_locations,
+                                                                    future_spheres[balancing_depth])
+                        else:
+                            balancing_sphere = get_sphere_locations(balancing_state, balancing_unchecked_locations)
+                            future_spheres.append(balancing_sphere)
+                        balancing_depth += 1
                         for location in balancing_sphere:
                             balancing_unchecked_locations.remove(location)
                             if not location.locked:
@@ -546,30 +569,41 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
                         if l not in balancing_unchecked_locations:
                             unlocked_locations[l.player].add(l)
                     items_to_replace: typing.List[Location] = []
+                    balancing_beaten = world.has_beaten_game(balancing_state)
+
+                    def enough_items(player: int, locations: typing.Iterable[Location]) -> bool:
+                        """Returns if collecting the items at locations lets player reach its threshold,
+                        or beat the game if the look ahead did."""
+                        reducing_state = state.copy()
+                        for location in locations:
+                            reducing_state.collect(location.item, True, location)
+
+                        reducing_state.sweep_for_events(locations=unlocked_locations[player])
+
+                        if balancing_beaten:
+                            return world.has_beaten_game(reducing_state)
+                        reduced_sphere = get_sphere_locations(reducing_state, unlocked_locations[player])
+                        p = item_percentage(player, reachable_locations_count[player] + len(reduced_sphere))
+                        return p >= threshold_percentages[player]
+
                     for player in balancing_players:
-                        locations_to_test = unlocked_locations[player]
                         items_to_test = list(candidate_items[player])
                         items_to_test.sort()
                         world.random.shuffle(items_to_test)
+                        kept_items: typing.List[Location] = []
+                        # Each tested item is kept if the others are not enough without it. As logic only gets
+                        # easier with more items, dropping a batch of items that are not needed together
+                        # takes the same decisions, so batches grow while items turn out to be unneeded.
+                        batch_size = 1
                         while items_to_test:
-                            testing = items_to_test.pop()
-                            reducing_state = state.copy()
-                            for location in itertools.chain((
-                                l for l in items_to_replace
-                                if l.item.player == player
-                            ), items_to_test):
-                                reducing_state.collect(location.item, True, location)
-
-                            reducing_state.sweep_for_events(locations=locations_to_test)
-
-                            if world.has_beaten_game(balancing_state):
-                                if not world.has_beaten_game(reducing_state):
-                                    items_to_replace.append(testing)
+                            if enough_items(player, kept_items + items_to_test[:-batch_size]):
+                                del items_to_test[-batch_size:]
+                                batch_size *= 2
+                            elif batch_size == 1:
+                                kept_items.append(items_to_test.pop())
                             else:
-                                reduced_sphere = get_sphere_locations(reducing_state, locations_to_test)
-                                p = item_percentage(player, reachable_locations_count[player] + len(reduced_sphere))
-                                if p < threshold_percentages[player]:
-                                    items_to_replace.append(testing)
+                                batch_size //= 2
+                        items_to_replace += kept_items
 
                     replaced_items = False
 
@@ -599,6 +633,9 @@ def balance_multiworld_progression(world: MultiWorld) -> None:
 
                     if replaced_items:
                         logging.debug(f"Moved {moved_item_count} items so far\n")
+                        future_spheres.clear()
+                        key_locations = {location for location in world.get_locations()
+                                         if getattr(location.item, "locked_dungeon_item", False)}
                         unlocked = {fresh for player in balancing_players for fresh in unlocked_locations[player]}
                         for location in get_sphere_locations(state, unlocked):
                             unchecked_locations.remove(location)
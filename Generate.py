@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import logging
+import multiprocessing
 import random
+import tempfile
+import time
 import urllib.request
 import urllib.parse
-from typing import Set, Dict, Tuple, Callable, Any, Union
+from typing import Set, Dict, Tuple, Callable, Any, Union, List, NamedTuple, Optional
 import os
 from collections import Counter, ChainMap
 import string
@@ -66,7 +70,7 @@ class PlandoSettings(enum.IntFlag):
         return "Off"
 
 
-def mystery_argparse():
+def mystery_argparse(argv: Optional[List[str]] = None):
     options = get_options()
     defaults = options["generator"]
 
@@ -92,7 +96,16 @@ def mystery_argparse():
                         help='Output rolled mystery results to yaml up to specified number (made for async multiworld)')
     parser.add_argument('--plando', default=defaults["plando_options"],
                         help='List of options that can be set manually. Can be combined, for example "bosses, items"')
-    args = parser.parse_args()
+    parser.add_argument('--profile', action='store_true',
+                        help='Write wall and cpu time of each generation stage and game, and the process peak memory '
+                             'after each stage, to a json file next to the output.')
+    parser.add_argument('--cprofile', action='store_true',
+                        help='Dump a cProfile of each generation stage next to the output.')
+    parser.add_argument('--seeds', default=1, type=lambda value: max(int(value), 1),
+                        help='Number of seeds to generate from the same player files, each with its own seed number.')
+    parser.add_argument('--workers', default=0, type=lambda value: max(int(value), 0),
+                        help='Number of processes generating in parallel for --seeds, 0 uses one per cpu core.')
+    args = parser.parse_args(argv)
     if not os.path.isabs(args.weights_file_path):
         args.weights_file_path = os.path.join(args.player_files_path, args.weights_file_path)
     if not os.path.isabs(args.meta_file_path):
@@ -105,9 +118,11 @@ def get_seed_name(random_source) -> str:
     return f"{random_source.randint(0, pow(10, seeddigits) - 1)}".zfill(seeddigits)
 
 
-def main(args=None, callback=ERmain):
+def main(args=None, callback=ERmain, log_folder: Optional[str] = None):
     if not args:
         args, options = mystery_argparse()
+    else:
+        options = get_options()
 
     seed = get_seed(args.seed)
     random.seed(seed)
@@ -175,8 +190,10 @@ def main(args=None, callback=ERmain):
     erargs.race = args.race
     erargs.outputname = seed_name
     erargs.outputpath = args.outputpath
+    erargs.profile = args.profile
+    erargs.cprofile = args.cprofile
 
-    Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level)
+    Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level, log_folder=log_folder)
 
     settings_cache: Dict[str, Tuple[argparse.Namespace, ...]] = \
         {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.samesettings else None)
@@ -258,7 +275,66 @@ def main(args=None, callback=ERmain):
         with open(os.path.join(args.outputpath if args.outputpath else ".", f"generate_{seed_name}.yaml"), "wt") as f:
             yaml.dump(important, f)
 
-    callback(erargs, seed)
+    return callback(erargs, seed)
+
+
+class GenerationResult(NamedTuple):
+    seed: int
+    success: bool
+    total_time: float
+    stage_times: Dict[str, float]
+    output: str  # path of the output archive, or the error on failure
+
+
+def generate_seed(args: argparse.Namespace, seed: int, log_folder: Optional[str] = None) -> GenerationResult:
+    """Runs one generation of a --seeds batch, catching errors so the batch can continue."""
+    args = copy.copy(args)
+    args.seed = seed
+    start = time.perf_counter()
+    try:
+        multiworld = main(args, log_folder=log_folder)
+    except Exception as e:
+        logging.exception(f"Generation of seed {seed} failed.")
+        return GenerationResult(seed, False, time.perf_counter() - start, {}, f"{e.__class__.__name__}: {e}")
+    return GenerationResult(seed, True, time.perf_counter() - start, multiworld.profiler.stage_times,
+                            Utils.output_path(f"AP_{multiworld.seed_name}.zip"))
+
+
+def generate_seeds(args: argparse.Namespace) -> List[GenerationResult]:
+    """Generates args.seeds seeds in a process pool. Worlds are imported by now, so forked workers share them."""
+    if args.seed is None:
+        seeds: Set[int] = set()
+        while len(seeds) < args.seeds:
+            seeds.add(get_seed())
+        seeds: List[int] = sorted(seeds)
+    else:
+        seeds = [args.seed + offset for offset in range(args.seeds)]
+    workers = min(args.workers or os.cpu_count() or 1, len(seeds))
+    # fork keeps the imported worlds, other start methods have to import them again in each worker
+    context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+    # a log per seed would flood the logs folder, they go to a temporary folder instead
+    log_folder = tempfile.mkdtemp(prefix="AP_logs_")
+    print(f"Generating {len(seeds)} seeds with {workers} worker{'s' if workers > 1 else ''}, logging to {log_folder}.")
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as pool:
+        return list(pool.map(generate_seed, [args] * len(seeds), seeds, [log_folder] * len(seeds)))
+
+
+def format_results(results: List[GenerationResult]) -> str:
+    stages: List[str] = []
+    for result in results:
+        for stage in result.stage_times:
+            if stage not in stages:
+                stages.append(stage)
+    header = ["Seed", "Result", *stages, "Total", "Output"]
+    rows = [[str(result.seed), "ok" if result.success else "FAILED",
+             *(f"{result.stage_times[stage]:.2f}" if stage in result.stage_times else "-" for stage in stages),
+             f"{result.total_time:.2f}", result.output] for result in results]
+    widths = [max(len(row[column]) for row in [header] + rows) for column in range(len(header) - 1)]
+    lines = ["  ".join(text.ljust(width) for text, width in zip(row, widths)) + "  " + row[-1]
+             for row in [header] + rows]
+    successes = sum(result.success for result in results)
+    lines.append(f"{successes} of {len(results)} seeds generated successfully.")
+    return "\n".join(lines)
 
 
 def read_weights_yamls(path) -> Tuple[Any, ...]:
@@ -674,6 +750,10 @@ def roll_alttp_settings(ret: argparse.Namespace, weights, plando_options):
 if __name__ == '__main__':
     import atexit
     confirmation = atexit.register(input, "Press enter to close.")
-    main()
+    mystery_args, _ = mystery_argparse()
+    if mystery_args.seeds > 1:
+        print(format_results(generate_seeds(mystery_args)))
+    else:
+        main(mystery_args)
     # in case of error-free exit should not need confirmation
     atexit.unregister(confirmation)
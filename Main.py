@@ -3,9 +3,7 @@ from itertools import zip_longest, chain
 import logging
 import os
 import time
-import zlib
 import concurrent.futures
-import pickle
 import tempfile
 import zipfile
 from typing import Dict, List, Tuple, Optional, Set
@@ -15,6 +13,7 @@ from worlds.alttp.Items import item_name_groups
 from worlds.alttp.Regions import is_main_entrance
 from Fill import distribute_items_restrictive, flood_items, balance_multiworld_progression, distribute_planned
 from worlds.alttp.Shops import SHOP_ID_START, total_shop_slots, FillDisabledShopSlots
+import Utils
 from Utils import output_path, get_options, __version__, version_tuple
 from worlds.generic.Rules import locality_rules, exclusion_rules
 from worlds import AutoWorld
@@ -39,6 +38,9 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
     logger = logging.getLogger()
     world.set_seed(seed, args.race, str(args.outputname if args.outputname else world.seed))
+    if args.cprofile:
+        world.profiler = Utils.StageProfiler(output_path(f"AP_{world.seed_name}"))
+    stage_done = world.profiler.stage_done
 
     world.shuffle = args.shuffle.copy()
     world.logic = args.logic.copy()
@@ -106,8 +108,10 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     del item_digits, location_digits, item_count, location_count
 
     AutoWorld.call_stage(world, "assert_generate")
+    stage_done("setup")
 
     AutoWorld.call_all(world, "generate_early")
+    stage_done("generate_early")
 
     logger.info('')
 
@@ -131,9 +135,11 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
 
     logger.info('Creating World.')
     AutoWorld.call_all(world, "create_regions")
+    stage_done("create_regions")
 
     logger.info('Creating Items.')
     AutoWorld.call_all(world, "create_items")
+    stage_done("create_items")
 
     logger.info('Calculating Access Rules.')
     if world.players > 1:
@@ -149,8 +155,10 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
         world.priority_locations[player].value -= world.exclude_locations[player].value
         for location_name in world.priority_locations[player].value:
             world.get_location(location_name, player).progress_type = LocationProgressType.PRIORITY
+    stage_done("set_rules")
 
     AutoWorld.call_all(world, "generate_basic")
+    stage_done("generate_basic")
 
     # temporary home for item links, should be moved out of Main
     for group_id, group in world.groups.items():
@@ -228,14 +236,17 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
     if any(world.item_links.values()):
         world._recache()
         world._all_state = None
+    stage_done("item_links")
 
     logger.info("Running Item Plando")
 
     distribute_planned(world)
+    stage_done("plando")
 
     logger.info('Running Pre Main Fill.')
 
     AutoWorld.call_all(world, "pre_fill")
+    stage_done("pre_fill")
 
     logger.info(f'Filling the world with {len(world.itempool)} items.')
 
@@ -243,19 +254,29 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
         flood_items(world)  # different algo, biased towards early game progress items
     elif world.algorithm == 'balanced':
         distribute_items_restrictive(world)
+    stage_done("fill")
 
     AutoWorld.call_all(world, 'post_fill')
+    stage_done("post_fill")
 
     if world.players > 1:
         balance_multiworld_progression(world)
+    stage_done("balancing")
 
     logger.info(f'Beginning output...')
     outfilebase = 'AP_' + world.seed_name
 
+    # sweep the spheres once for the accessibility check, world outputs and the playthrough to share
+    world.get_sphere_model()
+
     output = tempfile.TemporaryDirectory()
     with output as temp_dir:
         with concurrent.futures.ThreadPoolExecutor(world.players + 2) as pool:
-            check_accessibility_task = pool.submit(world.fulfills_accessibility)
+            def check_accessibility() -> bool:
+                with world.profiler.part("accessibility"):
+                    return world.fulfills_accessibility()
+
+            check_accessibility_task = pool.submit(check_accessibility)
 
             output_file_futures = [pool.submit(AutoWorld.call_stage, world, "generate_output", temp_dir)]
             for player in world.player_ids:
@@ -394,10 +415,9 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                 }
                 AutoWorld.call_all(world, "modify_multidata", multidata)
 
-                multidata = zlib.compress(pickle.dumps(multidata), 9)
+                multidata = NetUtils.encode_multidata(multidata)
 
                 with open(os.path.join(temp_dir, f'{outfilebase}.archipelago'), 'wb') as f:
-                    f.write(bytes([3]))  # version of format
                     f.write(multidata)
 
             multidata_task = pool.submit(write_multidata)
@@ -413,13 +433,16 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                 if i % 10 == 0 or i == len(output_file_futures):
                     logger.info(f'Generating output files ({i}/{len(output_file_futures)}).')
                 future.result()
+        stage_done("output")
 
         if args.spoiler > 1:
             logger.info('Calculating playthrough.')
             create_playthrough(world)
+            stage_done("playthrough")
 
         if args.spoiler:
             world.spoiler.to_file(os.path.join(temp_dir, '%s_Spoiler.txt' % outfilebase))
+            stage_done("spoiler")
 
         zipfilename = output_path(f"AP_{world.seed_name}.zip")
         logger.info(f"Creating final archive at {zipfilename}")
@@ -427,6 +450,10 @@ def main(args, seed=None, baked_server_options: Optional[Dict[str, object]] = No
                              compresslevel=9) as zf:
             for file in os.scandir(temp_dir):
                 zf.write(file.path, arcname=file.name)
+    stage_done("archive")
+    if args.profile:
+        world.profiler.to_file(output_path(f"AP_{world.seed_name}_Profile.json"))
+    logger.info("Generation stages:\n%s", world.profiler.summary())
 
     logger.info('Done. Enjoy. Total Time: %s', time.perf_counter() - start)
     return world
@@ -436,6 +463,7 @@ def create_playthrough(world):
     """Destructive to the world while it is run, damage gets repaired afterwards."""
     # get locations containing progress items
     prog_locations = {location for location in world.get_filled_locations() if location.item.advancement}
+    location_spheres = world.get_sphere_model().location_spheres
     state_cache = [None]
     collection_spheres = []
     state = CollectionState(world)
@@ -446,7 +474,8 @@ def create_playthrough(world):
         # build up spheres of collection radius.
         # Everything in each sphere is independent from each other in dependencies and only depends on lower spheres
 
-        sphere = {location for location in sphere_candidates if state.can_reach(location)}
+        sphere = {location for location in sphere_candidates
+                  if location_spheres.get(location) == len(collection_spheres)}
 
         for location in sphere:
             state.collect(location.item, True, location)
@@ -471,25 +500,49 @@ def create_playthrough(world):
     # in the second phase, we cull each sphere such that the game is still beatable,
     # reducing each range of influence to the bare minimum required inside it
     restore_later = {}
-    for num, sphere in reversed(tuple(enumerate(collection_spheres))):
-        to_delete = set()
-        for location in sphere:
-            # we remove the item at location and check if game is still beatable
-            logging.debug('Checking if %s (Player %d) is required to beat the game.', location.item.name,
-                          location.item.player)
-            old_item = location.item
+
+    def cull(locations: List[Location], state: Optional[CollectionState]) -> bool:
+        """Removes the items at locations if the game is beatable without all of them, returns if they got removed.
+        As logic can only get easier with more items, this takes the same decisions as checking one at a time."""
+        logging.debug('Checking if %s are required to beat the game.',
+                      ', '.join(f'{location.item.name} (Player {location.item.player})' for location in locations))
+        old_items = [location.item for location in locations]
+        for location in locations:
             location.item = None
-            if world.can_beat_game(state_cache[num]):
-                to_delete.add(location)
-                restore_later[location] = old_item
+        if world.can_beat_game(state):
+            restore_later.update(zip(locations, old_items))
+            return True
+        # still required, got to keep them around
+        for location, old_item in zip(locations, old_items):
+            location.item = old_item
+        return False
+
+    def cull_split(locations: List[Location], state: Optional[CollectionState], required: bool = False) -> None:
+        """Culls locations by halving them, required tells that at least one of them can't be removed."""
+        if not required and cull(locations, state) or len(locations) == 1:
+            return
+        half = len(locations) // 2
+        cull_split(locations[:half], state)
+        # if all of the first half got removed, the required item has to be in the second half
+        cull_split(locations[half:], state, all(location.item is None for location in locations[:half]))
+
+    for num, sphere in reversed(tuple(enumerate(collection_spheres))):
+        # grow batches while items turn out to be unneeded, so large spoilers need far fewer beatable checks
+        candidates = list(sphere)
+        batch_size = 1
+        while candidates:
+            batch, candidates = candidates[:batch_size], candidates[batch_size:]
+            if cull(batch, state_cache[num]):
+                batch_size *= 2
             else:
-                # still required, got to keep it around
-                location.item = old_item
+                cull_split(batch, state_cache[num], required=True)
+                batch_size = max(1, batch_size // 2)
 
         # cull entries in spheres for spoiler walkthrough at end
-        sphere -= to_delete
+        sphere.difference_update(restore_later)
 
     # second phase, sphere 0
+    world.clear_sphere_cache()
     removed_precollected = []
     for item in (i for i in chain.from_iterable(world.precollected_items.values()) if i.advancement):
         logging.debug('Checking if %s (Player %d) is required to beat the game.', item.name, item.player)
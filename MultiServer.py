@@ -101,6 +101,51 @@ class Client(Endpoint):
 team_slot = typing.Tuple[int, int]
 
 
+def encode_save_record(record: dict) -> bytes:
+    return zlib.compress(pickle.dumps(record))
+
+
+def read_save_journal(journal: bytes) -> typing.List[bytes]:
+    """Splits a save journal file into its encoded records, dropping an incomplete last one from an interrupted write."""
+    records = []
+    position = 0
+    while position + 4 <= len(journal):
+        size = int.from_bytes(journal[position:position + 4], "little")
+        record = journal[position + 4:position + 4 + size]
+        if len(record) < size:
+            break
+        records.append(record)
+        position += 4 + size
+    return records
+
+
+def apply_save_record(save: dict, record: dict):
+    """Applies a record of Context.get_save_record to the save it was recorded after."""
+    for part, value in record.items():
+        if part == "received_items":
+            for key, items in value.items():
+                save[part].setdefault(key, []).extend(items)
+        elif part == "location_checks":
+            for key, checks in value.items():
+                save[part].setdefault(key, set()).update(checks)
+        elif part in {"hints", "stored_data"}:
+            save.setdefault(part, {}).update(value)
+        elif part in {"client_activity_timers", "client_connection_timers"}:
+            save[part] = tuple({**dict(save[part]), **value}.items())
+        else:
+            save[part] = value
+
+
+def restore_save(save: dict, records: typing.Iterable[bytes]) -> dict:
+    """Applies encoded save records to the snapshot they were written after,
+    skipping records left over from an earlier snapshot."""
+    for data in records:
+        record = restricted_loads(zlib.decompress(data))
+        if record["save_generation"] == save.get("save_generation", 0):
+            apply_save_record(save, record)
+    return save
+
+
 class Context:
     dumper = staticmethod(encode)
     loader = staticmethod(decode)
@@ -117,10 +162,22 @@ class Context:
     # team -> slot id -> list of clients authenticated to slot.
     clients: typing.Dict[int, typing.Dict[int, typing.List[Client]]]
     locations: typing.Dict[int, typing.Dict[int, typing.Tuple[int, int, int]]]
+    # receiving slot -> (finding slot, location id) of each item for it, built from locations on load
+    receiving_locations: typing.Dict[int, typing.List[typing.Tuple[int, int]]]
+    # (receiving slot, item id) -> (finding slot, location id) of each copy of that item
+    item_locations: typing.Dict[typing.Tuple[int, int], typing.List[typing.Tuple[int, int]]]
     groups: typing.Dict[int, typing.Set[int]]
     save_version = 2
     stored_data: typing.Dict[str, object]
     stored_data_notification_clients: typing.Dict[str, typing.Set[Client]]
+    stored_data_changes: typing.Set[str]  # keys set since the last save
+    # saves are written as a snapshot followed by records of what changed since, see _write_save
+    save_generation: int  # counts snapshots, so records can be matched to theirs
+    save_snapshot_size: typing.Optional[int]  # None if the next save has to be a snapshot
+    save_journal_size: int
+    # parts of get_save that records only hold what got added to, or the changed keys of
+    journaled_save_parts = {"received_items", "location_checks", "hints", "stored_data",
+                            "client_activity_timers", "client_connection_timers"}
 
     item_names: typing.Dict[int, str] = Utils.KeyedDefaultDict(lambda code: f'Unknown item (ID:{code})')
     location_names: typing.Dict[int, str] = Utils.KeyedDefaultDict(lambda code: f'Unknown location (ID:{code})')
@@ -137,6 +194,12 @@ class Context:
         self.log_network = log_network
         self.endpoints = []
         self.clients = {}
+        self.outbound_msgs: typing.Dict[Endpoint, typing.List[str]] = {}
+        # endpoints whose queued frame someone awaits being sent, set to whether it was
+        self.outbound_sent: typing.Dict[Endpoint, asyncio.Future] = {}
+        self.outbound_scheduled = False
+        self.frames_queued = 0  # frames that would have been sent without coalescing
+        self.frames_sent = 0
         self.compatibility: int = compatibility
         self.shutdown_task = None
         self.data_filename = None
@@ -150,6 +213,8 @@ class Context:
         self.remote_start_inventory = set()
         #                          player          location_id     item_id  target_player_id
         self.locations = {}
+        self.receiving_locations = {}
+        self.item_locations = {}
         self.host = host
         self.port = port
         self.server_password = server_password
@@ -160,6 +225,7 @@ class Context:
         self.start_inventory = {}
         self.name_aliases: typing.Dict[team_slot, str] = {}
         self.location_checks = collections.defaultdict(set)
+        self.new_items_recipients: typing.Set[team_slot] = set()  # got items that send_new_items has yet to send
         self.hint_cost = hint_cost
         self.location_check_points = location_check_points
         self.hints_used = collections.defaultdict(int)
@@ -191,9 +257,20 @@ class Context:
         self.random = random.Random()
         self.stored_data = {}
         self.stored_data_notification_clients = collections.defaultdict(weakref.WeakSet)
+        self.stored_data_changes = set()
+        self.save_generation = 0
+        self.save_snapshot_size = None
+        self.save_journal_size = 0
+        self._saved_received_items: typing.Dict[typing.Tuple[int, int, bool], int] = {}
+        self._saved_location_checks: typing.Dict[team_slot, typing.Set[int]] = {}
+        self._saved_hints: typing.Dict[team_slot, typing.Set[NetUtils.Hint]] = {}
+        self._saved_timers: typing.Dict[str, typing.Dict[team_slot, float]] = {}
+        self._saved_parts: typing.Dict[str, bytes] = {}
 
         # init empty to satisfy linter, I suppose
         self.gamespackage = {}
+        self.encoded_game_packages: typing.Dict[typing.Tuple[str, int], str] = {}
+        self.datapackage_msgs: typing.Dict[typing.Tuple[typing.Tuple[str, int], ...], str] = {}
         self.item_name_groups = {}
         self.all_item_and_group_names = {}
         self.forced_auto_forfeits = collections.defaultdict(lambda: False)
@@ -222,6 +299,25 @@ class Context:
             self.all_item_and_group_names[game_name] = \
                 set(game_package["item_name_to_id"]) | set(self.item_name_groups[game_name])
 
+    def get_datapackage_msg(self, games: typing.Iterable[str]) -> str:
+        """Returns the encoded DataPackage message with those games,
+        cached per list of games and their versions, along with each game's encoded data."""
+        key = tuple((game, self.gamespackage[game]["version"]) for game in games)
+        msg = self.datapackage_msgs.get(key)
+        if msg is None:
+            encoded_games = []
+            for game, version in key:
+                encoded_game = self.encoded_game_packages.get((game, version))
+                if encoded_game is None:
+                    encoded_game = self.dumper(game) + ":" + self.dumper(self.gamespackage[game])
+                    self.encoded_game_packages[game, version] = encoded_game
+                encoded_games.append(encoded_game)
+            msg = '[{"cmd":"DataPackage","data":{"games":{' + ",".join(encoded_games) + '}}}]'
+            if len(self.datapackage_msgs) >= 64:  # clients can ask for any combination of games
+                self.datapackage_msgs.clear()
+            self.datapackage_msgs[key] = msg
+        return msg
+
     def item_names_for_game(self, game: str) -> typing.Optional[typing.Dict[str, int]]:
         return self.gamespackage[game]["item_name_to_id"] if game in self.gamespackage else None
 
@@ -229,60 +325,96 @@ class Context:
         return self.gamespackage[game]["location_name_to_id"] if game in self.gamespackage else None
 
     # General networking
-    async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
-        if not endpoint.socket or not endpoint.socket.open:
-            return False
-        msg = self.dumper(msgs)
+    # Everything sent within one iteration of the event loop is queued up per endpoint and then goes out as one frame,
+    # in the order it was queued. Each queued entry is an encoded list of messages, so a broadcast is encoded once.
+    def queue_encoded_msgs(self, endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
+        queued = False
+        for endpoint in endpoints:
+            if endpoint.socket and endpoint.socket.open:
+                self.outbound_msgs.setdefault(endpoint, []).append(msg)
+                self.frames_queued += 1
+                queued = True
+        if queued and not self.outbound_scheduled:
+            self.outbound_scheduled = True
+            asyncio.get_running_loop().call_soon(self.send_queued_msgs)
+        return queued
+
+    def send_queued_msgs(self):
+        self.outbound_scheduled = False
+        outbound_msgs, self.outbound_msgs = self.outbound_msgs, {}
+        outbound_sent, self.outbound_sent = self.outbound_sent, {}
+        # endpoints that got queued the same messages, like a team that only got broadcasts, share their frame
+        frames: typing.Dict[typing.Tuple[int, ...], typing.Tuple[typing.List[str], typing.List[Endpoint]]] = {}
+        for endpoint, msgs in outbound_msgs.items():
+            frames.setdefault(tuple(map(id, msgs)), (msgs, []))[1].append(endpoint)
+        for msgs, endpoints in frames.values():
+            if len(msgs) == 1:
+                msg = msgs[0]
+            else:
+                # join the encoded lists into one, skipping empty ones
+                msg = "[" + ",".join(part[1:-1] for part in msgs if len(part) > 2) + "]"
+            if len(endpoints) == 1:
+                async_start(self.send_frame(endpoints[0], msg, outbound_sent.get(endpoints[0])))
+                continue
+            try:
+                websockets.broadcast([endpoint.socket for endpoint in endpoints], msg)
+            except RuntimeError:
+                logging.exception("Exception during send_queued_msgs")
+                sent = False
+            else:
+                self.frames_sent += len(endpoints)
+                if self.log_network:
+                    logging.info(f"Outgoing broadcast: {msg}")
+                sent = True
+            for endpoint in endpoints:
+                if endpoint in outbound_sent:
+                    outbound_sent[endpoint].set_result(sent)
+
+    async def send_frame(self, endpoint: Endpoint, msg: str, sent: typing.Optional[asyncio.Future] = None):
         try:
             await endpoint.socket.send(msg)
         except websockets.ConnectionClosed:
-            logging.exception(f"Exception during send_msgs, could not send {msg}")
+            logging.exception(f"Exception during send_frame, could not send {msg}")
             await self.disconnect(endpoint)
+            if sent:
+                sent.set_result(False)
         else:
+            self.frames_sent += 1
             if self.log_network:
                 logging.info(f"Outgoing message: {msg}")
-            return True
+            if sent:
+                sent.set_result(True)
+
+    def queue_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
+        return self.queue_encoded_msgs((endpoint,), self.dumper(msgs))
+
+    async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
+        return await self.send_encoded_msgs(endpoint, self.dumper(msgs))
 
     async def send_encoded_msgs(self, endpoint: Endpoint, msg: str) -> bool:
-        if not endpoint.socket or not endpoint.socket.open:
+        """Queue msg and wait until the frame containing it was written to endpoint."""
+        if not self.queue_encoded_msgs((endpoint,), msg):
             return False
-        try:
-            await endpoint.socket.send(msg)
-        except websockets.ConnectionClosed:
-            logging.exception("Exception during send_encoded_msgs")
-            await self.disconnect(endpoint)
-        else:
-            if self.log_network:
-                logging.info(f"Outgoing message: {msg}")
-            return True
+        if endpoint not in self.outbound_sent:
+            self.outbound_sent[endpoint] = asyncio.get_running_loop().create_future()
+        return await self.outbound_sent[endpoint]
 
     async def broadcast_send_encoded_msgs(self, endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
-        sockets = []
-        for endpoint in endpoints:
-            if endpoint.socket and endpoint.socket.open:
-                sockets.append(endpoint.socket)
-        try:
-            websockets.broadcast(sockets, msg)
-        except RuntimeError:
-            logging.exception("Exception during broadcast_send_encoded_msgs")
-        else:
-            if self.log_network:
-                logging.info(f"Outgoing broadcast: {msg}")
-            return True
+        return self.queue_encoded_msgs(endpoints, msg)
 
     def broadcast_all(self, msgs: typing.List[dict]):
         msgs = self.dumper(msgs)
         endpoints = (endpoint for endpoint in self.endpoints if endpoint.auth)
-        async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
+        self.queue_encoded_msgs(endpoints, msgs)
 
     def broadcast_team(self, team: int, msgs: typing.List[dict]):
         msgs = self.dumper(msgs)
         endpoints = (endpoint for endpoint in itertools.chain.from_iterable(self.clients[team].values()))
-        async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
+        self.queue_encoded_msgs(endpoints, msgs)
 
     def broadcast(self, endpoints: typing.Iterable[Client], msgs: typing.List[dict]):
         msgs = self.dumper(msgs)
-        async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
+        self.queue_encoded_msgs(endpoints, msgs)
 
     async def disconnect(self, endpoint: Client):
         if endpoint in self.endpoints:
@@ -302,18 +434,18 @@ class Context:
             return
         logging.info("Notice (Player %s in team %d): %s" % (client.name, client.team + 1, text))
         if client.version >= print_command_compatability_threshold:
-            async_start(self.send_msgs(client, [{"cmd": "PrintJSON", "data": [{ "text": text }]}]))
+            self.queue_msgs(client, [{"cmd": "PrintJSON", "data": [{ "text": text }]}])
         else:
-            async_start(self.send_msgs(client, [{"cmd": "Print", "text": text}]))
+            self.queue_msgs(client, [{"cmd": "Print", "text": text}])
 
     def notify_client_multiple(self, client: Client, texts: typing.List[str]):
         if not client.auth:
             return
         if client.version >= print_command_compatability_threshold:
-            async_start(self.send_msgs(client, 
-                [{"cmd": "PrintJSON", "data": [{ "text": text }]} for text in texts]))
+            self.queue_msgs(client, 
+                [{"cmd": "PrintJSON", "data": [{ "text": text }]} for text in texts])
         else:
-            async_start(self.send_msgs(client, [{"cmd": "Print", "text": text} for text in texts]))
+            self.queue_msgs(client, [{"cmd": "Print", "text": text} for text in texts])
 
     # loading
 
@@ -328,6 +460,8 @@ class Context:
                 else:
                     raise Exception("No .archipelago found in archive.")
         else:
+            # format 4 sections still only get decoded once they're needed,
+            # reading the whole file keeps it from being held open, and locked on Windows, while the server runs
             with open(multidatapath, 'rb') as f:
                 data = f.read()
 
@@ -335,13 +469,15 @@ class Context:
         self.data_filename = multidatapath
 
     @staticmethod
-    def decompress(data: bytes) -> dict:
+    def decompress(data: bytes) -> typing.Mapping[str, typing.Any]:
         format_version = data[0]
-        if format_version > 3:
+        if format_version > 4:
             raise Utils.VersionException("Incompatible multidata.")
+        if format_version == 4:
+            return NetUtils.decode_multidata(data)
         return restricted_loads(zlib.decompress(data[1:]))
 
-    def _load(self, decoded_obj: dict, use_embedded_server_options: bool):
+    def _load(self, decoded_obj: typing.Mapping[str, typing.Any], use_embedded_server_options: bool):
 
         mdata_ver = decoded_obj["minimum_versions"]["server"]
         if mdata_ver > Utils.version_tuple:
@@ -396,6 +532,7 @@ class Context:
                 for location, item_data in locations.items():
                     if len(item_data) < 3:
                         locations[location] = (*item_data, 0)
+        self._index_locations()
         # declare slots that aren't players as done
         for slot, slot_info in self.slot_info.items():
             if slot_info.type.always_goal:
@@ -406,6 +543,14 @@ class Context:
             server_options = decoded_obj.get("server_options", {})
             self._set_options(server_options)
 
+    def _index_locations(self):
+        self.receiving_locations = {}
+        self.item_locations = {}
+        for finding_slot, locations in self.locations.items():
+            for location_id, (item_id, receiving_slot, _) in locations.items():
+                self.receiving_locations.setdefault(receiving_slot, []).append((finding_slot, location_id))
+                self.item_locations.setdefault((receiving_slot, item_id), []).append((finding_slot, location_id))
+
     # saving
 
     def save(self, now=False) -> bool:
@@ -421,15 +566,53 @@ class Context:
 
     def _save(self, exit_save: bool = False) -> bool:
         try:
-            encoded_save = pickle.dumps(self.get_save())
-            with open(self.save_filename, "wb") as f:
-                f.write(zlib.compress(encoded_save))
+            self._write_save(exit_save)
         except Exception as e:
             logging.exception(e)
             return False
         else:
             return True
 
+    def _write_save(self, exit_save: bool = False) -> dict:
+        """Appends a record of what changed since the last save, or writes a new snapshot on exit
+        and once the records since the last snapshot add up to its size. Returns the save it was made from."""
+        try:
+            # taken before the save gets made, so keys set while saving are recorded by the next save
+            stored_data_changes, self.stored_data_changes = self.stored_data_changes, set()
+            if exit_save or self.save_snapshot_size is None or self.save_journal_size > self.save_snapshot_size:
+                self.save_generation += 1
+                save = self.get_save()
+                self._set_save_baseline(save, self._store_save_snapshot(save))
+            else:
+                save = self.get_save()
+                record = self.get_save_record(save, stored_data_changes)
+                if len(record) > 1:
+                    self.save_journal_size += self._store_save_record(record)
+        except BaseException:
+            # changes may not have been written, so the next save has to be a full one
+            self.save_snapshot_size = None
+            raise
+        return save
+
+    def _store_save_snapshot(self, save: dict) -> int:
+        """Replaces the saved snapshot and its records, returns the size of the snapshot."""
+        import os
+        data = zlib.compress(pickle.dumps(save))
+        with open(self.save_filename + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(self.save_filename + ".tmp", self.save_filename)
+        with open(self.save_filename + ".journal", "wb"):
+            pass
+        return len(data)
+
+    def _store_save_record(self, record: dict) -> int:
+        """Appends a record to the saved snapshot, returns the size of the record."""
+        data = encode_save_record(record)
+        data = len(data).to_bytes(4, "little") + data
+        with open(self.save_filename + ".journal", "ab") as f:
+            f.write(data)
+        return len(data)
+
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
@@ -440,8 +623,18 @@ class Context:
                     else self.data_filename + '_' + 'apsave'
             try:
                 with open(self.save_filename, 'rb') as f:
-                    save_data = restricted_loads(zlib.decompress(f.read()))
-                    self.set_save(save_data)
+                    snapshot = f.read()
+                try:
+                    with open(self.save_filename + ".journal", 'rb') as f:
+                        journal = f.read()
+                except FileNotFoundError:
+                    journal = b""
+                records = read_save_journal(journal)
+                self.set_save(restore_save(restricted_loads(zlib.decompress(snapshot)), records))
+                self._set_save_baseline(self.get_save(), len(snapshot), len(journal))
+                if sum(len(record) + 4 for record in records) != len(journal):
+                    # an interrupted write left an incomplete record, which the next snapshot drops
+                    self.save_snapshot_size = None
             except FileNotFoundError:
                 logging.error('No save data found, starting a new game')
             except Exception as e:
@@ -474,19 +667,22 @@ class Context:
         d = {
             "version": self.save_version,
             "connect_names": self.connect_names,
-            "received_items": self.received_items,
+            # copies, as this may run on the saver thread while the event loop changes the originals,
+            # which would make the save differ from what _set_save_baseline remembers of it
+            "received_items": {key: list(items) for key, items in list(self.received_items.items())},
             "hints_used": dict(self.hints_used),
-            "hints": dict(self.hints),
-            "location_checks": dict(self.location_checks),
-            "name_aliases": self.name_aliases,
+            "hints": {key: set(hints) for key, hints in list(self.hints.items())},
+            "location_checks": {key: set(checks) for key, checks in list(self.location_checks.items())},
+            "name_aliases": dict(self.name_aliases),
             "client_game_state": dict(self.client_game_state),
             "client_activity_timers": tuple(
-                (key, value.timestamp()) for key, value in self.client_activity_timers.items()),
+                (key, value.timestamp()) for key, value in list(self.client_activity_timers.items())),
             "client_connection_timers": tuple(
-                (key, value.timestamp()) for key, value in self.client_connection_timers.items()),
+                (key, value.timestamp()) for key, value in list(self.client_connection_timers.items())),
             "random_state": self.random.getstate(),
-            "group_collected": dict(self.group_collected),
-            "stored_data": self.stored_data,
+            "group_collected": {key: set(collected) for key, collected in list(self.group_collected.items())},
+            "stored_data": dict(self.stored_data),
+            "save_generation": self.save_generation,
             "game_options": {"hint_cost": self.hint_cost, "location_check_points": self.location_check_points,
                              "server_password": self.server_password, "password": self.password, "forfeit_mode":
                              self.forfeit_mode, "remaining_mode": self.remaining_mode, "collect_mode":
@@ -496,6 +692,63 @@ class Context:
 
         return d
 
+    def get_save_record(self, save: typing.Optional[dict] = None,
+                        stored_data_changes: typing.Optional[typing.Set[str]] = None) -> dict:
+        """Returns what changed in get_save since the last save, to be applied with apply_save_record.
+        save is the result of get_save, if already made, and stored_data_changes the keys set before it was."""
+        if stored_data_changes is None:
+            stored_data_changes, self.stored_data_changes = self.stored_data_changes, set()
+        if save is None:
+            save = self.get_save()
+        record = {"save_generation": self.save_generation}
+        received_items = {}
+        for key, items in save["received_items"].items():
+            saved_count = self._saved_received_items.get(key, 0)
+            new_items = items[saved_count:]
+            if new_items:
+                received_items[key] = new_items
+                self._saved_received_items[key] = saved_count + len(new_items)
+        location_checks = {}
+        for key, checks in save["location_checks"].items():
+            saved_checks = self._saved_location_checks.setdefault(key, set())
+            if len(checks) > len(saved_checks):
+                location_checks[key] = checks - saved_checks
+                saved_checks |= location_checks[key]
+        hints = {}
+        for key, key_hints in save["hints"].items():
+            if self._saved_hints.get(key) != key_hints:
+                hints[key] = self._saved_hints[key] = set(key_hints)
+        stored_data = {key: save["stored_data"][key] for key in stored_data_changes}
+        for part, changes in (("received_items", received_items), ("location_checks", location_checks),
+                              ("hints", hints), ("stored_data", stored_data)):
+            if changes:
+                record[part] = changes
+
+        for part in ("client_activity_timers", "client_connection_timers"):
+            saved_timers = self._saved_timers.setdefault(part, {})
+            timers = {key: timestamp for key, timestamp in save[part] if saved_timers.get(key) != timestamp}
+            if timers:
+                record[part] = timers
+                saved_timers.update(timers)
+        for part, value in save.items():
+            if part not in self.journaled_save_parts:
+                encoded = pickle.dumps(value)
+                if encoded != self._saved_parts.get(part):
+                    record[part] = value
+                    self._saved_parts[part] = encoded
+        return record
+
+    def _set_save_baseline(self, save: dict, snapshot_size: int, journal_size: int = 0):
+        """Remembers save as written, for get_save_record to only record what changes after it."""
+        self.save_snapshot_size = snapshot_size
+        self.save_journal_size = journal_size
+        self._saved_received_items = {key: len(items) for key, items in save["received_items"].items()}
+        self._saved_location_checks = {key: set(checks) for key, checks in save["location_checks"].items()}
+        self._saved_hints = {key: set(hints) for key, hints in save["hints"].items()}
+        self._saved_timers = {part: dict(save[part]) for part in ("client_activity_timers", "client_connection_timers")}
+        self._saved_parts = {part: pickle.dumps(value) for part, value in save.items()
+                             if part not in self.journaled_save_parts}
+
     def set_save(self, savedata: dict):
         if self.connect_names != savedata["connect_names"]:
             raise Exception("This savegame does not appear to match the loaded multiworld.")
@@ -532,6 +785,7 @@ class Context:
 
         if "stored_data" in savedata:
             self.stored_data = savedata["stored_data"]
+        self.save_generation = savedata.get("save_generation", 0)
         # count items and slots from lists for item_handling = remote
         logging.info(
             f'Loaded save file with {sum([len(v) for k, v in self.received_items.items() if k[2]])} received items '
@@ -545,10 +799,10 @@ class Context:
         return 0
 
     def recheck_hints(self):
-        for team, slot in self.hints:
+        for team, slot in list(self.hints):
             self.hints[team, slot] = {
                 hint.re_check(self, team) for hint in
-                self.hints[team, slot]
+                list(self.hints[team, slot])
             }
 
     def get_players_package(self):
@@ -584,6 +838,10 @@ class Context:
         else:
             return self.player_names[team, slot]
 
+    def on_locations_checked(self, team: int, slot: int, locations: typing.Set[int]):
+        """Called with the locations a slot newly checked, after they got added to location_checks."""
+        pass
+
     def on_goal_achieved(self, client: Client):
         finished_msg = f'{self.get_aliased_name(client.team, client.slot)} (Team #{client.team + 1})' \
                        f' has completed their goal.'
@@ -627,7 +885,7 @@ def notify_hints(ctx: Context, team: int, hints: typing.List[NetUtils.Hint], onl
             continue
         client_hints = [datum[1] for datum in sorted(hint_data, key=lambda x: x[0].finding_player == slot)]
         for client in clients:
-            async_start(ctx.send_msgs(client, client_hints))
+            ctx.queue_msgs(client, client_hints)
 
 
 def update_aliases(ctx: Context, team: int):
@@ -636,7 +894,7 @@ def update_aliases(ctx: Context, team: int):
 
     for clients in ctx.clients[team].values():
         for client in clients:
-            async_start(ctx.send_encoded_msgs(client, cmd))
+            ctx.queue_encoded_msgs((client,), cmd)
 
 
 async def server(websocket, path: str = "/", ctx: Context = None):
@@ -691,6 +949,8 @@ async def on_client_connected(ctx: Context, client: Client):
         if all(game_data["version"] for game_data in ctx.gamespackage.values()) else 0,
         'datapackage_versions': {game: game_data["version"] for game, game_data
                                  in ctx.gamespackage.items()},
+        'datapackage_checksums': {game: game_data["checksum"] for game, game_data
+                                  in ctx.gamespackage.items() if "checksum" in game_data},
         'seed_name': ctx.seed_name,
         'time': time.time(),
     }])
@@ -805,20 +1065,21 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
 
 
 def send_new_items(ctx: Context):
-    for team, clients in ctx.clients.items():
-        for slot, clients in clients.items():
-            for client in clients:
-                if client.no_items:
-                    continue
-                start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
-                items = get_received_items(ctx, team, slot, client.remote_items)
-                if len(start_inventory) + len(items) > client.send_index:
-                    first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
-                    client.send_index = len(start_inventory) + len(items)
+    """Sends the items received since the last call to the clients of those slots that received any."""
+    recipients, ctx.new_items_recipients = ctx.new_items_recipients, set()
+    for team, slot in recipients:
+        for client in ctx.clients[team].get(slot, ()):
+            if client.no_items:
+                continue
+            start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
+            items = get_received_items(ctx, team, slot, client.remote_items)
+            if len(start_inventory) + len(items) > client.send_index:
+                first_new_item = max(0, client.send_index - len(start_inventory))
+                ctx.queue_msgs(client, [{
+                    "cmd": "ReceivedItems",
+                    "index": client.send_index,
+                    "items": start_inventory[client.send_index:] + items[first_new_item:]}])
+                client.send_index = len(start_inventory) + len(items)
 
 
 def update_checked_locations(ctx: Context, team: int, slot: int):
@@ -837,10 +1098,8 @@ def forfeit_player(ctx: Context, team: int, slot: int):
 def collect_player(ctx: Context, team: int, slot: int, is_group: bool = False):
     """register any locations that are in the multidata, pointing towards this player"""
     all_locations = collections.defaultdict(set)
-    for source_slot, location_data in ctx.locations.items():
-        for location_id, values in location_data.items():
-            if values[1] == slot:
-                all_locations[source_slot].add(location_id)
+    for source_slot, location_id in ctx.receiving_locations.get(slot, ()):
+        all_locations[source_slot].add(location_id)
 
     ctx.notify_all("%s (Team #%d) has collected their items from other worlds." % (ctx.player_names[(team, slot)], team + 1))
     for source_player, location_ids in all_locations.items():
@@ -870,6 +1129,7 @@ def send_items_to(ctx: Context, team: int, target_slot: int, *items: NetworkItem
             if item.player != target_slot:
                 get_received_items(ctx, team, target, False).append(item)
             get_received_items(ctx, team, target, True).append(item)
+        ctx.new_items_recipients.add((team, target))
 
 
 def register_location_checks(ctx: Context, team: int, slot: int, locations: typing.Iterable[int],
@@ -879,6 +1139,7 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
     if new_locations:
         if count_activity:
             ctx.client_activity_timers[team, slot] = datetime.datetime.now(datetime.timezone.utc)
+        info_texts = []
         for location in new_locations:
             item_id, target_player, flags = ctx.locations[slot][location]
             new_item = NetworkItem(item_id, location, slot, flags)
@@ -887,10 +1148,11 @@ def register_location_checks(ctx: Context, team: int, slot: int, locations: typi
             logging.info('(Team #%d) %s sent %s to %s (%s)' % (
                 team + 1, ctx.player_names[(team, slot)], ctx.item_names[item_id],
                 ctx.player_names[(team, target_player)], ctx.location_names[location]))
-            info_text = json_format_send_event(new_item, target_player)
-            ctx.broadcast_team(team, [info_text])
+            info_texts.append(json_format_send_event(new_item, target_player))
+        ctx.broadcast_team(team, info_texts)
 
         ctx.location_checks[team, slot] |= new_locations
+        ctx.on_locations_checked(team, slot, new_locations)
         send_new_items(ctx)
         ctx.broadcast(ctx.clients[team][slot], [{
             "cmd": "RoomUpdate",
@@ -909,13 +1171,13 @@ def collect_hints(ctx: Context, team: int, slot: int, item: typing.Union[int, st
             slots.add(group_id)
 
     seeked_item_id = item if isinstance(item, int) else ctx.item_names_for_game(ctx.games[slot])[item]
-    for finding_player, check_data in ctx.locations.items():
-        for location_id, (item_id, receiving_player, item_flags) in check_data.items():
-            if receiving_player in slots and item_id == seeked_item_id:
-                found = location_id in ctx.location_checks[team, finding_player]
-                entrance = ctx.er_hint_data.get(finding_player, {}).get(location_id, "")
-                hints.append(NetUtils.Hint(receiving_player, finding_player, location_id, item_id, found, entrance,
-                                           item_flags))
+    for receiving_player in slots:
+        for finding_player, location_id in ctx.item_locations.get((receiving_player, seeked_item_id), ()):
+            item_id, _, item_flags = ctx.locations[finding_player][location_id]
+            found = location_id in ctx.location_checks[team, finding_player]
+            entrance = ctx.er_hint_data.get(finding_player, {}).get(location_id, "")
+            hints.append(NetUtils.Hint(receiving_player, finding_player, location_id, item_id, found, entrance,
+                                       item_flags))
 
     return hints
 
@@ -1318,6 +1580,7 @@ class ClientMessageProcessor(CommonCommandProcessor):
                 new_item = NetworkItem(names[item_name], -1, self.client.slot)
                 get_received_items(self.ctx, self.client.team, self.client.slot, False).append(new_item)
                 get_received_items(self.ctx, self.client.team, self.client.slot, True).append(new_item)
+                self.ctx.new_items_recipients.add((self.client.team, self.client.slot))
                 self.ctx.notify_all(
                     'Cheat console: sending "' + item_name + '" to ' + self.ctx.get_aliased_name(self.client.team,
                                                                                                  self.client.slot))
@@ -1577,23 +1840,17 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
     elif cmd == "GetDataPackage":
         exclusions = args.get("exclusions", [])
         if "games" in args:
-            games = {name: game_data for name, game_data in ctx.gamespackage.items()
-                     if name in set(args.get("games", []))}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": games}}])
+            games = set(args.get("games", []))
+            await ctx.send_encoded_msgs(client, ctx.get_datapackage_msg(
+                name for name in ctx.gamespackage if name in games))
         # TODO: remove exclusions behaviour around 0.5.0
         elif exclusions:
             exclusions = set(exclusions)
-            games = {name: game_data for name, game_data in ctx.gamespackage.items()
-                     if name not in exclusions}
-
-            package = {"games": games}
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": package}])
+            await ctx.send_encoded_msgs(client, ctx.get_datapackage_msg(
+                name for name in ctx.gamespackage if name not in exclusions))
 
         else:
-            await ctx.send_msgs(client, [{"cmd": "DataPackage",
-                                          "data": {"games": ctx.gamespackage}}])
+            await ctx.send_encoded_msgs(client, ctx.get_datapackage_msg(ctx.gamespackage))
 
     elif client.auth:
         if cmd == "ConnectUpdate":
@@ -1709,6 +1966,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
+            ctx.stored_data_changes.add(args["key"])
             targets = set(ctx.stored_data_notification_clients[args["key"]])
             if args.get("want_reply", True):
                 targets.add(client)
@@ -1769,6 +2027,13 @@ class ServerCommandProcessor(CommonCommandProcessor):
             self.output(get_status_string(self.ctx, team, tag))
         return True
 
+    def _cmd_network(self) -> bool:
+        """Get statistics about frames sent to clients"""
+        saved = self.ctx.frames_queued - self.ctx.frames_sent
+        self.output(f"Sent {self.ctx.frames_sent} frames for {self.ctx.frames_queued} queued, "
+                    f"coalescing saved {saved} frames.")
+        return True
+
     def _cmd_exit(self) -> bool:
         """Shutdown the server"""
         async_start(self.ctx.server.ws_server._close())
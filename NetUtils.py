@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import typing
 import enum
-from json import JSONEncoder, JSONDecoder
+import math
+import pickle
+import zlib
+from json import JSONDecoder, encoder
 
 import websockets
+try:
+    # optional, speeds up encode
+    import orjson
+except ImportError:
+    orjson = None
 
-from Utils import Version
+from Utils import Version, restricted_loads
 
 
 class JSONMessagePart(typing.TypedDict, total=False):
@@ -81,27 +89,133 @@ class NetworkItem(typing.NamedTuple):
     flags: int = 0
 
 
-def _scan_for_TypedTuples(obj: typing.Any) -> typing.Any:
-    if isinstance(obj, tuple) and hasattr(obj, "_fields"):  # NamedTuple is not actually a parent class
-        data = obj._asdict()
-        data["class"] = obj.__class__.__name__
-        return data
-    if isinstance(obj, (tuple, list, set)):
-        return tuple(_scan_for_TypedTuples(o) for o in obj)
-    if isinstance(obj, dict):
-        return {key: _scan_for_TypedTuples(value) for key, value in obj.items()}
-    return obj
+def _network_item_data(o: NetworkItem) -> typing.Dict[str, typing.Any]:
+    return {"item": o.item, "location": o.location, "player": o.player, "flags": o.flags, "class": "NetworkItem"}
+
+
+def _network_player_data(o: NetworkPlayer) -> typing.Dict[str, typing.Any]:
+    return {"team": o.team, "slot": o.slot, "alias": o.alias, "name": o.name, "class": "NetworkPlayer"}
+
+
+def _network_slot_data(o: NetworkSlot) -> typing.Dict[str, typing.Any]:
+    return {"name": o.name, "game": o.game, "type": o.type, "group_members": o.group_members,
+            "class": "NetworkSlot"}
+
+
+def _hint_data(o: Hint) -> typing.Dict[str, typing.Any]:
+    return {"receiving_player": o.receiving_player, "finding_player": o.finding_player, "location": o.location,
+            "item": o.item, "found": o.found, "entrance": o.entrance, "item_flags": o.item_flags, "class": "Hint"}
+
+
+def _typed_tuple_data(o: typing.Any) -> typing.Dict[str, typing.Any]:
+    """NamedTuples are sent as an object of their fields, with their class name under "class"."""
+    data = _typed_tuple_encoders.get(type(o))
+    if data:
+        return data(o)
+    data = o._asdict()
+    data["class"] = o.__class__.__name__
+    return data
+
+
+_encode_string = encoder.encode_basestring  # the C implementation when available, without ensure_ascii
+
+
+def _encode_float(o: float) -> str:
+    # same as JSONEncoder
+    if o != o:
+        return "NaN"
+    if o == float("inf"):
+        return "Infinity"
+    if o == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(o)
+
+
+def _encode_key(key: typing.Any) -> str:
+    if isinstance(key, str):
+        return _encode_string(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return '"' + int.__repr__(key) + '"'
+    if isinstance(key, float):
+        return '"' + _encode_float(key) + '"'
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+def _encode_python(o: typing.Any) -> str:
+    """Encodes o in one pass, with the types the network protocol sends most having their own format."""
+    obj_type = type(o)
+    if obj_type is str:
+        return _encode_string(o)
+    if obj_type is int:
+        return int.__repr__(o)
+    if obj_type is NetworkItem:
+        return '{"item":%d,"location":%d,"player":%d,"flags":%d,"class":"NetworkItem"}' % o
+    if obj_type is NetworkPlayer:
+        return '{"team":%d,"slot":%d,"alias":%s,"name":%s,"class":"NetworkPlayer"}' % \
+               (o.team, o.slot, _encode_string(o.alias), _encode_string(o.name))
+    if obj_type is dict:
+        return "{" + ",".join([_encode_key(key) + ":" + _encode_python(value) for key, value in o.items()]) + "}"
+    if obj_type is list or obj_type is tuple or obj_type is set or obj_type is frozenset:
+        return "[" + ",".join([_encode_python(value) for value in o]) + "]"
+    if o is None:
+        return "null"
+    if o is True:
+        return "true"
+    if o is False:
+        return "false"
+    if isinstance(o, tuple) and hasattr(o, "_fields"):  # NamedTuple is not actually a parent class
+        return _encode_python(_typed_tuple_data(o))
+    if isinstance(o, int):
+        return int.__repr__(o)
+    if isinstance(o, float):
+        return _encode_float(o)
+    if isinstance(o, str):
+        return _encode_string(o)
+    if isinstance(o, dict):
+        return _encode_python(dict(o))
+    if isinstance(o, (list, tuple, set, frozenset)):
+        return _encode_python(list(o))
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def _orjson_default(o: typing.Any) -> typing.Any:
+    if isinstance(o, tuple) and hasattr(o, "_fields"):
+        return _typed_tuple_data(o)
+    if isinstance(o, (set, frozenset, tuple)):
+        return list(o)
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(o: typing.Any) -> bool:
+    if isinstance(o, float):
+        return not math.isfinite(o)
+    if isinstance(o, dict):
+        return any(_has_non_finite_float(key) or _has_non_finite_float(value) for key, value in o.items())
+    if isinstance(o, (list, tuple, set, frozenset)):
+        return any(_has_non_finite_float(value) for value in o)
+    return False
 
 
-_encode = JSONEncoder(
-    ensure_ascii=False,
-    check_circular=False,
-    separators=(',', ':'),
-).encode
+def _encode_orjson(o: typing.Any) -> str:
+    try:
+        encoded = orjson.dumps(o, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # for what orjson can't do, like integers above 64 bit
+        return _encode_python(o)
+    # orjson writes inf and nan as null, where JSONEncoder writes Infinity and NaN
+    if b"null" in encoded and _has_non_finite_float(o):
+        return _encode_python(o)
+    return encoded.decode()
 
 
 def encode(obj: typing.Any) -> str:
-    return _encode(_scan_for_TypedTuples(obj))
+    return _encode_orjson(obj) if orjson else _encode_python(obj)
 
 
 def get_any_version(data: dict) -> Version:
@@ -343,3 +457,74 @@ class Hint(typing.NamedTuple):
     @property
     def local(self):
         return self.receiving_player == self.finding_player
+
+
+_typed_tuple_encoders: typing.Dict[type, typing.Callable[[typing.Any], typing.Dict[str, typing.Any]]] = {
+    NetworkItem: _network_item_data,
+    NetworkPlayer: _network_player_data,
+    NetworkSlot: _network_slot_data,
+    Hint: _hint_data,
+}
+
+
+def encode_multidata(multidata: typing.Dict[str, typing.Any]) -> bytes:
+    """
+    Encodes multidata as format 4: the format byte, the header length as 4 bytes little endian, the header and then
+    separately compressed sections, one per key of multidata, except slot_data, which gets one per slot.
+    The header is a pickled table of key to (offset, length) of its section, counted from the end of the header,
+    or for slot_data a table of slot to (offset, length).
+    """
+    table: typing.Dict[str, typing.Any] = {}
+    sections: typing.List[bytes] = []
+    offset = 0
+
+    def add_section(value: typing.Any) -> typing.Tuple[int, int]:
+        nonlocal offset
+        section = zlib.compress(pickle.dumps(value), 9)
+        sections.append(section)
+        offset += len(section)
+        return offset - len(section), len(section)
+
+    for key, value in multidata.items():
+        if key == "slot_data":
+            table[key] = {slot: add_section(data) for slot, data in value.items()}
+        else:
+            table[key] = add_section(value)
+    header = pickle.dumps(table)
+    return b"".join((bytes([4]), len(header).to_bytes(4, "little"), header, *sections))
+
+
+class MultiDataSections(typing.Mapping[typing.Any, typing.Any]):
+    """Read-only view of the sections of format 4 multidata, each one only gets decoded on first access."""
+    _data: memoryview
+    _table: typing.Dict[typing.Any, typing.Any]
+    _decoded: typing.Dict[typing.Any, typing.Any]
+
+    def __init__(self, data: memoryview, table: typing.Dict[typing.Any, typing.Any]):
+        self._data = data
+        self._table = table
+        self._decoded = {}
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        if key not in self._decoded:
+            entry = self._table[key]
+            if isinstance(entry, dict):
+                self._decoded[key] = MultiDataSections(self._data, entry)
+            else:
+                offset, length = entry
+                self._decoded[key] = restricted_loads(zlib.decompress(self._data[offset:offset + length]))
+        return self._decoded[key]
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+
+def decode_multidata(data: typing.Union[bytes, memoryview, typing.Any]) -> MultiDataSections:
+    """Reads the header of format 4 multidata, data can be anything supporting the buffer protocol, like an mmap.
+    The sections are read from data without copying it, so it has to stay unchanged as long as they may be used."""
+    data = memoryview(data)
+    header_length = int.from_bytes(data[1:5], "little")
+    return MultiDataSections(data[5 + header_length:], restricted_loads(data[5:5 + header_length]))
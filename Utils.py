@@ -10,8 +10,11 @@ import pickle
 import functools
 import io
 import collections
+import contextlib
 import importlib
 import logging
+import threading
+import time
 from typing import BinaryIO, ClassVar, Coroutine, Optional, Set
 
 from yaml import load, load_all, dump, SafeLoader
@@ -345,6 +348,14 @@ def get_options() -> OptionsType:
     raise FileNotFoundError(f"Could not find {filenames[1]} to load options.")
 
 
+def data_package_checksum(data: typing.Dict[str, typing.Any]) -> str:
+    """Calculates the checksum of a game's data package, ignoring key order and any checksum already in it."""
+    import hashlib
+    import json
+    data = {key: value for key, value in data.items() if key != "checksum"}
+    return hashlib.sha1(json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()).hexdigest()
+
+
 def persistent_store(category: str, key: typing.Any, value: typing.Any):
     path = user_path("_persistent_storage.yaml")
     storage: dict = persistent_load()
@@ -451,9 +462,10 @@ loglevel_mapping = {'error': logging.ERROR, 'info': logging.INFO, 'warning': log
 
 def init_logging(name: str, loglevel: typing.Union[str, int] = logging.INFO, write_mode: str = "w",
                  log_format: str = "[%(name)s at %(asctime)s]: %(message)s",
-                 exception_logger: typing.Optional[str] = None):
+                 exception_logger: typing.Optional[str] = None, log_folder: typing.Optional[str] = None):
     loglevel: int = loglevel_mapping.get(loglevel, loglevel)
-    log_folder = user_path("logs")
+    if not log_folder:
+        log_folder = user_path("logs")
     os.makedirs(log_folder, exist_ok=True)
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
@@ -672,3 +684,96 @@ def async_start(co: Coroutine[None, None, None], name: Optional[str] = None) ->
     task = asyncio.create_task(co, name=name)
     _faf_tasks.add(task)
     task.add_done_callback(_faf_tasks.discard)
+
+
+def get_peak_rss() -> Optional[int]:
+    """Returns the peak resident memory of this process so far in bytes, or None where it can't be determined."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if is_macos else peak * 1024  # macOS reports bytes, other unixes kilobytes
+
+
+class StageProfiler:
+    """
+    Records wall time, cpu time and memory of consecutive stages, like the steps of a generation,
+    and the wall and cpu time of named parts, like each game's hooks, within them.
+    Memory is the peak resident memory of the process at the end of each stage and how much the stage raised it,
+    so a stage that stays below the peak of an earlier one shows no increase.
+    Optionally dumps a cProfile of each stage to {profile_path}_{stage}.prof, this only covers the calling thread.
+    """
+    stages: typing.Dict[str, typing.Dict[str, typing.Any]]
+    profile_path: Optional[str]
+
+    def __init__(self, profile_path: Optional[str] = None):
+        self.stages = {}
+        self.profile_path = profile_path
+        self._parts: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self._parts_lock = threading.Lock()
+        self._profile = None
+        self._start()
+
+    def _start(self) -> None:
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._peak_rss = get_peak_rss()
+        if self.profile_path:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stage_done(self, stage: str) -> None:
+        """Finishes the running stage under the given name and starts the next one."""
+        if self._profile:
+            self._profile.disable()
+            self._profile.dump_stats(f"{self.profile_path}_{stage}.prof")
+        with self._parts_lock:
+            parts, self._parts = self._parts, {}
+        peak_rss = get_peak_rss()
+        self.stages[stage] = {"wall": time.perf_counter() - self._wall, "cpu": time.process_time() - self._cpu,
+                              "peak_rss": peak_rss,
+                              "peak_rss_increase": None if peak_rss is None else peak_rss - self._peak_rss,
+                              "parts": parts}
+        self._start()
+
+    @contextlib.contextmanager
+    def part(self, name: str) -> typing.Iterator[None]:
+        """Adds the time spent in the with block to the named part of the running stage. Threads may share a part."""
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.thread_time() - cpu
+            with self._parts_lock:
+                part = self._parts.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+                part["wall"] += wall
+                part["cpu"] += cpu
+                part["calls"] += 1
+
+    @property
+    def stage_times(self) -> typing.Dict[str, float]:
+        return {stage: record["wall"] for stage, record in self.stages.items()}
+
+    def to_file(self, filename: str) -> None:
+        import json
+        with open(filename, "w") as f:
+            json.dump(self.stages, f, indent=2)
+
+    def summary(self, parts: int = 3) -> str:
+        """Formats one line per stage, followed by its slowest parts."""
+        lines = []
+        for stage, record in self.stages.items():
+            line = f"{stage:>16}: {record['wall']:8.2f}s wall {record['cpu']:8.2f}s cpu"
+            if record["peak_rss"] is not None:
+                peak, increase = (format_SI_prefix(record[key], 1024, ("", "Ki", "Mi", "Gi", "Ti"))
+                                  for key in ("peak_rss", "peak_rss_increase"))
+                line += f" {peak}B process peak (+{increase}B)"
+            slowest = sorted(record["parts"].items(), key=lambda item: item[1]["wall"], reverse=True)[:parts]
+            if slowest:
+                line += " | " + ", ".join(f"{name}: {part['wall']:.2f}s" for name, part in slowest)
+            lines.append(line)
+        return "\n".join(lines)
@@ -24,7 +24,9 @@ app.jinja_env.filters['all'] = all
 app.config["SELFHOST"] = True  # application process is in charge of running the websites
 app.config["GENERATORS"] = 8  # maximum concurrent world gens
 app.config["SELFLAUNCH"] = True  # application process is in charge of launching Rooms.
+app.config["HOSTERS"] = 0  # processes that each host many Rooms, 0 launches a process per Room
 app.config["SELFGEN"] = True  # application process is in charge of scheduling Generations.
+app.config["QUEUE_PORT"] = 38280  # localhost udp port the views notify Generations and Rooms on, None to poll for them
 app.config["DEBUG"] = False
 app.config["PORT"] = 80
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -46,8 +48,11 @@ app.config["PONY"] = {
 }
 app.config["MAX_ROLL"] = 20
 app.config["CACHE_TYPE"] = "flask_caching.backends.SimpleCache"
+app.config["TRACKER_CACHE_SIZE"] = 64 * 1024 * 1024  # bytes of pickled seed data the trackers keep per process
+app.config["TRACKER_CACHE_PATH"] = None  # directory to share that seed data in between processes
 app.config["JSON_AS_ASCII"] = False
 app.config["PATCH_TARGET"] = "archipelago.gg"
+app.config["FILE_STORE"] = None  # directory to stream uploaded patch files to, instead of keeping them in the database
 
 cache = Cache(app)
 Compress(app)
@@ -6,6 +6,7 @@ from flask import request, session, url_for
 from pony.orm import commit
 
 from WebHostLib import app
+from WebHostLib.autolauncher import get_generation_queue_stats, notify_generation
 from WebHostLib.check import get_yaml_data, roll_options
 from WebHostLib.generate import get_meta
 from WebHostLib.models import Generation, STATE_QUEUED, Seed, STATE_ERROR
@@ -56,6 +57,7 @@ def generate_api():
                 meta=json.dumps(meta), state=STATE_QUEUED,
                 owner=session["_id"])
             commit()
+            notify_generation()
             return {"text": f"Generation of seed {gen.id} started successfully.",
                     "detail": gen.id,
                     "encoded": app.url_map.converters["suuid"].to_url(None, gen.id),
@@ -78,3 +80,11 @@ def wait_seed_api(seed: UUID):
     elif generation.state == STATE_ERROR:
         return {"text": "Generation failed"}, 500
     return {"text": "Generation running"}, 202
+
+
+@api_endpoints.route('/generation_queue')
+def generation_queue_api():
+    stats = get_generation_queue_stats()
+    if stats is None:
+        return {"text": "Generation queue not reachable"}, 503
+    return stats
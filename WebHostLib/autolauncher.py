@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import collections
+import functools
 import json
 import logging
 import multiprocessing
 import os
+import socket
+import statistics
 import sys
 import threading
 import time
@@ -74,8 +78,10 @@ def launch_room(room: Room, config: dict):
         multiworld.start()
 
 
-def handle_generation_success(seed_id):
-    logging.info(f"Generation finished for seed {seed_id}")
+def handle_generation_success(result: typing.Tuple[UUID, float]):
+    seed_id, wait = result
+    generation_queue.finish(seed_id, wait)
+    logging.info(f"Generation finished for seed {seed_id}, after waiting {wait:.1f}s for a generator")
 
 
 def handle_generation_failure(result: BaseException):
@@ -85,17 +91,30 @@ def handle_generation_failure(result: BaseException):
         logging.exception(e)
 
 
+def handle_queued_generation_failure(generation_id: UUID, result: BaseException):
+    generation_queue.finish(generation_id)
+    handle_generation_failure(result)
+
+
+def run_generation(dispatch_time: float, options, **kwargs) -> typing.Tuple[UUID, float]:
+    """Runs gen_game in a generator process, returns the seed id and how long it waited to start."""
+    wait = time.time() - dispatch_time
+    return gen_game(options, **kwargs), wait
+
+
 def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
     try:
         meta = json.loads(generation.meta)
         options = restricted_loads(generation.options)
         logging.info(f"Generating {generation.id} for {len(options)} players")
-        pool.apply_async(gen_game, (options,),
+        pool.apply_async(run_generation, (generation_queue.dispatch(generation.id), options),
                          {"meta": meta,
                           "sid": generation.id,
                           "owner": generation.owner},
-                         handle_generation_success, handle_generation_failure)
+                         handle_generation_success,
+                         functools.partial(handle_queued_generation_failure, generation.id))
     except Exception as e:
+        generation_queue.finish(generation.id)
         generation.state = STATE_ERROR
         commit()
         logging.exception(e)
@@ -103,24 +122,188 @@ def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
         generation.state = STATE_STARTED
 
 
+class GenerationQueue:
+    """Generations handed to the generator pool, to report how many wait for a generator and for how long."""
+
+    def __init__(self):
+        self.generators = 0
+        self.lock = threading.Lock()
+        self.dispatched: typing.Dict[UUID, float] = {}  # time each unfinished generation was handed to the pool
+        self.waits: typing.Deque[float] = collections.deque(maxlen=100)  # of recent generations, in seconds
+
+    def dispatch(self, generation_id: UUID) -> float:
+        dispatch_time = time.time()
+        with self.lock:
+            self.dispatched[generation_id] = dispatch_time
+        return dispatch_time
+
+    def finish(self, generation_id: UUID, wait: typing.Optional[float] = None):
+        with self.lock:
+            self.dispatched.pop(generation_id, None)
+            if wait is not None:
+                self.waits.append(wait)
+
+    def get_stats(self) -> typing.Dict[str, typing.Union[int, float]]:
+        with self.lock:
+            # the pool starts generations in the order they were handed to it
+            waiting = sorted(self.dispatched.values())[self.generators:]
+            running = len(self.dispatched) - len(waiting)
+            waits = list(self.waits)
+        return {"generators": self.generators,
+                "running": running,
+                "queued": len(waiting),
+                "oldest_wait": time.time() - waiting[0] if waiting else 0.0,
+                "mean_wait": statistics.mean(waits) if waits else 0.0,
+                "max_wait": max(waits, default=0.0)}
+
+
+generation_queue = GenerationQueue()
+
+job_sweep_interval = 10  # in seconds, database sweep for work the web views did not notify
+job_poll_interval = 1  # in seconds, database polling when there is no JobListener
+
+
+class JobListener:
+    """Receives the notifications of the web views on 127.0.0.1 at QUEUE_PORT, see notify_generation and notify_room,
+    so autogen and autohost start new work right away and only sweep the database for work they missed.
+    Notifications are only kept for the kinds of work a consumer registered for."""
+
+    def __init__(self, port: int):
+        self.generations: typing.Optional[threading.Event] = None  # once autogen listens for generations
+        self.rooms: typing.Optional[typing.Set[UUID]] = None  # once autohost listens, the rooms it did not take yet
+        self.rooms_notified = threading.Condition()
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.socket.bind(("127.0.0.1", port))
+        except OSError:
+            self.socket.close()
+            raise
+        threading.Thread(target=self.listen, name="AP_JobListener", daemon=True).start()
+
+    def listen_for_generations(self) -> threading.Event:
+        """Registers for generation notifications, returns the event they set."""
+        if not self.generations:
+            self.generations = threading.Event()
+        return self.generations
+
+    def listen_for_rooms(self):
+        """Registers for room notifications, to be taken with get_rooms."""
+        with self.rooms_notified:
+            if self.rooms is None:
+                self.rooms = set()
+
+    def get_rooms(self, timeout: float) -> typing.Set[UUID]:
+        """Waits up to timeout for rooms to be notified, returns the ones that were, each once."""
+        with self.rooms_notified:
+            self.rooms_notified.wait_for(lambda: self.rooms, timeout)
+            rooms, self.rooms = self.rooms, set()
+        return rooms
+
+    def listen(self):
+        while 1:
+            data, address = self.socket.recvfrom(256)
+            if data == b"generation":
+                if self.generations:
+                    self.generations.set()
+            elif data.startswith(b"room "):
+                try:
+                    room_id = UUID(data[5:].decode())
+                except ValueError:
+                    continue
+                with self.rooms_notified:
+                    if self.rooms is not None:
+                        self.rooms.add(room_id)
+                        self.rooms_notified.notify()
+            elif data == b"stats":
+                self.socket.sendto(json.dumps(generation_queue.get_stats()).encode(), address)
+
+
+job_listener: typing.Optional[JobListener] = None
+job_listener_lock = threading.Lock()
+
+
+def get_job_listener(config: dict) -> typing.Optional[JobListener]:
+    global job_listener
+    with job_listener_lock:
+        if not job_listener and config.get("QUEUE_PORT"):
+            try:
+                job_listener = JobListener(config["QUEUE_PORT"])
+            except OSError as e:
+                logging.warning(f"Could not listen for jobs on port {config['QUEUE_PORT']}, polling for them: {e}")
+    return job_listener
+
+
+def send_job_message(message: bytes):
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as notification:
+            notification.sendto(message, ("127.0.0.1", app.config["QUEUE_PORT"]))
+    except OSError:
+        pass  # autogen and autohost sweep the database as well
+
+
+def notify_generation():
+    """Tells autogen on this machine to start the newly queued generations now, instead of when sweeping."""
+    if app.config["QUEUE_PORT"]:
+        send_job_message(b"generation")
+
+
+def notify_room(room_id: UUID):
+    """Tells autohost on this machine to spin up the room now, if it is not running, instead of when sweeping."""
+    if app.config["QUEUE_PORT"]:
+        send_job_message(f"room {room_id}".encode())
+
+
+def get_generation_queue_stats() -> typing.Optional[typing.Dict[str, typing.Union[int, float]]]:
+    """Asks autogen on this machine for GenerationQueue.get_stats, None if it does not answer."""
+    if app.config["QUEUE_PORT"]:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as request:
+                request.settimeout(1)
+                request.sendto(b"stats", ("127.0.0.1", app.config["QUEUE_PORT"]))
+                return json.loads(request.recv(1024))
+        except (OSError, ValueError):
+            pass
+    return None
+
+
 def init_db(pony_config: dict):
     db.bind(**pony_config)
     db.generate_mapping()
 
 
+def init_generator(config: dict):
+    # spawned processes have the default config, the generators need to know where to upload to
+    app.config["FILE_STORE"] = config["FILE_STORE"]
+    init_db(config["PONY"])
+
+
 def autohost(config: dict):
     def keep_running():
         try:
             with Locker("autohost"):
                 run_guardian()
+                listener = get_job_listener(config)
+                if listener:
+                    listener.listen_for_rooms()
+                next_sweep = time.monotonic()
                 while 1:
-                    time.sleep(0.1)
+                    room_ids = set()
+                    if listener:
+                        room_ids = listener.get_rooms(timeout=max(0.0, next_sweep - time.monotonic()))
+                    else:
+                        time.sleep(job_poll_interval)
                     with db_session:
-                        rooms = select(
-                            room for room in Room if
-                            room.last_activity >= datetime.utcnow() - timedelta(days=3))
-                        for room in rooms:
-                            launch_room(room, config)
+                        for room_id in room_ids:
+                            room = Room.get(id=room_id)
+                            if room:
+                                launch_room(room, config)
+                        if time.monotonic() >= next_sweep:
+                            next_sweep = time.monotonic() + job_sweep_interval
+                            rooms = select(
+                                room for room in Room if
+                                room.last_activity >= datetime.utcnow() - timedelta(days=3))
+                            for room in rooms:
+                                launch_room(room, config)
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -133,9 +316,9 @@ def autogen(config: dict):
     def keep_running():
         try:
             with Locker("autogen"):
-
-                with multiprocessing.Pool(config["GENERATORS"], initializer=init_db,
-                                          initargs=(config["PONY"],)) as generator_pool:
+                generation_queue.generators = config["GENERATORS"]
+                with multiprocessing.Pool(config["GENERATORS"], initializer=init_generator,
+                                          initargs=(config,)) as generator_pool:
                     with db_session:
                         to_start = select(generation for generation in Generation if generation.state == STATE_STARTED)
 
@@ -151,8 +334,14 @@ def autogen(config: dict):
                             commit()
                         select(generation for generation in Generation if generation.state == STATE_ERROR).delete()
 
+                    listener = get_job_listener(config)
+                    generations = listener.listen_for_generations() if listener else None
                     while 1:
-                        time.sleep(0.1)
+                        if generations:
+                            generations.wait(job_sweep_interval)
+                            generations.clear()
+                        else:
+                            time.sleep(job_poll_interval)
                         with db_session:
                             # for update locks the database row(s) during transaction, preventing writes from elsewhere
                             to_start = select(
@@ -170,15 +359,79 @@ def autogen(config: dict):
 multiworlds: typing.Dict[type(Room.id), MultiworldInstance] = {}
 
 
+class RoomHostProcess():
+    """A process hosting many rooms, see customserver.run_room_host."""
+
+    def __init__(self, ponyconfig: dict):
+        self.ponyconfig = ponyconfig
+        self.rooms: typing.Set[type(Room.id)] = set()
+        self.room_queue: multiprocessing.Queue = multiprocessing.Queue()
+        self.process: typing.Optional[multiprocessing.Process] = None
+
+    def start(self):
+        self.process = multiprocessing.Process(group=None, target=run_room_host,
+                                               args=(self.room_queue, room_done_queue, self.ponyconfig,
+                                                     get_static_server_data()),
+                                               name="RoomHost")
+        self.process.start()
+
+    def host(self, room_id: type(Room.id)):
+        if not self.process or not self.process.is_alive():
+            self.start()
+        self.rooms.add(room_id)
+        self.room_queue.put((True, room_id))
+
+    def stop(self, room_id: type(Room.id)):
+        self.room_queue.put((False, room_id))
+
+    def check(self):
+        """Forgets the rooms of a process that died, so they get launched again."""
+        if self.process and not self.process.is_alive():
+            logging.warning(f"Room host process {self.process.pid} died hosting {len(self.rooms)} rooms.")
+            self.process = None
+            self.rooms.clear()
+            self.room_queue = multiprocessing.Queue()
+
+
+room_hosts: typing.List[RoomHostProcess] = []
+room_done_queue: typing.Optional[multiprocessing.Queue] = None
+
+
+def update_room_hosts():
+    # requires guardian_lock!
+    while not room_done_queue.empty():
+        room_id = room_done_queue.get()
+        for room_host in room_hosts:
+            room_host.rooms.discard(room_id)
+    for room_host in room_hosts:
+        room_host.check()
+
+
 class MultiworldInstance():
     def __init__(self, room: Room, config: dict):
         self.room_id = room.id
         self.process: typing.Optional[multiprocessing.Process] = None
+        self.room_host: typing.Optional[RoomHostProcess] = None
         with guardian_lock:
             multiworlds[self.room_id] = self
+            if config.get("HOSTERS", 0) and not room_hosts:
+                global room_done_queue
+                room_done_queue = multiprocessing.Queue()
+                room_hosts.extend(RoomHostProcess(config["PONY"]) for _ in range(config["HOSTERS"]))
         self.ponyconfig = config["PONY"]
 
     def start(self):
+        if room_hosts:
+            with guardian_lock:
+                update_room_hosts()
+                if self.room_host and self.room_id in self.room_host.rooms:
+                    return False
+                logging.info(f"Spinning up {self.room_id}")
+                # the least busy host gets the room
+                self.room_host = min(room_hosts, key=lambda room_host: len(room_host.rooms))
+                self.room_host.host(self.room_id)
+            return True
+
         if self.process and self.process.is_alive():
             return False
 
@@ -191,14 +444,21 @@ class MultiworldInstance():
         self.process = process
 
     def stop(self):
+        if self.room_host:
+            self.room_host.stop(self.room_id)
         if self.process:
             self.process.terminate()
             self.process = None
 
     def done(self):
+        if self.room_host:
+            return self.room_id not in self.room_host.rooms
         return self.process and not self.process.is_alive()
 
     def collect(self):
+        if self.room_host:
+            self.room_host = None
+            return
         self.process.join()  # wait for process to finish
         self.process = None
 
@@ -227,6 +487,8 @@ def run_guardian():
                     time.sleep(1)
                     done = []
                     with guardian_lock:
+                        if room_hosts:
+                            update_room_hosts()
                         for key, instance in multiworlds.items():
                             if instance.done():
                                 instance.collect()
@@ -237,6 +499,7 @@ def run_guardian():
             guardian = threading.Thread(name="Guardian", target=guard)
 
 
-from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed
-from .customserver import run_server_process, get_static_server_data
+from . import app
+from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, UUID
+from .customserver import run_server_process, run_room_host, get_static_server_data
 from .generate import gen_game
@@ -2,22 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import contextvars
 import datetime
 import functools
 import logging
+import multiprocessing
+import os
 import pickle
 import random
 import socket
 import threading
 import time
+import typing
 
 import websockets
 from pony.orm import db_session, commit, select
 
 import Utils
-from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor
-from Utils import get_public_ipv4, get_public_ipv6, restricted_loads, cache_argsless
-from .models import Room, Command, db
+from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, \
+    encode_save_record, restore_save
+from Utils import get_public_ipv4, get_public_ipv6, restricted_loads, cache_argsless, user_path, async_start
+from .models import Room, Command, SaveRecord, TrackerSnapshot, db
 
 
 class CustomClientMessageProcessor(ClientMessageProcessor):
@@ -52,8 +57,11 @@ class DBCommandProcessor(ServerCommandProcessor):
 
 class WebHostContext(Context):
     room_id: int
+    room_host: typing.Optional[RoomHost]
+    command_interval = 60  # in seconds, fallback polling for commands that were not notified
+    command_listener: typing.Optional[asyncio.DatagramTransport] = None
 
-    def __init__(self, static_server_data: dict):
+    def __init__(self, static_server_data: dict, room_host: typing.Optional[RoomHost] = None):
         # static server data is used during _load_game_data to load required data,
         # without needing to import worlds system, which takes quite a bit of memory
         self.static_server_data = static_server_data
@@ -62,6 +70,11 @@ class WebHostContext(Context):
         self.main_loop = asyncio.get_running_loop()
         self.video = {}
         self.tags = ["AP", "WebHost"]
+        # when sharing a process with other rooms, its RoomHost saves and polls commands for all of them
+        self.room_host = room_host
+        self.db_command_processor = DBCommandProcessor(self)
+        self.command_lock = threading.Lock()
+        self._saved_tracker_snapshots: typing.Dict[typing.Tuple[int, int], bytes] = {}
 
     def _load_game_data(self):
         for key, value in self.static_server_data.items():
@@ -69,18 +82,48 @@ class WebHostContext(Context):
         self.forced_auto_forfeits = collections.defaultdict(lambda: False, self.forced_auto_forfeits)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
-    def listen_to_db_commands(self):
-        cmdprocessor = DBCommandProcessor(self)
+    def _load(self, decoded_obj: typing.Mapping[str, typing.Any], use_embedded_server_options: bool):
+        result = super(WebHostContext, self)._load(decoded_obj, use_embedded_server_options)
+        self.tracker_data = TrackerData(self.locations, self.groups,
+                                        get_location_areas(decoded_obj.get("checks_in_area", {})))
+        return result
+
+    def set_save(self, savedata: dict):
+        super(WebHostContext, self).set_save(savedata)
+        self.tracker_data.clear()
+        for (team, slot), locations in self.location_checks.items():
+            self.tracker_data.check_locations(team, slot, locations)
 
+    def on_locations_checked(self, team: int, slot: int, locations: typing.Set[int]):
+        self.tracker_data.check_locations(team, slot, locations)
+
+    def listen_to_db_commands(self):
         while not self.exit_event.is_set():
-            with db_session:
-                commands = select(command for command in Command if command.room.id == self.room_id)
-                if commands:
-                    for command in commands:
-                        self.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
-                        command.delete()
-                    commit()
-            time.sleep(5)
+            time.sleep(self.command_interval if self.command_listener else 5)
+            for commandtext in self.pop_db_commands():
+                self.main_loop.call_soon_threadsafe(self.db_command_processor, commandtext)
+
+    @db_session
+    def pop_db_commands(self) -> typing.List[str]:
+        with self.command_lock:
+            commands = select(command for command in Command if command.room.id == self.room_id)
+            commandtexts = [command.commandtext for command in commands.order_by(Command.id)]
+            if commandtexts:
+                commands.delete(bulk=True)
+                commit()
+            return commandtexts
+
+    async def run_db_commands(self):
+        for commandtext in await self.main_loop.run_in_executor(None, self.pop_db_commands):
+            self.db_command_processor(commandtext)
+
+    async def listen_for_command_notifications(self, port: int):
+        """Runs the room's commands as soon as the web process notifies it of new ones, see notify_room_commands."""
+        try:
+            self.command_listener, _ = await self.main_loop.create_datagram_endpoint(
+                functools.partial(CommandNotificationProtocol, self), local_addr=("127.0.0.1", port))
+        except OSError as e:
+            logging.info(f"Could not listen for command notifications on port {port}, polling for commands: {e}")
 
     @db_session
     def load(self, room_id: int):
@@ -97,27 +140,142 @@ class WebHostContext(Context):
     def init_save(self, enabled: bool = True):
         self.saving = enabled
         if self.saving:
-            savegame_data = Room.get(id=self.room_id).multisave
+            room = Room.get(id=self.room_id)
+            savegame_data = room.multisave
             if savegame_data:
-                self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
-            self._start_async_saving()
-        threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
+                records = [record.data for record in room.save_records.order_by(SaveRecord.id)]
+                self.set_save(restore_save(restricted_loads(savegame_data), records))
+                self._set_save_baseline(self.get_save(), len(savegame_data), sum(map(len, records)))
+            if not self.room_host:
+                self._start_async_saving()
+        if not self.room_host:
+            threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
         room = Room.get(id=self.room_id)
-        room.multisave = pickle.dumps(self.get_save())
+        save = self._write_save(exit_save)
+        if exit_save:
+            self._saved_tracker_snapshots.clear()
+        for (team, slot), slot_snapshot in self.tracker_data.get_snapshot(save).items():
+            data = pickle.dumps(slot_snapshot)
+            # only the slots that changed since the last save get written
+            if self._saved_tracker_snapshots.get((team, slot)) != data:
+                tracker_snapshot = TrackerSnapshot.get(room=room, team=team, slot=slot)
+                if tracker_snapshot:
+                    tracker_snapshot.data = data
+                else:
+                    TrackerSnapshot(room=room, team=team, slot=slot, data=data)
+                self._saved_tracker_snapshots[team, slot] = data
         # saving only occurs on activity, so we can "abuse" this information to mark this as last_activity
         if not exit_save:  # we don't want to count a shutdown as activity, which would restart the server again
             room.last_activity = datetime.datetime.utcnow()
         return True
 
+    def _store_save_snapshot(self, save: dict) -> int:
+        room = Room.get(id=self.room_id)
+        room.multisave = pickle.dumps(save)
+        room.save_records.select().delete(bulk=True)
+        return len(room.multisave)
+
+    def _store_save_record(self, record: dict) -> int:
+        data = encode_save_record(record)
+        SaveRecord(room=Room.get(id=self.room_id), data=data)
+        return len(data)
+
     def get_save(self) -> dict:
         d = super(WebHostContext, self).get_save()
-        d["video"] = [(tuple(playerslot), videodata) for playerslot, videodata in self.video.items()]
+        d["video"] = [(tuple(playerslot), videodata) for playerslot, videodata in list(self.video.items())]
         return d
 
 
+def get_location_areas(checks_in_area: typing.Dict[int, typing.Dict[str, typing.Any]]) \
+        -> typing.Dict[int, typing.Dict[int, str]]:
+    """Returns the tracker area of each location per slot, from the checks_in_area of multidata."""
+    return {slot: {location: area for area, locations in areas.items() if area != "Total" for location in locations}
+            for slot, areas in checks_in_area.items()}
+
+
+class TrackerData:
+    """Inventories and checks per area of a room's slots, counted as locations get checked,
+    so the tracker pages don't have to count them from the whole save."""
+
+    def __init__(self, locations: typing.Dict[int, typing.Dict[int, typing.Tuple[int, int, int]]],
+                 groups: typing.Dict[int, typing.AbstractSet[int]],
+                 location_areas: typing.Dict[int, typing.Dict[int, str]]):
+        self.locations = locations
+        self.groups = groups
+        self.location_areas = location_areas
+        self.inventory: typing.Dict[typing.Tuple[int, int], typing.Counter[int]] = {}
+        self.checks_done: typing.Dict[typing.Tuple[int, int], typing.Counter[str]] = {}
+
+    def clear(self):
+        self.inventory.clear()
+        self.checks_done.clear()
+
+    def check_locations(self, team: int, slot: int, locations: typing.Iterable[int]):
+        slot_locations = self.locations[slot]
+        location_areas = self.location_areas.get(slot, {})
+        checks_done = self.checks_done.setdefault((team, slot), collections.Counter())
+        for location in locations:
+            if location in slot_locations:
+                item_id, receiving_slot, flags = slot_locations[location]
+                # items for a group count for each of its members
+                for receiving_member in self.groups.get(receiving_slot, (receiving_slot,)):
+                    self.inventory.setdefault((team, receiving_member), collections.Counter())[item_id] += 1
+                if location in location_areas:
+                    checks_done[location_areas[location]] += 1
+                    checks_done["Total"] += 1
+
+    def get_snapshot(self, save: typing.Dict[str, typing.Any]) \
+            -> typing.Dict[typing.Tuple[int, int], typing.Dict[str, typing.Any]]:
+        """Returns what the tracker pages show of each slot, from the counts so far and its parts of save,
+        as made by get_save. inventory holds the count of each received item id, without precollected items."""
+        # copies, as this may run on the saver thread while the event loop keeps counting
+        inventory = {key: dict(items) for key, items in list(self.inventory.items())}
+        checks_done = {key: dict(checks) for key, checks in list(self.checks_done.items())}
+        received_items = {}
+        for key, items in save.get("received_items", {}).items():
+            if len(key) == 2 or key[2]:  # before save version 1, only remote items were kept
+                received_items[key[:2]] = items
+        location_checks = save.get("location_checks", {})
+        hints = save.get("hints", {})
+        client_game_state = save.get("client_game_state", {})
+        activity_timers = dict(save.get("client_activity_timers", ()))
+        name_aliases = save.get("name_aliases", {})
+        video = {tuple(key): data for key, data in save.get("video", ())}
+        slots = set(save.get("connect_names", {}).values()) | inventory.keys() | checks_done.keys() | \
+            location_checks.keys()
+        return {key: {"inventory": inventory.get(key, {}),
+                      "checks_done": checks_done.get(key, {}),
+                      "location_checks": location_checks.get(key, set()),
+                      "received_items": received_items.get(key, []),  # in the order they were received
+                      "hints": hints.get(key, set()),
+                      "game_state": client_game_state.get(key, 0),
+                      "activity_timer": activity_timers.get(key),
+                      "alias": name_aliases.get(key),
+                      "video": video.get(key)}
+                for key in slots}
+
+
+class CommandNotificationProtocol(asyncio.DatagramProtocol):
+    def __init__(self, ctx: WebHostContext):
+        self.ctx = ctx
+
+    def datagram_received(self, data: bytes, addr):
+        if data == str(self.ctx.room_id).encode():
+            async_start(self.ctx.run_db_commands(), name="db commands")
+
+
+def notify_room_commands(room_id, port: int):
+    """Tells the server of a room hosted on this machine to run its new commands now, instead of when polling."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as notification:
+            notification.sendto(str(room_id).encode(), ("127.0.0.1", port))
+    except OSError:
+        pass  # the room polls for its commands as well
+
+
 def get_random_port():
     return random.randint(49152, 65535)
 
@@ -140,6 +298,61 @@ def get_static_server_data() -> dict:
     return data
 
 
+async def host_room(room_id, static_server_data: dict, room_host: typing.Optional[RoomHost] = None):
+    """Hosts a room until it shuts down for inactivity."""
+    ctx = WebHostContext(static_server_data, room_host)
+    # reading the room from the database and decoding its multidata would hold up the other rooms of a room_host,
+    # the context copy keeps the room's logging going to its log
+    await ctx.main_loop.run_in_executor(None, contextvars.copy_context().run, ctx.load, room_id)
+    await ctx.main_loop.run_in_executor(None, contextvars.copy_context().run, ctx.init_save)
+    if room_host:
+        room_host.rooms[room_id] = ctx
+
+    try:
+        ctx.server = websockets.serve(functools.partial(server, ctx=ctx), ctx.host, ctx.port, ping_timeout=None,
+                                      ping_interval=None)
+
+        await ctx.server
+    except Exception:  # likely port in use - in windows this is OSError, but I didn't check the others
+        ctx.server = websockets.serve(functools.partial(server, ctx=ctx), ctx.host, 0, ping_timeout=None,
+                                      ping_interval=None)
+
+        await ctx.server
+    port = 0
+    for wssocket in ctx.server.ws_server.sockets:
+        socketname = wssocket.getsockname()
+        if wssocket.family == socket.AF_INET6:
+            logging.info(f'Hosting game at [{get_public_ipv6()}]:{socketname[1]}')
+            # Prefer IPv4, as most users seem to not have working ipv6 support
+            if not port:
+                port = socketname[1]
+        elif wssocket.family == socket.AF_INET:
+            logging.info(f'Hosting game at {get_public_ipv4()}:{socketname[1]}')
+            port = socketname[1]
+    if port:
+        with db_session:
+            room = Room.get(id=ctx.room_id)
+            room.last_port = port
+        await ctx.listen_for_command_notifications(port)
+        # commands that arrived while the room was starting up
+        async_start(ctx.run_db_commands(), name="db commands")
+    with db_session:
+        ctx.auto_shutdown = Room.get(id=room_id).timeout
+    ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, []))
+    try:
+        await ctx.shutdown_task
+    except asyncio.CancelledError:
+        ctx.server.ws_server.close()
+    logging.info("Shutting down")
+    if ctx.command_listener:
+        ctx.command_listener.close()
+    if room_host:
+        del room_host.rooms[room_id]
+        if ctx.saving:
+            with room_host.save_lock:
+                ctx._save(True)
+
+
 def run_server_process(room_id, ponyconfig: dict, static_server_data: dict):
     # establish DB connection for multidata and multisave
     db.bind(**ponyconfig)
@@ -147,41 +360,149 @@ def run_server_process(room_id, ponyconfig: dict, static_server_data: dict):
 
     async def main():
         Utils.init_logging(str(room_id), write_mode="a")
-        ctx = WebHostContext(static_server_data)
-        ctx.load(room_id)
-        ctx.init_save()
-
-        try:
-            ctx.server = websockets.serve(functools.partial(server, ctx=ctx), ctx.host, ctx.port, ping_timeout=None,
-                                          ping_interval=None)
-
-            await ctx.server
-        except Exception:  # likely port in use - in windows this is OSError, but I didn't check the others
-            ctx.server = websockets.serve(functools.partial(server, ctx=ctx), ctx.host, 0, ping_timeout=None,
-                                          ping_interval=None)
-
-            await ctx.server
-        port = 0
-        for wssocket in ctx.server.ws_server.sockets:
-            socketname = wssocket.getsockname()
-            if wssocket.family == socket.AF_INET6:
-                logging.info(f'Hosting game at [{get_public_ipv6()}]:{socketname[1]}')
-                # Prefer IPv4, as most users seem to not have working ipv6 support
-                if not port:
-                    port = socketname[1]
-            elif wssocket.family == socket.AF_INET:
-                logging.info(f'Hosting game at {get_public_ipv4()}:{socketname[1]}')
-                port = socketname[1]
-        if port:
-            with db_session:
-                room = Room.get(id=ctx.room_id)
-                room.last_port = port
-        with db_session:
-            ctx.auto_shutdown = Room.get(id=room_id).timeout
-        ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, []))
-        await ctx.shutdown_task
-        logging.info("Shutting down")
+        await host_room(room_id, static_server_data)
 
     from .autolauncher import Locker
     with Locker(room_id):
         asyncio.run(main())
+
+
+current_room: contextvars.ContextVar = contextvars.ContextVar("current_room", default=None)
+
+
+class RoomLogHandler(logging.Handler):
+    """Writes what gets logged while current_room is set to that room's log file,
+    like Utils.init_logging does for a room in its own process."""
+
+    def __init__(self):
+        super(RoomLogHandler, self).__init__()
+        self.handlers: typing.Dict[typing.Any, logging.FileHandler] = {}
+
+    def open(self, room_id):
+        handler = logging.FileHandler(os.path.join(user_path("logs"), f"{room_id}.txt"), "a", encoding="utf-8-sig")
+        handler.setFormatter(logging.Formatter("[%(name)s at %(asctime)s]: %(message)s"))
+        self.handlers[room_id] = handler
+
+    def close_room(self, room_id):
+        self.handlers.pop(room_id).close()
+
+    def emit(self, record: logging.LogRecord):
+        handler = self.handlers.get(current_room.get())
+        if handler:
+            handler.handle(record)
+
+
+class RoomHost:
+    """Hosts many rooms on one event loop, sharing the static server data, one thread saving all rooms and
+    one thread polling for the commands of all rooms that were not notified."""
+    auto_save_interval = 60  # in seconds
+    command_interval = 60  # in seconds
+
+    def __init__(self, static_server_data: dict):
+        self.static_server_data = static_server_data
+        self.rooms: typing.Dict[typing.Any, WebHostContext] = {}
+        self.room_contexts: typing.Dict[typing.Any, contextvars.Context] = {}
+        self.loop = asyncio.get_running_loop()
+        self.save_lock = threading.Lock()
+        self.log_handler = RoomLogHandler()
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers:
+            handler.addFilter(lambda record: current_room.get() is None)
+        root_logger.addHandler(self.log_handler)
+        threading.Thread(target=self.save_regularly, name="RoomHost Saver", daemon=True).start()
+        threading.Thread(target=self.listen_to_db_commands, name="RoomHost Commands", daemon=True).start()
+
+    async def host_room(self, room_id):
+        current_room.set(room_id)
+        self.room_contexts[room_id] = contextvars.copy_context()
+        self.log_handler.open(room_id)
+        from .autolauncher import Locker, AlreadyRunningException
+        try:
+            with Locker(room_id):
+                await host_room(room_id, self.static_server_data, self)
+        except AlreadyRunningException:
+            logging.info(f"Room {room_id} is already running in another process.")
+        except Exception as e:
+            logging.exception(e)
+        finally:
+            self.rooms.pop(room_id, None)
+            del self.room_contexts[room_id]
+            self.log_handler.close_room(room_id)
+
+    def stop_room(self, room_id):
+        ctx = self.rooms.get(room_id)
+        if ctx and ctx.shutdown_task:
+            ctx.exit_event.set()
+            ctx.shutdown_task.cancel()
+
+    def save_all(self, exit_save: bool = False):
+        for room_id, ctx in list(self.rooms.items()):
+            if ctx.saving and (exit_save or ctx.save_dirty):
+                token = current_room.set(room_id)
+                try:
+                    with self.save_lock:
+                        ctx._save(exit_save)
+                except Exception as e:
+                    # keep saving the other rooms, and this one on the next try
+                    logging.exception(e)
+                    logging.info(f"Saving failed. Retry in {self.auto_save_interval} seconds.")
+                else:
+                    ctx.save_dirty = False
+                finally:
+                    current_room.reset(token)
+
+    def save_regularly(self):
+        while 1:
+            time.sleep(self.auto_save_interval)
+            self.save_all()
+
+    def listen_to_db_commands(self):
+        while 1:
+            time.sleep(self.command_interval)
+            rooms = dict(self.rooms)
+            if not rooms:
+                continue
+            with db_session:
+                room_ids = set(select(command.room.id for command in Command if command.room.id in list(rooms)))
+            for room_id in room_ids:
+                if room_id in rooms:
+                    self.loop.call_soon_threadsafe(async_start, rooms[room_id].run_db_commands(), "db commands",
+                                                   context=self.room_contexts.get(room_id))
+
+
+def run_room_host(room_queue: multiprocessing.Queue, done_queue: multiprocessing.Queue, ponyconfig: dict,
+                  static_server_data: dict):
+    """Hosts the rooms sent as (True, room_id) over room_queue, reporting each room that shut down to done_queue.
+    (False, room_id) stops a room, None stops the process."""
+    db.bind(**ponyconfig)
+    db.generate_mapping(check_tables=False)
+
+    async def main():
+        Utils.init_logging(f"RoomHost{os.getpid()}", write_mode="a")
+        room_host = RoomHost(static_server_data)
+        import atexit
+        atexit.register(room_host.save_all, True)
+        tasks: typing.Dict[typing.Any, asyncio.Task] = {}
+
+        while 1:
+            message = await room_host.loop.run_in_executor(None, room_queue.get)
+            if message is None:
+                break
+            start, room_id = message
+            if not start:
+                room_host.stop_room(room_id)
+            elif room_id not in tasks:
+                # tasks run in a copy of the current context, so current_room only gets set for that room
+                tasks[room_id] = asyncio.create_task(room_host.host_room(room_id))
+                tasks[room_id].add_done_callback(functools.partial(room_done, tasks, done_queue, room_id))
+        for room_id in list(room_host.rooms):
+            room_host.stop_room(room_id)
+        await asyncio.gather(*tasks.values())
+
+    asyncio.run(main())
+
+
+def room_done(tasks: typing.Dict[typing.Any, asyncio.Task], done_queue: multiprocessing.Queue, room_id,
+              _task: asyncio.Task):
+    del tasks[room_id]
+    done_queue.put(room_id)
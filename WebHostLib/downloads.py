@@ -1,4 +1,6 @@
 import json
+import struct
+import typing
 import zipfile
 from io import BytesIO
 
@@ -7,9 +9,103 @@ from pony.orm import select
 
 from worlds.Files import AutoPatchRegister
 from . import app, cache
+from .filestore import get_slot_data
 from .models import Slot, Room, Seed
 
 
+end_of_central_directory = struct.Struct("<4s4H2LH")
+central_directory_record = struct.Struct("<4s6H3L5H2L")
+
+
+def replace_manifest(data: bytes, manifest: bytes) -> bytes:
+    """Returns the zip data with its archipelago.json replaced by manifest. All other members get copied as they are,
+    without decompressing them. Raises zipfile.BadZipFile for zips it cannot copy that way, like zip64 ones."""
+    eocd_offset = data.rfind(b"PK\x05\x06")
+    if eocd_offset == -1:
+        raise zipfile.BadZipFile("End of central directory not found.")
+    _, disk, _, _, entries, directory_size, directory_offset, comment_length = \
+        end_of_central_directory.unpack_from(data, eocd_offset)
+    if disk or entries == 0xFFFF or directory_offset == 0xFFFFFFFF:
+        raise zipfile.BadZipFile("Multi-disk and zip64 files are not supported.")
+
+    records: typing.List[typing.Tuple[int, bytes, bytes]] = []  # local header offset, name, central record
+    position = directory_offset
+    for _ in range(entries):
+        fields = central_directory_record.unpack_from(data, position)
+        name_length, extra_length, file_comment_length, local_offset = fields[10], fields[11], fields[12], fields[16]
+        if 0xFFFFFFFF in (fields[8], fields[9], local_offset):
+            raise zipfile.BadZipFile("Zip64 members are not supported.")
+        if data[local_offset:local_offset + 4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile("Local header not found, data may be prepended to the zip.")
+        end = position + central_directory_record.size + name_length + extra_length + file_comment_length
+        name = data[position + central_directory_record.size:position + central_directory_record.size + name_length]
+        records.append((local_offset, name, data[position:end]))
+        position = end
+    # a member's local header, data and data descriptor reach up to the next member
+    local_offsets = sorted(record[0] for record in records) + [directory_offset]
+    local_ends = dict(zip(local_offsets, local_offsets[1:]))
+
+    manifest_zip = BytesIO()
+    with zipfile.ZipFile(manifest_zip, "w") as zf:
+        zf.writestr("archipelago.json", manifest)
+    manifest_zip = manifest_zip.getvalue()
+    _, _, _, _, _, _, manifest_directory_offset, _ = \
+        end_of_central_directory.unpack_from(manifest_zip, len(manifest_zip) - end_of_central_directory.size)
+
+    new_file = BytesIO()
+    central_directory = BytesIO()
+    for local_offset, name, central_record in records:
+        if name == b"archipelago.json":
+            local_record = memoryview(manifest_zip)[:manifest_directory_offset]
+            central_record = manifest_zip[manifest_directory_offset:len(manifest_zip) - end_of_central_directory.size]
+        else:
+            local_record = memoryview(data)[local_offset:local_ends[local_offset]]
+        # point the central record at where the member now starts
+        central_directory.write(central_record[:42])
+        central_directory.write(new_file.tell().to_bytes(4, "little"))
+        central_directory.write(central_record[46:])
+        new_file.write(local_record)
+    new_directory_offset = new_file.tell()
+    new_file.write(central_directory.getvalue())
+    new_file.write(end_of_central_directory.pack(b"PK\x05\x06", 0, 0, len(records), len(records),
+                                                 central_directory.tell(), new_directory_offset, comment_length))
+    new_file.write(data[eocd_offset + end_of_central_directory.size:
+                        eocd_offset + end_of_central_directory.size + comment_length])
+    return new_file.getvalue()
+
+
+@cache.memoize(timeout=10 * 60)  # players of a room tend to download their patches around the same time
+def get_patch(patch_id: int, last_port: int) -> typing.Optional[typing.Tuple[bytes, str]]:
+    """Returns the patch data pointed at the server on last_port and its file ending,
+    or None for patches from before they were zip files."""
+    patch = Slot.get(id=patch_id)
+    patch_data = get_slot_data(patch)
+    filelike = BytesIO(patch_data)
+    if not zipfile.is_zipfile(filelike):
+        return None
+    with zipfile.ZipFile(filelike) as zf:
+        with zf.open("archipelago.json", "r") as f:
+            manifest = json.load(f)
+        manifest["server"] = f"{app.config['PATCH_TARGET']}:{last_port}" if last_port else None
+        try:
+            data = replace_manifest(patch_data, json.dumps(manifest).encode())
+        except zipfile.BadZipFile:
+            # Python's zipfile module cannot overwrite/delete files in a zip, so we recreate the whole thing in ram
+            new_file = BytesIO()
+            with zipfile.ZipFile(new_file, "w") as new_zip:
+                for file in zf.infolist():
+                    if file.filename == "archipelago.json":
+                        new_zip.writestr("archipelago.json", json.dumps(manifest))
+                    else:
+                        new_zip.writestr(file.filename, zf.read(file), file.compress_type, 9)
+            data = new_file.getvalue()
+    if "patch_file_ending" in manifest:
+        patch_file_ending = manifest["patch_file_ending"]
+    else:
+        patch_file_ending = AutoPatchRegister.patch_types[patch.game].patch_file_ending
+    return data, patch_file_ending
+
+
 @app.route("/dl_patch/<suuid:room_id>/<int:patch_id>")
 def download_patch(room_id, patch_id):
     patch = Slot.get(id=patch_id)
@@ -17,30 +113,12 @@ def download_patch(room_id, patch_id):
         return "Patch not found"
     else:
         room = Room.get(id=room_id)
-        last_port = room.last_port
-        filelike = BytesIO(patch.data)
-        greater_than_version_3 = zipfile.is_zipfile(filelike)
-        if greater_than_version_3:
-            # Python's zipfile module cannot overwrite/delete files in a zip, so we recreate the whole thing in ram
-            new_file = BytesIO()
-            with zipfile.ZipFile(filelike, "a") as zf:
-                with zf.open("archipelago.json", "r") as f:
-                    manifest = json.load(f)
-                manifest["server"] = f"{app.config['PATCH_TARGET']}:{last_port}" if last_port else None
-                with zipfile.ZipFile(new_file, "w") as new_zip:
-                    for file in zf.infolist():
-                        if file.filename == "archipelago.json":
-                            new_zip.writestr("archipelago.json", json.dumps(manifest))
-                        else:
-                            new_zip.writestr(file.filename, zf.read(file), file.compress_type, 9)
-            if "patch_file_ending" in manifest:
-                patch_file_ending = manifest["patch_file_ending"]
-            else:
-                patch_file_ending = AutoPatchRegister.patch_types[patch.game].patch_file_ending
+        result = get_patch(patch_id, room.last_port)
+        if result:
+            data, patch_file_ending = result
             fname = f"P{patch.player_id}_{patch.player_name}_{app.jinja_env.filters['suuid'](room_id)}" \
                     f"{patch_file_ending}"
-            new_file.seek(0)
-            return send_file(new_file, as_attachment=True, download_name=fname)
+            return send_file(BytesIO(data), as_attachment=True, download_name=fname)
         else:
             return "Old Patch file, no longer compatible."
 
@@ -61,13 +139,14 @@ def download_slot_file(room_id, player_id: int):
     else:
         import io
 
+        data = get_slot_data(slot_data)
         if slot_data.game == "Minecraft":
             from worlds.minecraft import mc_update_output
             fname = f"AP_{app.jinja_env.filters['suuid'](room_id)}_P{slot_data.player_id}_{slot_data.player_name}.apmc"
-            data = mc_update_output(slot_data.data, server=app.config['PATCH_TARGET'], port=room.last_port)
+            data = mc_update_output(data, server=app.config['PATCH_TARGET'], port=room.last_port)
             return send_file(io.BytesIO(data), as_attachment=True, download_name=fname)
         elif slot_data.game == "Factorio":
-            with zipfile.ZipFile(io.BytesIO(slot_data.data)) as zf:
+            with zipfile.ZipFile(io.BytesIO(data)) as zf:
                 for name in zf.namelist():
                     if name.endswith("info.json"):
                         fname = name.rsplit("/", 1)[0] + ".zip"
@@ -83,7 +162,7 @@ def download_slot_file(room_id, player_id: int):
             fname = f"AP_{app.jinja_env.filters['suuid'](room_id)}.json"
         else:
             return "Game download not supported."
-        return send_file(io.BytesIO(slot_data.data), as_attachment=True, download_name=fname)
+        return send_file(io.BytesIO(data), as_attachment=True, download_name=fname)
 
 
 @app.route("/templates")
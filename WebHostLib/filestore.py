@@ -0,0 +1,65 @@
+import hashlib
+import os
+import threading
+import typing
+
+from . import app
+from .models import Slot
+
+
+class FileStore:
+    """Files in a directory, named by the sha256 of their contents. Identical files, like the patches of seeds
+    generated from the same options, only get stored once."""
+    chunk_size = 1024 * 1024
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def put(self, file: typing.BinaryIO) -> str:
+        """Copies file into the store in chunks, returns the digest to open it by."""
+        temp_path = os.path.join(self.directory, f"upload.{os.getpid()}.{threading.get_ident()}")
+        sha256 = hashlib.sha256()
+        with open(temp_path, "wb") as f:
+            for chunk in iter(lambda: file.read(self.chunk_size), b""):
+                sha256.update(chunk)
+                f.write(chunk)
+        digest = sha256.hexdigest()
+        path = self.get_path(digest)
+        if os.path.exists(path):
+            os.remove(temp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+        return digest
+
+    def open(self, digest: str) -> typing.BinaryIO:
+        return open(self.get_path(digest), "rb")
+
+    def read(self, digest: str) -> bytes:
+        with self.open(digest) as f:
+            return f.read()
+
+
+_file_store: typing.Optional[FileStore] = None
+
+
+def get_file_store() -> typing.Optional[FileStore]:
+    """Returns the FileStore of the FILE_STORE directory, None if uploads are kept in the database."""
+    global _file_store
+    if not _file_store and app.config["FILE_STORE"]:
+        _file_store = FileStore(app.config["FILE_STORE"])
+    return _file_store
+
+
+def get_slot_data(slot: Slot) -> typing.Optional[bytes]:
+    """Returns the data of slot, from the file store if it got uploaded there."""
+    if slot.file:
+        file_store = get_file_store()
+        if not file_store:
+            raise FileNotFoundError(f"Data of slot {slot.id} is in the file store, but FILE_STORE is not set.")
+        return file_store.read(slot.file.digest)
+    return slot.data
@@ -75,6 +75,8 @@ def generate(race=False):
                         state=STATE_QUEUED,
                         owner=session["_id"])
                     commit()
+                    from .autolauncher import notify_generation
+                    notify_generation()
 
                     return redirect(url_for("wait_seed", seed=gen.id))
                 else:
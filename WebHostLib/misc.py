@@ -7,7 +7,10 @@ from pony.orm import count, commit, db_session
 
 from worlds.AutoWorld import AutoWorldRegister
 from . import app, cache
+from .autolauncher import notify_room
+from .customserver import notify_room_commands
 from .models import Seed, Room, Command, UUID, uuid4
+from .stats import count_room_games
 
 
 def get_world_theme(game_name: str):
@@ -101,6 +104,7 @@ def new_room(seed: UUID):
         abort(404)
     room = Room(seed=seed, owner=session["_id"], tracker=uuid4())
     commit()
+    count_room_games(room)
     return redirect(url_for("host_room", room=room.id))
 
 
@@ -134,12 +138,16 @@ def host_room(room: UUID):
             if cmd:
                 Command(room=room, commandtext=cmd)
                 commit()
+                if room.last_port:
+                    notify_room_commands(room.id, room.last_port)
 
     now = datetime.datetime.utcnow()
     # indicate that the page should reload to get the assigned port
     should_refresh = not room.last_port and now - room.creation_time < datetime.timedelta(seconds=3)
     with db_session:
         room.last_activity = now  # will trigger a spinup, if it's not already running
+    commit()
+    notify_room(room.id)
 
     return render_template("hostRoom.html", room=room, should_refresh=should_refresh)
 
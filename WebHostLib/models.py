@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID, uuid4
 from pony.orm import Database, PrimaryKey, Required, Set, Optional, buffer, LongStr
 
@@ -14,10 +14,16 @@ class Slot(db.Entity):
     player_id = Required(int)
     player_name = Required(str)
     data = Optional(bytes, lazy=True)
+    file = Optional('SlotFile')
     seed = Optional('Seed')
     game = Required(str)
 
 
+class SlotFile(db.Entity):
+    slot = PrimaryKey(Slot)
+    digest = Required(str)  # of the slot's data in the FILE_STORE directory, which it has instead of Slot.data
+
+
 class Room(db.Entity):
     id = PrimaryKey(UUID, default=uuid4)
     last_activity = Required(datetime, default=lambda: datetime.utcnow(), index=True)
@@ -26,6 +32,8 @@ class Room(db.Entity):
     commands = Set('Command')
     seed = Required('Seed', index=True)
     multisave = Optional(buffer, lazy=True)
+    save_records = Set('SaveRecord')  # changes to multisave since it was written, in order of id
+    tracker_snapshots = Set('TrackerSnapshot')
     show_spoiler = Required(int, default=0)  # 0 -> never, 1 -> after completion, -> 2 always
     timeout = Required(int, default=lambda: 2 * 60 * 60)  # seconds since last activity to shutdown
     tracker = Optional(UUID, index=True)
@@ -43,6 +51,28 @@ class Seed(db.Entity):
     meta = Required(LongStr, default=lambda: "{\"race\": false}")  # additional meta information/tags
 
 
+class SaveRecord(db.Entity):
+    id = PrimaryKey(int, auto=True)
+    room = Required(Room, index=True)
+    data = Required(bytes)
+
+
+class TrackerSnapshot(db.Entity):
+    room = Required(Room)
+    team = Required(int)
+    slot = Required(int)
+    data = Required(bytes)  # what the tracker pages show of the slot, see customserver.TrackerData.get_snapshot
+    PrimaryKey(room, team, slot)
+
+
+class GameDailyCount(db.Entity):
+    """Slots of each game in the rooms created on a day, for the stats page."""
+    day = Required(date)
+    game = Required(str)
+    count = Required(int)
+    PrimaryKey(day, game)
+
+
 class Command(db.Entity):
     id = PrimaryKey(int, auto=True)
     room = Required(Room)
@@ -4,16 +4,17 @@ from colorsys import hsv_to_rgb
 from datetime import datetime, timedelta, date
 from math import tau
 
+import click
 from bokeh.colors import RGB
 from bokeh.embed import components
 from bokeh.models import HoverTool
 from bokeh.plotting import figure, ColumnDataSource
 from bokeh.resources import INLINE
 from flask import render_template
-from pony.orm import select
+from pony.orm import TransactionIntegrityError, commit, db_session, rollback, select
 
 from . import app, cache
-from .models import Room
+from .models import GameDailyCount, Room, Slot
 
 PLOT_WIDTH = 600
 
@@ -23,15 +24,59 @@ def get_db_data(known_games: typing.Set[str]) -> typing.Tuple[typing.Counter[str
     games_played = defaultdict(Counter)
     total_games = Counter()
     cutoff = date.today()-timedelta(days=30)
-    room: Room
-    for room in select(room for room in Room if room.creation_time >= cutoff):
-        for slot in room.seed.slots:
-            if slot.game in known_games:
-                total_games[slot.game] += 1
-                games_played[room.creation_time.date()][slot.game] += 1
+    for day, game, count in select((game_count.day, game_count.game, game_count.count)
+                                   for game_count in GameDailyCount if game_count.day >= cutoff):
+        if game in known_games:
+            total_games[game] += count
+            games_played[day][game] += count
     return total_games, games_played
 
 
+def add_game_counts(day: date, games: typing.Counter[str]):
+    """Adds to the counts of games played on day, committing each. Commit what else is pending first,
+    as adding the first count of a game on a day may have to be rolled back to add to one made at the same time."""
+    for game, count in games.items():
+        try:
+            add_game_count(day, game, count)
+            commit()
+        except TransactionIntegrityError:
+            # a room created at the same time added the first count of this game on this day, add to it instead
+            rollback()
+            add_game_count(day, game, count)
+            commit()
+
+
+def add_game_count(day: date, game: str, count: int):
+    game_count = GameDailyCount.get_for_update(day=day, game=game)
+    if game_count:
+        game_count.count += count
+    else:
+        GameDailyCount(day=day, game=game, count=count)
+
+
+def count_room_games(room: Room):
+    """Adds the slots of a newly created and committed room to the counts of games played per day."""
+    add_game_counts(room.creation_time.date(), Counter(slot.game for slot in room.seed.slots))
+
+
+@app.cli.command("backfill-stats")
+@db_session
+def backfill_stats():
+    """Counts the games played per day again from all rooms, for databases from before they were counted as rooms
+    got created. Run as `flask --app "WebHost:get_app()" backfill-stats`."""
+    GameDailyCount.select().delete(bulk=True)
+    games_played = defaultdict(Counter)
+    for creation_time, game in select((room.creation_time, slot.game) for room in Room
+                                      for slot in Slot if slot.seed == room.seed).without_distinct():
+        games_played[creation_time.date()][game] += 1
+    for day, games in games_played.items():
+        for game, count in games.items():
+            GameDailyCount(day=day, game=game, count=count)
+    commit()
+    click.echo(f"Counted {sum(sum(games.values()) for games in games_played.values())} slots "
+               f"over {len(games_played)} days.")
+
+
 def get_color_palette(colors_needed: int) -> typing.List[RGB]:
     colors = []
     # colors_needed +1 to prevent first and last color being too close to each other
@@ -1,19 +1,23 @@
 import collections
 import datetime
+import os
+import pickle
+import threading
 import typing
-from typing import Counter, Optional, Dict, Any, Tuple
+from typing import Counter, Optional, Dict, Any, List, Tuple
 from uuid import UUID
 
 from flask import render_template
 from werkzeug.exceptions import abort
 
-from MultiServer import Context
+from MultiServer import Context, restore_save
 from NetUtils import SlotType
 from Utils import restricted_loads
 from worlds import lookup_any_item_id_to_name, lookup_any_location_id_to_name
 from worlds.alttp import Items
 from . import app, cache
-from .models import Room
+from .customserver import TrackerData
+from .models import Room, SaveRecord, TrackerSnapshot
 
 alttp_icons = {
     "Blue Shield": r"https://www.zeldadungeon.net/wiki/images/8/85/Fighters-Shield.png",
@@ -212,21 +216,13 @@ del data
 del item
 
 
-def attribute_item(inventory, team, recipient, item):
-    target_item = links.get(item, item)
-    if item in levels:  # non-progressive
-        inventory[team][recipient][target_item] = max(inventory[team][recipient][target_item], levels[item])
-    else:
-        inventory[team][recipient][target_item] += 1
-
-
-def attribute_item_solo(inventory, item):
+def attribute_item_solo(inventory, item, count=1):
     """Adds item to inventory counter, converts everything to progressive."""
     target_item = links.get(item, item)
     if item in levels:  # non-progressive
         inventory[target_item] = max(inventory[target_item], levels[item])
     else:
-        inventory[target_item] += 1
+        inventory[target_item] += count
 
 
 @app.template_filter()
@@ -237,7 +233,76 @@ def render_timedelta(delta: datetime.timedelta):
     return f"{hours}:{minutes}"
 
 
-_multidata_cache = {}
+class StaticRoomDataCache:
+    """Least recently used get_static_room_data results, up to max_size bytes of pickled entries, which take a few
+    times that in memory. With a directory, entries also get pickled there for other processes to load,
+    instead of decompressing the multidata of the seed themselves."""
+
+    def __init__(self, max_size: int, directory: Optional[str] = None):
+        self.max_size = max_size
+        self.directory = directory
+        self.entries: typing.OrderedDict[UUID, Tuple[int, Tuple]] = collections.OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, seed_id: UUID) -> Optional[Tuple]:
+        with self.lock:
+            entry = self.entries.get(seed_id)
+            if entry:
+                self.entries.move_to_end(seed_id)
+                self.hits += 1
+                return entry[1]
+        if self.directory:
+            try:
+                with open(os.path.join(self.directory, f"{seed_id}.pickle"), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                result = restricted_loads(data)
+                self._add(seed_id, result, len(data))
+                self.disk_hits += 1
+                return result
+        self.misses += 1
+        return None
+
+    def put(self, seed_id: UUID, result: Tuple):
+        data = pickle.dumps(result)
+        if self.directory:
+            path = os.path.join(self.directory, f"{seed_id}.pickle")
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        self._add(seed_id, result, len(data))
+
+    def _add(self, seed_id: UUID, result: Tuple, size: int):
+        with self.lock:
+            if seed_id in self.entries:
+                self.size -= self.entries.pop(seed_id)[0]
+            self.entries[seed_id] = size, result
+            self.size += size
+            # keep the newest entry, even if it alone is over the limit
+            while self.size > self.max_size and len(self.entries) > 1:
+                self.size -= self.entries.popitem(last=False)[1][0]
+                self.evictions += 1
+
+
+_static_room_data_cache: Optional[StaticRoomDataCache] = None
+
+
+def get_static_room_data_cache() -> StaticRoomDataCache:
+    global _static_room_data_cache
+    if not _static_room_data_cache:
+        _static_room_data_cache = StaticRoomDataCache(app.config["TRACKER_CACHE_SIZE"],
+                                                      app.config["TRACKER_CACHE_PATH"])
+    return _static_room_data_cache
 
 
 def get_location_table(checks_table: dict) -> dict:
@@ -251,7 +316,8 @@ def get_location_table(checks_table: dict) -> dict:
 
 
 def get_static_room_data(room: Room):
-    result = _multidata_cache.get(room.seed.id, None)
+    static_room_data_cache = get_static_room_data_cache()
+    result = static_room_data_cache.get(room.seed.id)
     if result:
         return result
     multidata = Context.decompress(room.seed.multidata)
@@ -281,14 +347,60 @@ def get_static_room_data(room: Room):
                                for playernumber in range(1, len(names[0]) + 1)
                                if playernumber not in groups}
 
+    # slot_data may be decoded lazily from multidata, keeping all of it referenced
+    slot_data = dict(multidata["slot_data"])
     result = locations, names, use_door_tracker, player_checks_in_area, player_location_to_area, \
-             multidata["precollected_items"], multidata["games"], multidata["slot_data"], groups
-    _multidata_cache[room.seed.id] = result
+             multidata["precollected_items"], multidata["games"], slot_data, groups
+    static_room_data_cache.put(room.seed.id, result)
     return result
 
 
+def get_multisave(room: Room) -> Dict[str, Any]:
+    """Returns the save of a room, with the records written since its last snapshot applied."""
+    if not room.multisave:
+        return {}
+    return restore_save(restricted_loads(room.multisave),
+                        [record.data for record in room.save_records.order_by(SaveRecord.id)])
+
+
+def count_tracker_snapshots(room: Room) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """Returns what the tracker pages show of each slot of a room, counted from its save,
+    for rooms whose server has not saved their snapshots yet."""
+    locations, names, use_door_tracker, seed_checks_in_area, player_location_to_area, \
+        precollected_items, games, slot_data, groups = get_static_room_data(room)
+    multisave = get_multisave(room)
+    tracker_data = TrackerData(locations, groups, player_location_to_area)
+    for (team, slot), locations_checked in multisave.get("location_checks", {}).items():
+        tracker_data.check_locations(team, slot, locations_checked)
+    return tracker_data.get_snapshot(multisave)
+
+
+def get_tracker_snapshots(room: Room) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """Returns what the tracker pages show of each slot of a room, see TrackerData.get_snapshot."""
+    snapshots = {(tracker_snapshot.team, tracker_snapshot.slot): restricted_loads(tracker_snapshot.data)
+                 for tracker_snapshot in room.tracker_snapshots}
+    return snapshots if snapshots else count_tracker_snapshots(room)
+
+
+def get_slot_tracker_snapshot(room: Room, team: int, slot: int) -> Dict[str, Any]:
+    """Returns what the tracker pages show of a slot of a room, see TrackerData.get_snapshot."""
+    tracker_snapshot = TrackerSnapshot.get(room=room, team=team, slot=slot)
+    if tracker_snapshot:
+        return restricted_loads(tracker_snapshot.data)
+    return count_tracker_snapshots(room).get((team, slot), {})
+
+
+def get_inventory(snapshot: Dict[str, Any], precollected_items: Dict[int, List[int]], player: int) -> Counter:
+    inventory = collections.Counter()
+    for item_id in precollected_items.get(player, ()):
+        attribute_item_solo(inventory, item_id)
+    for item_id, count in snapshot.get("inventory", {}).items():
+        attribute_item_solo(inventory, item_id, count)
+    return inventory
+
+
 @app.route('/tracker/<suuid:tracker>/<int:tracked_team>/<int:tracked_player>')
-@cache.memoize(timeout=60)  # multisave is currently created at most every minute
+@cache.memoize(timeout=60)  # tracker snapshots are currently saved at most every minute
 def getPlayerTracker(tracker: UUID, tracked_team: int, tracked_player: int, want_generic: bool = False):
     # Team and player must be positive and greater than zero
     if tracked_team < 0 or tracked_player < 1:
@@ -302,46 +414,17 @@ def getPlayerTracker(tracker: UUID, tracked_team: int, tracked_player: int, want
     locations, names, use_door_tracker, seed_checks_in_area, player_location_to_area, \
         precollected_items, games, slot_data, groups = get_static_room_data(room)
     player_name = names[tracked_team][tracked_player - 1]
-    location_to_area = player_location_to_area[tracked_player]
-    inventory = collections.Counter()
+    snapshot = get_slot_tracker_snapshot(room, tracked_team, tracked_player)
+    inventory = get_inventory(snapshot, precollected_items, tracked_player)
     checks_done = {loc_name: 0 for loc_name in default_locations}
+    checks_done.update(snapshot.get("checks_done", {}))
 
-    # Add starting items to inventory
-    starting_items = precollected_items[tracked_player]
-    if starting_items:
-        for item_id in starting_items:
-            attribute_item_solo(inventory, item_id)
-
-    if room.multisave:
-        multisave: Dict[str, Any] = restricted_loads(room.multisave)
-    else:
-        multisave: Dict[str, Any] = {}
-
-    slots_aimed_at_player = {tracked_player}
-    for group_id, group_members in groups.items():
-        if tracked_player in group_members:
-            slots_aimed_at_player.add(group_id)
-
-    # Add items to player inventory
-    for (ms_team, ms_player), locations_checked in multisave.get("location_checks", {}).items():
-        # Skip teams and players not matching the request
-        player_locations = locations[ms_player]
-        if ms_team == tracked_team:
-            # If the player does not have the item, do nothing
-            for location in locations_checked:
-                if location in player_locations:
-                    item, recipient, flags = player_locations[location]
-                    if recipient in slots_aimed_at_player:  # a check done for the tracked player
-                        attribute_item_solo(inventory, item)
-                    if ms_player == tracked_player:  # a check done by the tracked player
-                        checks_done[location_to_area[location]] += 1
-                        checks_done["Total"] += 1
     specific_tracker = game_specific_trackers.get(games[tracked_player], None)
     if specific_tracker and not want_generic:
-        return specific_tracker(multisave, room, locations, inventory, tracked_team, tracked_player, player_name,
+        return specific_tracker(snapshot, room, locations, inventory, tracked_team, tracked_player, player_name,
                                 seed_checks_in_area, checks_done, slot_data[tracked_player])
     else:
-        return __renderGenericTracker(multisave, room, locations, inventory, tracked_team, tracked_player, player_name,
+        return __renderGenericTracker(snapshot, room, locations, inventory, tracked_team, tracked_player, player_name,
                                       seed_checks_in_area, checks_done)
 
 
@@ -350,12 +433,12 @@ def get_generic_tracker(tracker: UUID, tracked_team: int, tracked_player: int):
     return getPlayerTracker(tracker, tracked_team, tracked_player, True)
 
 
-def __renderAlttpTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderAlttpTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                          inventory: Counter, team: int, player: int, player_name: str,
                          seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int], slot_data: Dict) -> str:
 
     # Note the presence of the triforce item
-    game_state = multisave.get("client_game_state", {}).get((team, player), 0)
+    game_state = snapshot.get("game_state", 0)
     if game_state == 30:
         inventory[106] = 1  # Triforce
 
@@ -412,7 +495,7 @@ def __renderAlttpTracker(multisave: Dict[str, Any], room: Room, locations: Dict[
                             **display_data)
 
 
-def __renderMinecraftTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderMinecraftTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                              inventory: Counter, team: int, player: int, playerName: str,
                              seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int], slot_data: Dict) -> str:
 
@@ -491,11 +574,11 @@ def __renderMinecraftTracker(multisave: Dict[str, Any], room: Room, locations: D
             display_data[base_name + "_count"] = count
 
     # Victory condition
-    game_state = multisave.get("client_game_state", {}).get((team, player), 0)
+    game_state = snapshot.get("game_state", 0)
     display_data['game_finished'] = game_state == 30
 
     # Turn location IDs into advancement tab counts
-    checked_locations = multisave.get("location_checks", {}).get((team, player), set())
+    checked_locations = snapshot.get("location_checks", set())
     lookup_name = lambda id: lookup_any_location_id_to_name[id]
     location_info = {tab_name: {lookup_name(id): (id in checked_locations) for id in tab_locations}
                         for tab_name, tab_locations in minecraft_location_ids.items()}
@@ -514,7 +597,7 @@ def __renderMinecraftTracker(multisave: Dict[str, Any], room: Room, locations: D
                             **display_data)
 
 
-def __renderOoTTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderOoTTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                        inventory: Counter, team: int, player: int, playerName: str,
                        seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int], slot_data: Dict) -> str:
 
@@ -654,7 +737,7 @@ def __renderOoTTracker(multisave: Dict[str, Any], room: Room, locations: Dict[in
             return full_name[len(area):]
         return full_name
 
-    checked_locations = multisave.get("location_checks", {}).get((team, player), set()).intersection(set(locations[player]))
+    checked_locations = snapshot.get("location_checks", set()).intersection(set(locations[player]))
     location_info = {area: {lookup_and_trim(id, area): id in checked_locations for id in range(min_id, max_id+1) if id in locations[player]} 
         for area, (min_id, max_id) in area_id_ranges.items()}
     checks_done = {area: len(list(filter(lambda x: x, location_info[area].values()))) for area in area_id_ranges}
@@ -671,7 +754,7 @@ def __renderOoTTracker(multisave: Dict[str, Any], room: Room, locations: Dict[in
     checks_in_area['Total'] = sum(checks_in_area.values())
 
     # Give skulltulas on non-tracked locations
-    non_tracked_locations = multisave.get("location_checks", {}).get((team, player), set()).difference(set(locations[player]))
+    non_tracked_locations = snapshot.get("location_checks", set()).difference(set(locations[player]))
     for id in non_tracked_locations:
         if "GS" in lookup_and_trim(id, ''):
             display_data["token_count"] += 1
@@ -698,7 +781,7 @@ def __renderOoTTracker(multisave: Dict[str, Any], room: Room, locations: Dict[in
     }
 
     # Victory condition
-    game_state = multisave.get("client_game_state", {}).get((team, player), 0)
+    game_state = snapshot.get("game_state", 0)
     display_data['game_finished'] = game_state == 30
 
     return render_template("ootTracker.html",
@@ -709,7 +792,7 @@ def __renderOoTTracker(multisave: Dict[str, Any], room: Room, locations: Dict[in
                            **display_data)
 
 
-def __renderTimespinnerTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderTimespinnerTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                                inventory: Counter, team: int, player: int, playerName: str,
                                seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int], slot_data: Dict[str, Any]) -> str:
 
@@ -793,11 +876,11 @@ def __renderTimespinnerTracker(multisave: Dict[str, Any], room: Room, locations:
     display_data = {}
 
     # Victory condition
-    game_state = multisave.get("client_game_state", {}).get((team, player), 0)
+    game_state = snapshot.get("game_state", 0)
     display_data['game_finished'] = game_state == 30
 
     # Turn location IDs into advancement tab counts
-    checked_locations = multisave.get("location_checks", {}).get((team, player), set())
+    checked_locations = snapshot.get("location_checks", set())
     lookup_name = lambda id: lookup_any_location_id_to_name[id]
     location_info = {tab_name: {lookup_name(id): (id in checked_locations) for id in tab_locations}
                         for tab_name, tab_locations in timespinner_location_ids.items()}
@@ -815,7 +898,7 @@ def __renderTimespinnerTracker(multisave: Dict[str, Any], room: Room, locations:
                             checks_done=checks_done, checks_in_area=checks_in_area, location_info=location_info,
                             options=options, **display_data)
 
-def __renderSuperMetroidTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderSuperMetroidTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                                 inventory: Counter, team: int, player: int, playerName: str,
                                 seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int], slot_data: Dict) -> str:
 
@@ -893,11 +976,11 @@ def __renderSuperMetroidTracker(multisave: Dict[str, Any], room: Room, locations
         display_data[base_name+"_count"] = inventory[item_id]
 
     # Victory condition
-    game_state = multisave.get("client_game_state", {}).get((team, player), 0)
+    game_state = snapshot.get("game_state", 0)
     display_data['game_finished'] = game_state == 30
 
     # Turn location IDs into advancement tab counts
-    checked_locations = multisave.get("location_checks", {}).get((team, player), set())
+    checked_locations = snapshot.get("location_checks", set())
     lookup_name = lambda id: lookup_any_location_id_to_name[id]
     location_info = {tab_name: {lookup_name(id): (id in checked_locations) for id in tab_locations}
                      for tab_name, tab_locations in supermetroid_location_ids.items()}
@@ -915,17 +998,14 @@ def __renderSuperMetroidTracker(multisave: Dict[str, Any], room: Room, locations
                             checks_done=checks_done, checks_in_area=checks_in_area, location_info=location_info,
                             **display_data)
 
-def __renderGenericTracker(multisave: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
+def __renderGenericTracker(snapshot: Dict[str, Any], room: Room, locations: Dict[int, Dict[int, Tuple[int, int, int]]],
                            inventory: Counter, team: int, player: int, playerName: str,
                            seed_checks_in_area: Dict[int, Dict[str, int]], checks_done: Dict[str, int]) -> str:
 
-    checked_locations = multisave.get("location_checks", {}).get((team, player), set())
+    checked_locations = snapshot.get("location_checks", set())
     player_received_items = {}
-    if multisave.get('version', 0) > 0:
-        # add numbering to all items but starter_inventory
-        ordered_items = multisave.get('received_items', {}).get((team, player, True), [])
-    else:
-        ordered_items = multisave.get('received_items', {}).get((team, player), [])
+    # add numbering to all items but starter_inventory
+    ordered_items = snapshot.get("received_items", [])
 
     for order_index, networkItem in enumerate(ordered_items, start=1):
         player_received_items[networkItem.item] = order_index
@@ -939,7 +1019,7 @@ def __renderGenericTracker(multisave: Dict[str, Any], room: Room, locations: Dic
 
 
 @app.route('/tracker/<suuid:tracker>')
-@cache.memoize(timeout=60)  # multisave is currently created at most every minute
+@cache.memoize(timeout=60)  # tracker snapshots are currently saved at most every minute
 def getTracker(tracker: UUID):
     room: Room = Room.get(tracker=tracker)
     if not room:
@@ -947,45 +1027,27 @@ def getTracker(tracker: UUID):
     locations, names, use_door_tracker, seed_checks_in_area, player_location_to_area, \
         precollected_items, games, slot_data, groups = get_static_room_data(room)
 
-    inventory = {teamnumber: {playernumber: collections.Counter() for playernumber in range(1, len(team) + 1) if playernumber not in groups}
+    snapshots = get_tracker_snapshots(room)
+    inventory = {teamnumber: {playernumber: get_inventory(snapshots.get((teamnumber, playernumber), {}),
+                                                          precollected_items, playernumber)
+                              for playernumber in range(1, len(team) + 1) if playernumber not in groups}
                  for teamnumber, team in enumerate(names)}
 
     checks_done = {teamnumber: {playernumber: {loc_name: 0 for loc_name in default_locations}
                                 for playernumber in range(1, len(team) + 1) if playernumber not in groups}
                    for teamnumber, team in enumerate(names)}
+    for (team, player), snapshot in snapshots.items():
+        if player not in groups:
+            checks_done[team][player].update(snapshot.get("checks_done", {}))
 
     hints = {team: set() for team in range(len(names))}
-    if room.multisave:
-        multisave = restricted_loads(room.multisave)
-    else:
-        multisave = {}
-    if "hints" in multisave:
-        for (team, slot), slot_hints in multisave["hints"].items():
-            hints[team] |= set(slot_hints)
+    for (team, slot), snapshot in snapshots.items():
+        hints[team] |= snapshot.get("hints", set())
 
-    for (team, player), locations_checked in multisave.get("location_checks", {}).items():
+    for (team, player), snapshot in snapshots.items():
         if player in groups:
             continue
-        player_locations = locations[player]
-        if precollected_items:
-            precollected = precollected_items[player]
-            for item_id in precollected:
-                attribute_item(inventory, team, player, item_id)
-        for location in locations_checked:
-            if location not in player_locations or location not in player_location_to_area[player]:
-                continue
-
-            item, recipient, flags = player_locations[location]
-
-            if recipient in names:
-                attribute_item(inventory, team, recipient, item)
-            checks_done[team][player][player_location_to_area[player][location]] += 1
-            checks_done[team][player]["Total"] += 1
-
-    for (team, player), game_state in multisave.get("client_game_state", {}).items():
-        if player in groups:
-            continue
-        if game_state == 30:
+        if snapshot.get("game_state", 0) == 30:
             inventory[team][player][106] = 1  # Triforce
 
     player_big_key_locations = {playernumber: set() for playernumber in range(1, len(names[0]) + 1)}
@@ -1006,21 +1068,23 @@ def getTracker(tracker: UUID):
 
     activity_timers = {}
     now = datetime.datetime.utcnow()
-    for (team, player), timestamp in multisave.get("client_activity_timers", []):
-        activity_timers[team, player] = now - datetime.datetime.utcfromtimestamp(timestamp)
+    for (team, player), snapshot in snapshots.items():
+        if snapshot.get("activity_timer") is not None:
+            activity_timers[team, player] = now - datetime.datetime.utcfromtimestamp(snapshot["activity_timer"])
 
     player_names = {}
     for team, names in enumerate(names):
         for player, name in enumerate(names, 1):
             player_names[(team, player)] = name
     long_player_names = player_names.copy()
-    for (team, player), alias in multisave.get("name_aliases", {}).items():
-        player_names[(team, player)] = alias
-        long_player_names[(team, player)] = f"{alias} ({long_player_names[(team, player)]})"
-
     video = {}
-    for (team, player), data in multisave.get("video", []):
-        video[(team, player)] = data
+    for (team, player), snapshot in snapshots.items():
+        alias = snapshot.get("alias")
+        if alias is not None:
+            player_names[(team, player)] = alias
+            long_player_names[(team, player)] = f"{alias} ({long_player_names[(team, player)]})"
+        if snapshot.get("video") is not None:
+            video[(team, player)] = snapshot["video"]
 
     return render_template("tracker.html", inventory=inventory, get_item_name_from_id=lookup_any_item_id_to_name,
                            lookup_id_to_name=Items.lookup_id_to_name, player_names=player_names,
@@ -13,14 +13,32 @@ from NetUtils import NetworkSlot, SlotType
 from Utils import VersionException, __version__
 from worlds.Files import AutoPatchRegister
 from . import app
-from .models import Seed, Room, Slot
+from .filestore import FileStore, get_file_store
+from .models import Seed, Room, Slot, SlotFile
 
 banned_zip_contents = (".sfc",)
 
 
+def store_member(zfile: zipfile.ZipFile, file: zipfile.ZipInfo, file_store: typing.Optional[FileStore]) \
+        -> typing.Tuple[typing.Optional[bytes], typing.Optional[str]]:
+    """Returns the data of the member to keep in the database, or streams it into file_store and returns its digest."""
+    with zfile.open(file, "r") as f:
+        if file_store:
+            return None, file_store.put(f)
+        return f.read(), None
+
+
+def create_slot(data: typing.Optional[bytes], digest: typing.Optional[str], **kwargs) -> Slot:
+    slot = Slot(data=data, **kwargs)
+    if digest:
+        SlotFile(slot=slot, digest=digest)
+    return slot
+
+
 def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, sid=None):
     if not owner:
         owner = session["_id"]
+    file_store = get_file_store()
     infolist = zfile.infolist()
     slots: typing.Set[Slot] = set()
     spoiler = ""
@@ -31,13 +49,15 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
             return "Uploaded data contained a rom file, which is likely to contain copyrighted material. " \
                    "Your file was deleted."
         elif handler:
-            raw = zfile.open(file, "r").read()
-            patch = handler(BytesIO(raw))
-            patch.read()
-            slots.add(Slot(data=raw,
-                           player_name=patch.player_name,
-                           player_id=patch.player,
-                           game=patch.game))
+            data, digest = store_member(zfile, file, file_store)
+            patch = handler()
+            # only the manifest gets read, from the central directory of the patch
+            with BytesIO(data) if data is not None else file_store.open(digest) as f:
+                patch.read_manifest(f)
+            slots.add(create_slot(data, digest,
+                                  player_name=patch.player_name,
+                                  player_id=patch.player,
+                                  game=patch.game))
 
         elif file.filename.endswith(".apmc"):
             data = zfile.open(file, "r").read()
@@ -49,30 +69,30 @@ def upload_zip_to_db(zfile: zipfile.ZipFile, owner=None, meta={"race": False}, s
 
         elif file.filename.endswith(".apv6"):
             _, seed_name, slot_id, slot_name = file.filename.split('.')[0].split('_', 3)
-            slots.add(Slot(data=zfile.open(file, "r").read(), player_name=slot_name,
-                           player_id=int(slot_id[1:]), game="VVVVVV"))
+            slots.add(create_slot(*store_member(zfile, file, file_store), player_name=slot_name,
+                                  player_id=int(slot_id[1:]), game="VVVVVV"))
 
         elif file.filename.endswith(".apsm64ex"):
             _, seed_name, slot_id, slot_name = file.filename.split('.')[0].split('_', 3)
-            slots.add(Slot(data=zfile.open(file, "r").read(), player_name=slot_name,
-                           player_id=int(slot_id[1:]), game="Super Mario 64"))
+            slots.add(create_slot(*store_member(zfile, file, file_store), player_name=slot_name,
+                                  player_id=int(slot_id[1:]), game="Super Mario 64"))
 
         elif file.filename.endswith(".zip"):
             # Factorio mods need a specific name or they do not function
             _, seed_name, slot_id, slot_name = file.filename.rsplit("_", 1)[0].split("-", 3)
-            slots.add(Slot(data=zfile.open(file, "r").read(), player_name=slot_name,
-                           player_id=int(slot_id[1:]), game="Factorio"))
+            slots.add(create_slot(*store_member(zfile, file, file_store), player_name=slot_name,
+                                  player_id=int(slot_id[1:]), game="Factorio"))
 
         elif file.filename.endswith(".apz5"):
             # .apz5 must be named specifically since they don't contain any metadata
             _, seed_name, slot_id, slot_name = file.filename.split('.')[0].split('_', 3)
-            slots.add(Slot(data=zfile.open(file, "r").read(), player_name=slot_name,
-                           player_id=int(slot_id[1:]), game="Ocarina of Time"))
+            slots.add(create_slot(*store_member(zfile, file, file_store), player_name=slot_name,
+                                  player_id=int(slot_id[1:]), game="Ocarina of Time"))
 
         elif file.filename.endswith(".json"):
             _, seed_name, slot_id, slot_name = file.filename.split('.')[0].split('-', 3)
-            slots.add(Slot(data=zfile.open(file, "r").read(), player_name=slot_name,
-                           player_id=int(slot_id[1:]), game="Dark Souls III"))
+            slots.add(create_slot(*store_member(zfile, file, file_store), player_name=slot_name,
+                                  player_id=int(slot_id[1:]), game="Dark Souls III"))
 
         elif file.filename.endswith(".txt"):
             spoiler = zfile.open(file, "r").read().decode("utf-8-sig")
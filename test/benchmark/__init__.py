@@ -0,0 +1,4 @@
+"""
+Benchmarks for fill, progression balancing and the spoiler playthrough over synthetic and template multiworlds.
+Not collected by the unit tests, run with `python -m test.benchmark --help` from the Archipelago directory.
+"""
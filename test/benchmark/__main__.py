@@ -0,0 +1,127 @@
+import argparse
+import functools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import typing
+
+import ModuleUpdate
+ModuleUpdate.update_ran = True  # don't upgrade
+import Utils
+Utils.local_path.cached_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from .network import run_encode
+from .server import run_connect_storm, run_server
+from .worlds import Timings, run_synthetic, run_templates
+
+default_games = ["Hollow Knight", "Factorio", "Minecraft", "Raft", "Risk of Rain 2", "Rogue Legacy", "Subnautica",
+                 "Timespinner"]
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Times fill, progression balancing and the playthrough over "
+                                                 "synthetic multiworlds and players made from playerSettings.yaml, "
+                                                 "location checks on a server with simulated clients and encoding "
+                                                 "network packets.")
+    parser.add_argument("--players", nargs="*", type=int, default=[5, 25],
+                        help="Player counts of the synthetic multiworlds, none to skip them.")
+    parser.add_argument("--locations", nargs="+", type=int, default=[200],
+                        help="Locations per player of the synthetic multiworlds.")
+    parser.add_argument("--rule_density", nargs="+", type=float, default=[0.5],
+                        help="Chance of a synthetic entrance to need items, locations need items at a quarter of it.")
+    parser.add_argument("--link_groups", nargs="+", type=int, default=[0, 2],
+                        help="Item link groups in the synthetic multiworlds.")
+    parser.add_argument("--games", nargs="*", default=default_games,
+                        help="Games to generate from playerSettings.yaml with default options, none to skip. "
+                             "Games that need a rom to output, like A Link to the Past, need that rom present.")
+    parser.add_argument("--copies", type=int, default=2, help="Players per game from playerSettings.yaml.")
+    parser.add_argument("--spoiler", type=int, default=2,
+                        help="Spoiler level of the template generations, below 2 skips the playthrough.")
+    parser.add_argument("--clients", nargs="*", type=int, default=[500],
+                        help="Connected clients of the simulated servers, none to skip them.")
+    parser.add_argument("--items", nargs="*", type=int, default=[10000],
+                        help="Items of the encoded ReceivedItems packets, none to skip encoding.")
+    parser.add_argument("--seeds", type=int, default=3, help="Runs per scenario, the median is reported.")
+    parser.add_argument("--output", help="Write the results as json to this file instead of stdout.")
+    parser.add_argument("--compare", help="Results json of an earlier run to compare the medians against.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown against --compare that counts as a regression.")
+    parser.add_argument("--log_level", default="warning", help="Log level of the template generations.")
+    return parser.parse_args()
+
+
+def get_scenarios(args: argparse.Namespace) -> typing.Dict[str, typing.Callable[[int], Timings]]:
+    scenarios: typing.Dict[str, typing.Callable[[int], Timings]] = {}
+    for players in args.players:
+        for locations in args.locations:
+            for rule_density in args.rule_density:
+                for link_groups in args.link_groups:
+                    name = f"synthetic-p{players}-l{locations}-r{rule_density}-g{link_groups}"
+                    scenarios[name] = functools.partial(run_synthetic, players, locations, rule_density, link_groups)
+    if args.games:
+        scenarios[f"templates-{len(args.games)}x{args.copies}"] = \
+            functools.partial(run_templates, args.games, args.copies, spoiler=args.spoiler, log_level=args.log_level)
+    for clients in args.clients:
+        scenarios[f"server-c{clients}"] = functools.partial(run_server, clients)
+        scenarios[f"connect-storm-c{clients}"] = functools.partial(run_connect_storm, clients)
+    for items in args.items:
+        scenarios[f"network-i{items}"] = functools.partial(run_encode, items)
+    return scenarios
+
+
+def compare(medians: typing.Dict[str, Timings], baseline: typing.Dict[str, Timings],
+            threshold: float) -> typing.List[str]:
+    """Returns a description of each timing that got slower than threshold times its baseline."""
+    regressions = []
+    for scenario, timings in medians.items():
+        for name, value in timings.items():
+            old = baseline.get(scenario, {}).get(name)
+            # ignore anything too fast to measure reliably
+            if old and value > 0.01 and value > old * threshold:
+                regressions.append(f"{scenario} {name}: {old:.3f}s -> {value:.3f}s ({value / old:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    args = parse_arguments()
+    logging.basicConfig(level=logging.WARNING)
+    results: typing.List[typing.Dict[str, typing.Any]] = []
+    medians: typing.Dict[str, Timings] = {}
+    for scenario, run in get_scenarios(args).items():
+        runs: typing.List[Timings] = []
+        for seed in range(args.seeds):
+            try:
+                timings = run(seed)
+            except Exception as e:
+                logging.exception(f"{scenario} failed for seed {seed}.")
+                results.append({"scenario": scenario, "seed": seed, "error": f"{e.__class__.__name__}: {e}"})
+                continue
+            runs.append(timings)
+            results.append({"scenario": scenario, "seed": seed, "timings": timings})
+        if runs:
+            medians[scenario] = {name: statistics.median(timings[name] for timings in runs) for name in runs[0]}
+            print(f"{scenario}: " + ", ".join(f"{name} {value:.4g}s" for name, value in medians[scenario].items()),
+                  file=sys.stderr)
+
+    data = {"version": Utils.__version__, "python": platform.python_version(), "results": results,
+            "medians": medians}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+    else:
+        print(json.dumps(data, indent=2))
+
+    failed = any("error" in result for result in results)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(medians, json.load(f)["medians"], args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+import random
+import time
+
+import NetUtils
+from NetUtils import NetworkItem, NetworkPlayer, NetworkSlot, SlotType, decode, encode
+from .worlds import Timings
+
+
+def create_packets(items: int, seed: int) -> list:
+    """Builds a Connected packet of a 100 slot room and a ReceivedItems packet with `items` items."""
+    random.seed(seed)
+    slots = range(1, 101)
+    connected = {
+        "cmd": "Connected", "team": 0, "slot": 1,
+        "players": [NetworkPlayer(0, slot, f"Player{slot}", f"Player{slot}") for slot in slots],
+        "missing_locations": random.sample(range(100000), 1000),
+        "checked_locations": random.sample(range(100000, 200000), 1000),
+        "slot_data": {"goal": 1, "options": {str(index): index for index in range(100)}},
+        "slot_info": {slot: NetworkSlot(f"Player{slot}", "Archipelago", SlotType.player) for slot in slots},
+    }
+    received_items = {
+        "cmd": "ReceivedItems", "index": 0,
+        "items": [NetworkItem(random.randrange(100000), random.randrange(100000), random.choice(slots),
+                              random.randrange(8)) for _ in range(items)],
+    }
+    return [connected, received_items]
+
+
+def run_encode(items: int, seed: int, repeat: int = 20) -> Timings:
+    """Times encode and decode of the packets of create_packets, per packet, and each encoder on its own."""
+    packets = create_packets(items, seed)
+    encoders = {"encode": encode, "encode_python": NetUtils._encode_python}
+    if NetUtils.orjson:
+        encoders["encode_orjson"] = NetUtils._encode_orjson
+    timings: Timings = {}
+    for name, encoder in encoders.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            encoder(packets)
+        timings[name] = (time.perf_counter() - start) / repeat
+    msg = encode(packets)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(msg)
+    timings["decode"] = (time.perf_counter() - start) / repeat
+    return timings
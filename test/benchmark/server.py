@@ -0,0 +1,78 @@
+import asyncio
+import random
+import time
+
+from MultiServer import Client, Context, process_client_cmd, register_location_checks
+from NetUtils import NetworkSlot, SlotType
+from .worlds import Timings
+
+
+class OpenSocket:
+    """Stands in for the websocket of a simulated client, queued messages get dropped before they would be sent."""
+    open = True
+
+
+def create_server(clients: int, locations: int, seed: int) -> Context:
+    """Builds a server context of one team with a slot and a connected client per simulated client.
+    Each slot has `locations` locations, each holding an item for a random slot."""
+    random.seed(seed)
+    ctx = Context("", 0, "", "", 0, 0, False)
+    slots = range(1, clients + 1)
+    ctx.clients = {0: {}}
+    for slot in slots:
+        name = f"Player{slot}"
+        ctx.player_names[0, slot] = name
+        ctx.player_name_lookup[name] = 0, slot
+        ctx.games[slot] = "Archipelago"
+        ctx.slot_info[slot] = NetworkSlot(name, "Archipelago", SlotType.player)
+        ctx.locations[slot] = {slot * locations + location: (location, random.choice(slots), 0)
+                               for location in range(locations)}
+        client = Client(OpenSocket(), ctx)
+        client.auth = True
+        client.team = 0
+        client.slot = slot
+        client.remote_items = True
+        client.remote_start_inventory = True
+        client.no_items = False
+        client.no_locations = False
+        ctx.endpoints.append(client)
+        ctx.clients[0][slot] = [client]
+    ctx._index_locations()
+    return ctx
+
+
+def run_server(clients: int, seed: int, checks: int = 1000) -> Timings:
+    """Times register_location_checks for single location checks of random slots with all clients connected."""
+    ctx = create_server(clients, 100, seed)
+    unchecked = [(slot, location) for slot, locations in ctx.locations.items() for location in locations]
+    random.shuffle(unchecked)
+
+    async def check() -> float:
+        total = 0.0
+        for slot, location in unchecked[:checks]:
+            start = time.perf_counter()
+            register_location_checks(ctx, 0, slot, [location])
+            total += time.perf_counter() - start
+            ctx.outbound_msgs.clear()
+        return total
+
+    return {"register_location_checks": asyncio.run(check()) / min(checks, len(unchecked))}
+
+
+def run_connect_storm(clients: int, seed: int) -> Timings:
+    """Times answering the GetDataPackage of `clients` clients connecting at once,
+    half asking for all games and half for the games of their multiworld."""
+    ctx = create_server(clients, 1, seed)
+    random.seed(seed)
+    games = list(ctx.gamespackage)
+    multiworld_games = random.sample(games, min(10, len(games)))
+
+    async def connect() -> float:
+        start = time.perf_counter()
+        for index, client in enumerate(ctx.endpoints):
+            await process_client_cmd(ctx, client, {"cmd": "GetDataPackage"} if index % 2 else
+                                     {"cmd": "GetDataPackage", "games": multiworld_games})
+        ctx.outbound_msgs.clear()
+        return time.perf_counter() - start
+
+    return {"datapackage": asyncio.run(connect())}
@@ -0,0 +1,157 @@
+import logging
+import os
+import time
+import typing
+from tempfile import TemporaryDirectory
+
+import Generate
+import Utils
+from BaseClasses import CollectionState, Entrance, Item, ItemClassification, Location, MultiWorld, Region, \
+    RegionType
+from Fill import balance_multiworld_progression, fill_restrictive, remaining_fill
+from Main import create_playthrough
+from worlds.generic import GenericWorld
+from worlds.generic.Rules import Has, HasAll, set_rule
+
+Timings = typing.Dict[str, float]
+
+
+def timed(timings: Timings, name: str, function: typing.Callable[..., typing.Any], *args: typing.Any) -> typing.Any:
+    start = time.perf_counter()
+    result = function(*args)
+    timings[name] = time.perf_counter() - start
+    return result
+
+
+def generate_synthetic_world(players: int, locations: int, rule_density: float, link_groups: int,
+                             seed: int) -> typing.Tuple[MultiWorld, typing.List[Item]]:
+    """
+    Builds a multiworld of generic players with `locations` locations each, spread over regions of about 10 locations.
+    A fifth of each player's items are progression keys, rule_density is the chance of an entrance needing keys.
+    Beating a player's game needs the first half of their keys.
+    Each item link group shares three keys of up to three players, like Main does for item_links.
+    Returns the multiworld and its item pool.
+    """
+    multiworld = MultiWorld(players)
+    multiworld.player_name = {}
+    for player in multiworld.player_ids:
+        multiworld.game[player] = GenericWorld.game
+        multiworld.worlds[player] = GenericWorld(multiworld, player)
+        multiworld.player_name[player] = f"Player{player}"
+    multiworld.set_seed(seed)
+    multiworld.set_default_common_options()
+    random = multiworld.random
+
+    itempool: typing.List[Item] = []
+    keys = [f"Key {index}" for index in range(max(1, locations // 5))]
+    region_count = max(1, locations // 10)
+    for player in multiworld.player_ids:
+        regions = [Region("Menu", RegionType.Generic, "Menu", player, multiworld)]
+        for index in range(1, region_count):
+            parent = random.choice(regions)
+            region = Region(f"Region {index}", RegionType.Generic, f"Region {index}", player, multiworld)
+            entrance = Entrance(player, f"To Region {index}", parent)
+            parent.exits.append(entrance)
+            entrance.connect(region)
+            if random.random() < rule_density:
+                set_rule(entrance, HasAll(random.sample(keys, random.randint(1, min(2, len(keys)))), player))
+            regions.append(region)
+        for index in range(locations):
+            region = regions[index % region_count]
+            location = Location(player, f"Location {index}", player * 100000 + index, region)
+            if random.random() < rule_density / 4:
+                set_rule(location, Has(random.choice(keys), player))
+            region.locations.append(location)
+        multiworld.regions += regions
+
+        itempool += [Item(key, ItemClassification.progression, player * 100000 + index, player)
+                     for index, key in enumerate(keys)]
+        itempool += [Item("Filler", ItemClassification.filler, player * 100000 + len(keys), player)
+                     for _ in range(locations - len(keys))]
+        multiworld.completion_condition[player] = HasAll(keys[:(len(keys) + 1) // 2], player)
+
+    linked: typing.Set[typing.Tuple[str, int]] = set()
+    for index in range(link_groups):
+        members = set(random.sample(multiworld.player_ids, min(3, players)))
+        group_id, group = multiworld.add_group(f"Link {index}", GenericWorld.game, members)
+        region = Region("Menu", RegionType.Generic, "ItemLink", group_id, multiworld)
+        multiworld.regions.append(region)
+        for key in random.sample(keys, min(3, len(keys))):
+            items = [item for item in itempool
+                     if item.player in members and item.name == key and (key, item.player) not in linked]
+            if len(items) < 2:
+                continue
+            for item in items:
+                linked.add((key, item.player))
+                location = Location(group_id, f"Item Link: {key} -> {multiworld.player_name[item.player]}",
+                                    None, region)
+                set_rule(location, Has(key, group_id))
+                region.locations.append(location)
+                location.place_locked_item(item)
+                itempool.remove(item)
+            # one shared item replaces the linked ones, filler takes the place of the rest
+            itempool.append(Item(key, ItemClassification.progression, items[0].code, group_id))
+            itempool += [Item("Filler", ItemClassification.filler, item.player * 100000 + len(keys), item.player)
+                         for item in items[1:]]
+    multiworld._recache()
+    multiworld.state = CollectionState(multiworld)
+    return multiworld, itempool
+
+
+def run_synthetic(players: int, locations: int, rule_density: float, link_groups: int, seed: int) -> Timings:
+    timings: Timings = {}
+    multiworld, itempool = generate_synthetic_world(players, locations, rule_density, link_groups, seed)
+    multiworld.random.shuffle(itempool)
+    progression = [item for item in itempool if item.advancement]
+    rest = [item for item in itempool if not item.advancement]
+    fill_locations = multiworld.get_unfilled_locations()
+    multiworld.random.shuffle(fill_locations)
+
+    timed(timings, "fill_restrictive", fill_restrictive, multiworld, multiworld.state, fill_locations, progression)
+    timed(timings, "remaining_fill", remaining_fill, multiworld, fill_locations, rest)
+    timed(timings, "balance_multiworld_progression", balance_multiworld_progression, multiworld)
+    if not timed(timings, "can_beat_game", multiworld.can_beat_game):
+        raise Exception("Synthetic multiworld is not beatable.")
+    timed(timings, "fulfills_accessibility", multiworld.fulfills_accessibility)
+    timed(timings, "create_playthrough", create_playthrough, multiworld)
+    return timings
+
+
+def write_template_yamls(directory: str, games: typing.Sequence[str], copies: int) -> None:
+    """Writes player yamls based on playerSettings.yaml, switched to each game with that game's default options."""
+    with open(Utils.local_path("playerSettings.yaml"), encoding="utf-8-sig") as f:
+        template = Utils.parse_yaml(f.read())
+    for game in games:
+        for copy in range(copies):
+            weights = dict(template, game={game: 1}, name=f"{game[:10]}{copy}".replace(" ", "_"))
+            weights.setdefault(game, {})
+            with open(os.path.join(directory, f"{game}_{copy}.yaml"), "w", encoding="utf-8") as f:
+                Utils.dump(weights, f)
+
+
+def run_templates(games: typing.Sequence[str], copies: int, seed: int, spoiler: int = 2,
+                  log_level: str = "warning") -> Timings:
+    """Generates the template players through Generate and Main, taking fill and balancing times from the profiler.
+    The playthrough only gets created, and timed, for spoiler levels of 2 and up."""
+    with TemporaryDirectory(prefix="AP_benchmark_") as directory:
+        write_template_yamls(directory, games, copies)
+        args, _ = Generate.mystery_argparse(["--player_files_path", directory, "--outputpath", directory,
+                                             "--seed", str(seed), "--spoiler", str(spoiler), "--log_level", log_level])
+        multiworld: MultiWorld = Generate.main(args, log_folder=directory)
+        # close the log file, so the directory can be removed
+        for handler in logging.getLogger().handlers[:]:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
+
+    stages = multiworld.profiler.stages
+    fill_parts = stages["fill"]["parts"]
+    timings: Timings = {
+        "fill_restrictive": fill_parts.get("fill_restrictive", {}).get("wall", 0.0),
+        "remaining_fill": fill_parts.get("remaining_fill", {}).get("wall", 0.0),
+        "balance_multiworld_progression": stages["balancing"]["wall"],
+    }
+    timed(timings, "can_beat_game", multiworld.can_beat_game)
+    timed(timings, "fulfills_accessibility", multiworld.fulfills_accessibility)
+    if "playthrough" in stages:
+        timings["create_playthrough"] = stages["playthrough"]["wall"]
+    return timings
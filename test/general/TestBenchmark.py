@@ -0,0 +1,32 @@
+import unittest
+
+from test.benchmark.network import run_encode
+from test.benchmark.server import run_server
+from test.benchmark.worlds import generate_synthetic_world, run_synthetic
+
+
+class TestSyntheticWorlds(unittest.TestCase):
+    """Keeps the synthetic multiworlds of test.benchmark fillable"""
+
+    def test_item_links(self):
+        multiworld, itempool = generate_synthetic_world(3, 50, 0.5, 2, 0)
+        self.assertEqual(len(multiworld.groups), 2)
+        self.assertEqual(len(itempool), len(multiworld.get_unfilled_locations()))
+        self.assertTrue(any(item.player in multiworld.groups for item in itempool))
+
+    def test_run(self):
+        timings = run_synthetic(2, 50, 0.5, 1, 0)
+        self.assertEqual(set(timings), {"fill_restrictive", "remaining_fill", "balance_multiworld_progression",
+                                        "can_beat_game", "fulfills_accessibility", "create_playthrough"})
+
+
+class TestSimulatedServer(unittest.TestCase):
+    def test_run(self):
+        timings = run_server(5, 0, 50)
+        self.assertEqual(set(timings), {"register_location_checks"})
+
+
+class TestNetworkEncoding(unittest.TestCase):
+    def test_run(self):
+        timings = run_encode(100, 0, 1)
+        self.assertLessEqual({"encode", "encode_python", "decode"}, set(timings))
@@ -400,6 +400,37 @@ class TestFillRestrictive(unittest.TestCase):
         self.assertEqual(multi_world.state.prog_items[item.name, item.player], 1, "Sweep collected multiple times")
 
 
+class TestLocationIndex(unittest.TestCase):
+    def test_index_follows_placements(self):
+        multi_world = generate_multi_world(2)
+        player1 = generate_player_data(multi_world, 1, 4, prog_item_count=2, basic_item_count=2)
+        player2 = generate_player_data(multi_world, 2, 3, prog_item_count=2)
+        # build the index before placing anything
+        self.assertEqual(multi_world.get_unfilled_locations(), player1.locations + player2.locations)
+
+        multi_world.push_item(player1.locations[2], player2.prog_items[0], False)
+        player2.locations[0].item = player1.prog_items[1]
+        player1.locations[0].place_locked_item(player1.basic_items[0])
+        player2.locations[1].item = player1.prog_items[0]
+        player2.locations[1].item = None
+
+        all_locations = multi_world.get_locations()
+        for player in (None, 1, 2):
+            with self.subTest(player=player):
+                self.assertEqual(multi_world.get_filled_locations(player),
+                                 [location for location in all_locations if location.item
+                                  and (player is None or location.player == player)])
+                self.assertEqual(multi_world.get_unfilled_locations(player),
+                                 [location for location in all_locations if not location.item
+                                  and (player is None or location.player == player)])
+        self.assertEqual(multi_world.find_item_locations(player2.prog_items[0].name, 2), [player1.locations[2]])
+        self.assertEqual(multi_world.find_item_locations(player1.prog_items[0].name, 1), [])
+        self.assertEqual(multi_world.find_items_in_locations({item.name for item in player1.prog_items
+                                                              + player1.basic_items}, 1),
+                         [player1.locations[0], player2.locations[0]])
+        self.assertIs(multi_world.find_item(player1.prog_items[1].name, 1), player2.locations[0])
+
+
 class TestDistributeItemsRestrictive(unittest.TestCase):
     def test_basic_distribute(self):
         multi_world = generate_multi_world()
@@ -1,7 +1,7 @@
 import unittest
-from worlds.AutoWorld import AutoWorldRegister
+from worlds.AutoWorld import AutoWorldRegister, call_all
 
-from . import setup_default_world
+from . import gen_steps, setup_default_world
 
 
 class TestImplemented(unittest.TestCase):
@@ -12,3 +12,20 @@ class TestImplemented(unittest.TestCase):
                 with self.subTest(gamename):
                     world = setup_default_world(world_type)
                     self.assertFalse(world.completion_condition[1](world.state))
+
+    def testLocationIndexCurrent(self):
+        """Ensure placed items are found under the name they have, by changing items instead of renaming them."""
+        for gamename, world_type in AutoWorldRegister.world_types.items():
+            if gamename != "Final Fantasy":
+                with self.subTest(gamename):
+                    world = setup_default_world(world_type, steps=gen_steps[:2])
+                    # as another world's steps might have, index the locations before items get placed
+                    world.get_location_index()
+                    for step in gen_steps[2:]:
+                        call_all(world, step)
+                        item_locations = {}
+                        for location in world.get_filled_locations():
+                            item_locations.setdefault((location.item.name, location.item.player), set()).add(location)
+                        self.assertEqual({key: locations for key, locations
+                                          in world.get_location_index().item_locations.items() if locations},
+                                         item_locations, step)
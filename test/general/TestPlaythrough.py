@@ -0,0 +1,53 @@
+import unittest
+from typing import Set
+
+from BaseClasses import CollectionState, Location, MultiWorld
+from Fill import fill_restrictive, remaining_fill
+from Main import create_playthrough
+from test.benchmark.worlds import generate_synthetic_world
+
+
+def cull_one_by_one(multiworld: MultiWorld) -> Set[str]:
+    """Reference culling checking each progression item on its own, returns the names of the required locations."""
+    state = CollectionState(multiworld)
+    candidates = {location for location in multiworld.get_filled_locations() if location.item.advancement}
+    spheres = []
+    state_cache = [None]
+    while candidates:
+        sphere = {location for location in candidates if state.can_reach(location)}
+        for location in sphere:
+            state.collect(location.item, True, location)
+        candidates -= sphere
+        spheres.append(sphere)
+        state_cache.append(state.copy())
+
+    restore = {}
+    for num, sphere in reversed(tuple(enumerate(spheres))):
+        for location in sphere:
+            restore[location], location.item = location.item, None
+            if not multiworld.can_beat_game(state_cache[num]):
+                location.item = restore.pop(location)
+    required = {str(location) for sphere in spheres for location in sphere if location not in restore}
+    for location, item in restore.items():
+        location.item = item
+    return required
+
+
+class TestPlaythrough(unittest.TestCase):
+    def test_culling(self):
+        for players, link_groups in ((1, 0), (4, 0), (4, 2)):
+            with self.subTest(players=players, link_groups=link_groups):
+                multiworld, itempool = generate_synthetic_world(players, 60, 0.7, link_groups, players)
+                progression = [item for item in itempool if item.advancement]
+                locations = multiworld.get_unfilled_locations()
+                multiworld.random.shuffle(locations)
+                fill_restrictive(multiworld, multiworld.state, locations, progression)
+                remaining_fill(multiworld, locations, [item for item in itempool if not item.advancement])
+
+                expected = cull_one_by_one(multiworld)
+                create_playthrough(multiworld)
+                playthrough = {location for sphere in list(multiworld.spoiler.playthrough.values())[1:]
+                               for location in sphere}
+                self.assertEqual(playthrough, expected)
+                self.assertTrue(multiworld.can_beat_game())
+                self.assertFalse(multiworld.get_unfilled_locations())
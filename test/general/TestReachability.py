@@ -1,9 +1,14 @@
 import unittest
+import unittest.mock
+from argparse import Namespace
+from collections import Counter
 
-from BaseClasses import CollectionState
-from worlds.AutoWorld import AutoWorldRegister
+from BaseClasses import CollectionState, Entrance, MultiWorld, Region, RegionType
+from Fill import balance_multiworld_progression, distribute_items_restrictive
+from worlds.AutoWorld import AutoWorldRegister, call_all
+from worlds.generic.Rules import declare_item_dependencies, set_rule
 
-from . import setup_default_world
+from . import gen_steps, setup_default_world
 
 
 class TestBase(unittest.TestCase):
@@ -38,3 +43,163 @@ class TestBase(unittest.TestCase):
                             locations.add(location)
                     self.assertGreater(len(locations), 0,
                                        msg="Need to be able to reach at least one location to get started.")
+
+
+class TestIncrementalReachability(unittest.TestCase):
+    def setUp(self):
+        from .TestFill import generate_multi_world
+        self.multiworld = generate_multi_world()
+        self.multiworld.worlds[1].incremental_reachability = True
+        menu = self.multiworld.get_region("Menu", 1)
+        self.regions = []
+        self.calls = Counter()
+
+        def counted(name, rule):
+            def counted_rule(state):
+                self.calls[name] += 1
+                return rule(state)
+            return counted_rule
+
+        parent = menu
+        # a chain of regions, each gated by its own item, with a side branch that declares nothing
+        for index in range(5):
+            region = Region(f"Region {index}", RegionType.Generic, "", 1, self.multiworld)
+            entrance = Entrance(1, f"Entrance {index}", parent)
+            parent.exits.append(entrance)
+            entrance.connect(region)
+            set_rule(entrance, declare_item_dependencies(
+                counted(entrance.name, lambda state, item=f"Key {index}": state.has(item, 1)), f"Key {index}"))
+            self.multiworld.regions.append(region)
+            self.regions.append(region)
+            parent = region
+        self.side = Region("Side", RegionType.Generic, "", 1, self.multiworld)
+        side_entrance = Entrance(1, "Side Entrance", menu)
+        menu.exits.append(side_entrance)
+        side_entrance.connect(self.side)
+        set_rule(side_entrance, counted(side_entrance.name,
+                                        lambda state: state.has("Key 0", 1) and state.has("Key 4", 1)))
+        self.multiworld.regions.append(self.side)
+
+    def testOnlyDependentConnectionsRetried(self):
+        state = CollectionState(self.multiworld)
+        self.assertFalse(self.regions[0].can_reach(state))
+        self.assertEqual(Counter({"Entrance 0": 1, "Side Entrance": 1}), self.calls)
+        # besides newly found exits, a key only retries its own entrance and the side entrance declaring nothing
+        for index, retried in ((3, {"Side Entrance": 1}),
+                               (0, {"Side Entrance": 1, "Entrance 0": 1, "Entrance 1": 1}),
+                               (1, {"Side Entrance": 1, "Entrance 1": 1, "Entrance 2": 1}),
+                               (2, {"Side Entrance": 1, "Entrance 2": 1, "Entrance 3": 1, "Entrance 4": 1}),
+                               (4, {"Side Entrance": 1, "Entrance 4": 1})):
+            with self.subTest("Collect", item=f"Key {index}"):
+                self.calls.clear()
+                state.prog_items[f"Key {index}", 1] += 1
+                state.stale[1] = True
+                state.update_reachable_regions(1)
+                self.assertEqual(Counter(retried), self.calls)
+        self.assertTrue(all(region.can_reach(state) for region in self.regions))
+        self.assertTrue(self.side.can_reach(state))
+
+    def testMatchesFullSearch(self):
+        state = CollectionState(self.multiworld)
+        for index in (3, 0, 2, 1, 4):
+            state.prog_items[f"Key {index}", 1] += 1
+            state.stale[1] = True
+            full_state = state.copy()
+            full_state.reachable_regions[1] = set()
+            full_state.blocked_connections[1] = set()
+            full_state.stale[1] = True
+            self.multiworld.worlds[1].incremental_reachability = False
+            full_state.update_reachable_regions(1)
+            self.multiworld.worlds[1].incremental_reachability = True
+            state.update_reachable_regions(1)
+            self.assertEqual(state.reachable_regions[1], full_state.reachable_regions[1])
+
+
+    def testGenerationMatchesFullSearch(self):
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            if world_type.incremental_reachability:
+                with self.subTest("Game", game=game_name):
+                    placements = []
+                    for incremental in (True, False):
+                        with unittest.mock.patch.object(world_type, "incremental_reachability", incremental):
+                            multiworld = setup_default_world(world_type, seed=0)
+                            distribute_items_restrictive(multiworld)
+                            balance_multiworld_progression(multiworld)
+                            placements.append({location.name: location.item.name
+                                               for location in multiworld.get_filled_locations()})
+                    self.assertEqual(placements[0], placements[1])
+
+
+class TestStateCopy(unittest.TestCase):
+    def testCopySharesUntilWritten(self):
+        for game_name in ("A Link to the Past", "Ocarina of Time"):
+            with self.subTest("Game", game=game_name):
+                world = setup_default_world(AutoWorldRegister.world_types[game_name])
+                state = CollectionState(world)
+                reachable = {region for region in world.get_regions() if region.can_reach(state)}
+                copied = state.copy()
+                self.assertIs(copied.reachable_regions[1], state.reachable_regions[1])
+                self.assertFalse(copied.stale[1])
+
+                fresh = CollectionState(world)
+                for item in world.itempool:
+                    copied.collect(item, True)
+                    fresh.collect(item, True)
+                self.assertEqual({region for region in world.get_regions() if region.can_reach(copied)},
+                                 {region for region in world.get_regions() if region.can_reach(fresh)})
+                self.assertEqual({region for region in world.get_regions() if region.can_reach(state)}, reachable)
+
+
+class TestAllStateCache(unittest.TestCase):
+    def testCacheSeesOpenedConnections(self):
+        from .TestFill import generate_multi_world
+        multiworld = generate_multi_world()
+        menu = multiworld.get_region("Menu", 1)
+        region = Region("Region", RegionType.Generic, "", 1, multiworld)
+        entrance = Entrance(1, "Entrance", menu)
+        menu.exits.append(entrance)
+        entrance.connect(region)
+        multiworld.regions.append(region)
+        set_rule(entrance, lambda state: False)
+        self.assertFalse(region.can_reach(multiworld.get_all_state(use_cache=True)))
+
+        set_rule(entrance, lambda state: True)
+        self.assertTrue(region.can_reach(multiworld.get_all_state(use_cache=True)))
+
+    def generate_dungeon_items(self):
+        # OoT shuffles its entrances in set_rules, after the cached all state was first swept,
+        # while ALttP fills its dungeons from that same cache in pre_fill
+        games = {1: "Ocarina of Time", 2: "A Link to the Past"}
+        multiworld = MultiWorld(len(games))
+        multiworld.game = games
+        multiworld.player_name = {player: f"Tester{player}" for player in games}
+        multiworld.set_seed(0)
+        args = Namespace()
+        for player, game in games.items():
+            for name, option in AutoWorldRegister.world_types[game].option_definitions.items():
+                if not hasattr(args, name):
+                    setattr(args, name, {})
+                getattr(args, name)[player] = option.from_any(option.default)
+        for name in ("shuffle_interior_entrances", "shuffle_grotto_entrances", "shuffle_dungeon_entrances"):
+            getattr(args, name)[1] = AutoWorldRegister.world_types[games[1]].option_definitions[name].from_any("true")
+        multiworld.set_options(args)
+        multiworld.set_default_common_options()
+        for step in gen_steps:
+            call_all(multiworld, step)
+        return {location.name: (location.item.name, location.item.player)
+                for location in multiworld.get_locations()
+                if location.player == 2 and location.item and location.parent_region.dungeon}
+
+    def testDungeonFillMatchesFreshStates(self):
+        filled = self.generate_dungeon_items()
+        self.assertTrue(filled)
+
+        copy = CollectionState.copy
+
+        def copy_all_stale(state):
+            ret = copy(state)
+            ret.mark_stale()
+            return ret
+
+        with unittest.mock.patch.object(CollectionState, "copy", copy_all_stale):
+            self.assertEqual(filled, self.generate_dungeon_items())
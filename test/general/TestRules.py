@@ -0,0 +1,79 @@
+import unittest
+
+from BaseClasses import CollectionState, Entrance, Item, ItemClassification, Location
+from worlds.generic.Rules import add_rule, set_rule, And, CanReach, Constant, Count, Has, HasAll, HasAny, Or
+
+from .TestFill import generate_multi_world
+
+
+class TestRuleObjects(unittest.TestCase):
+    def setUp(self):
+        self.multiworld = generate_multi_world(2)
+        self.state = CollectionState(self.multiworld)
+
+    def collect(self, name: str, player: int = 1):
+        self.state.collect(Item(name, ItemClassification.progression, None, player), True)
+
+    def test_items(self):
+        rules = [Has("A", 1), Has("A", 1, 2), HasAll(("A", "B"), 1), HasAny(("A", "B"), 1), Count(("A", "B"), 1, 3)]
+        expected = {(): [False, False, False, False, False],
+                    ("A",): [True, False, False, True, False],
+                    ("A", "B"): [True, False, True, True, False],
+                    ("A", "B", "A"): [True, True, True, True, True]}
+        for items, results in expected.items():
+            self.state = CollectionState(self.multiworld)
+            for item in items:
+                self.collect(item)
+            with self.subTest(items=items):
+                self.assertEqual([rule(self.state) for rule in rules], results)
+                self.assertEqual([rule.compile()(self.state) for rule in rules], results)
+
+    def test_combinations(self):
+        rule = And(Has("A", 1), Or(Has("B", 1), Has("C", 1, 2)))
+        self.assertFalse(rule(self.state))
+        self.collect("A")
+        self.collect("C")
+        self.assertFalse(rule(self.state))
+        self.collect("C")
+        self.assertTrue(rule(self.state))
+        self.assertEqual(rule.dependencies(), {("A", 1), ("B", 1), ("C", 1)})
+        self.assertEqual(rule.compile().item_dependencies, {"A", "B", "C"})
+
+    def test_simplification(self):
+        # constants decide or drop out, single item checks get merged
+        self.assertTrue(Or(Has("A", 1), True)(self.state))
+        self.assertFalse(And(Has("A", 1), 0)(self.state))
+        rule = And(Has("A", 1), 1, And(Has("B", 1), Has("C", 2)))
+        self.assertIsInstance(rule.rules[0], HasAll)
+        self.assertEqual(rule.rules[0].items, ("A", "B"))
+        self.assertEqual(len(rule.rules), 2)
+        self.assertIsInstance(Or().rules[0], Constant)
+        self.assertFalse(Or()(self.state))
+        self.assertTrue(And()(self.state))
+
+    def test_opaque_parts(self):
+        rule = Or(Has("A", 1), lambda state: state.has("B", 1))
+        self.assertIsNone(rule.dependencies())
+        self.assertFalse(hasattr(rule.compile(), "item_dependencies"))
+        self.collect("B")
+        self.assertTrue(rule(self.state))
+        self.assertTrue(Or(CanReach("Menu", "Region", 1), Has("A", 1))(self.state))
+
+    def test_spots(self):
+        menu = self.multiworld.get_region("Menu", 1)
+        location = Location(1, "Location", None, menu)
+        menu.locations.append(location)
+        set_rule(location, Has("A", 1))
+        self.assertEqual(location.access_rule.item_dependencies, {"A"})
+        add_rule(location, Has("B", 1))
+        self.assertEqual(location.access_rule.item_dependencies, {"A", "B"})
+        add_rule(location, Has("C", 1), "or")
+        self.collect("C")
+        self.assertTrue(location.can_reach(self.state))
+
+        # a rule reading another player's items does not claim them for this spot
+        entrance = Entrance(1, "Entrance", menu)
+        rule = Has("A", 2)
+        set_rule(entrance, rule)
+        self.assertFalse(hasattr(entrance.access_rule, "item_dependencies"))
+        self.assertEqual(rule.compile(2).item_dependencies, {"A"})
@@ -0,0 +1,49 @@
+import unittest
+
+from BaseClasses import CollectionState, MultiWorld
+from Fill import fill_restrictive, remaining_fill, swap_location_item
+from test.benchmark.worlds import generate_synthetic_world
+
+
+def generate_filled_world(players: int, seed: int) -> MultiWorld:
+    multiworld, itempool = generate_synthetic_world(players, 60, 0.7, 1, seed)
+    locations = multiworld.get_unfilled_locations()
+    multiworld.random.shuffle(locations)
+    fill_restrictive(multiworld, multiworld.state, locations, [item for item in itempool if item.advancement])
+    remaining_fill(multiworld, locations, [item for item in itempool if not item.advancement])
+    return multiworld
+
+
+class TestSphereModel(unittest.TestCase):
+    def test_spheres(self):
+        multiworld = generate_filled_world(3, 0)
+        model = multiworld.get_sphere_model()
+        self.assertIs(model, multiworld.get_sphere_model())
+
+        # same spheres as sweeping by hand
+        state = CollectionState(multiworld)
+        locations = set(multiworld.get_filled_locations())
+        for index, sphere in enumerate(multiworld.get_spheres()):
+            self.assertEqual(sphere, {location for location in locations if location.can_reach(state)})
+            for location in sphere:
+                self.assertEqual(model.location_spheres[location], index)
+                self.assertLessEqual(model.item_spheres[location.item.name, location.item.player], index)
+                state.collect(location.item, True, location)
+            locations -= sphere
+        self.assertFalse(locations)
+        self.assertEqual(model.reachable(len(model.spheres)), set(multiworld.get_filled_locations()))
+
+        self.assertTrue(multiworld.can_beat_game())
+        self.assertIsNotNone(model.beaten_sphere)
+        self.assertEqual(multiworld.fulfills_accessibility(), multiworld.fulfills_accessibility(CollectionState(multiworld)))
+
+    def test_invalidation(self):
+        multiworld = generate_filled_world(2, 1)
+        model = multiworld.get_sphere_model()
+        late, early = next(iter(model.spheres[-1])), next(iter(model.spheres[0]))
+        swap_location_item(late, early, check_locked=False)
+        self.assertIsNot(model, multiworld.get_sphere_model())
+        # the sweep by hand without the model has to agree on beatability after the swap
+        state = CollectionState(multiworld)
+        self.assertEqual(multiworld.can_beat_game(), multiworld.can_beat_game(state))
+        self.assertEqual(multiworld.fulfills_accessibility(), multiworld.fulfills_accessibility(CollectionState(multiworld)))
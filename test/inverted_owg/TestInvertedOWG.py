@@ -2,7 +2,8 @@ from argparse import Namespace
 
 from BaseClasses import MultiWorld
 from worlds.alttp.Dungeons import create_dungeons, get_dungeon_item_pool
-from worlds.alttp.EntranceShuffle import link_inverted_entrances
+from worlds.alttp.EntranceShuffle import link_inverted_entrances, indirect_connections, \
+    indirect_connections_inverted
 from worlds.alttp.InvertedRegions import create_inverted_regions
 from worlds.alttp.ItemPool import generate_itempool, difficulties
 from worlds.alttp.Items import ItemFactory
@@ -29,6 +30,9 @@ class TestInvertedOWG(TestBase):
         create_dungeons(self.multiworld, 1)
         create_shops(self.multiworld, 1)
         link_inverted_entrances(self.multiworld, 1)
+        for region_name, entrance_name in {**indirect_connections, **indirect_connections_inverted}.items():
+            self.multiworld.register_indirect_condition(self.multiworld.get_region(region_name, 1),
+                                                        self.multiworld.get_entrance(entrance_name, 1))
         self.multiworld.worlds[1].create_items()
         self.multiworld.required_medallions[1] = ['Ether', 'Quake']
         self.multiworld.itempool.extend(get_dungeon_item_pool(self.multiworld))
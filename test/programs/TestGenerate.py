@@ -1,5 +1,6 @@
 # Tests for Generate.py (ArchipelagoGenerate.exe)
 
+import logging
 import unittest
 import sys
 from pathlib import Path
@@ -33,16 +34,22 @@ class TestGenerateMain(unittest.TestCase):
         Utils.local_path.cached_path = str(self.generate_dir)
         os.chdir(self.run_dir)
         self.output_tempdir = TemporaryDirectory(prefix='AP_out_')
+        self.log_tempdir = TemporaryDirectory(prefix='AP_logs_')
 
     def tearDown(self):
+        # close the log file, so its folder can be removed
+        for handler in logging.getLogger().handlers[:]:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
         self.output_tempdir.cleanup()
+        self.log_tempdir.cleanup()
 
     def test_generate_absolute(self):
         sys.argv = [sys.argv[0], '--seed', '0',
                     '--player_files_path', str(self.abs_input_dir),
                     '--outputpath', self.output_tempdir.name]
         print(f'Testing Generate.py {sys.argv} in {os.getcwd()}')
-        Generate.main()
+        Generate.main(log_folder=self.log_tempdir.name)
 
         self.assertOutput(self.output_tempdir.name)
 
@@ -51,7 +58,7 @@ class TestGenerateMain(unittest.TestCase):
                     '--player_files_path', str(self.rel_input_dir),
                     '--outputpath', self.output_tempdir.name]
         print(f'Testing Generate.py {sys.argv} in {os.getcwd()}')
-        Generate.main()
+        Generate.main(log_folder=self.log_tempdir.name)
 
         self.assertOutput(self.output_tempdir.name)
 
@@ -64,6 +71,19 @@ class TestGenerateMain(unittest.TestCase):
         sys.argv = [sys.argv[0], '--seed', '0',
                     '--outputpath', self.output_tempdir.name]
         print(f'Testing Generate.py {sys.argv} in {os.getcwd()}, player_files_path={self.yaml_input_dir}')
-        Generate.main()
+        Generate.main(log_folder=self.log_tempdir.name)
 
         self.assertOutput(self.output_tempdir.name)
+
+
+class TestGenerateSeeds(unittest.TestCase):
+    """This tests the --seeds batch summary of Generate.py"""
+
+    def test_format_results(self):
+        results = [Generate.GenerationResult(1, True, 2.5, {"setup": 0.5, "fill": 2.0}, "AP_1.zip"),
+                   Generate.GenerationResult(2, False, 0.25, {}, "FillError: No more spots to place")]
+        lines = Generate.format_results(results).splitlines()
+        self.assertEqual(lines[0].split(), ["Seed", "Result", "setup", "fill", "Total", "Output"])
+        self.assertEqual(lines[1].split(), ["1", "ok", "0.50", "2.00", "2.50", "AP_1.zip"])
+        self.assertEqual(lines[2].split()[:5], ["2", "FAILED", "-", "-", "0.25"])
+        self.assertEqual(lines[-1], "1 of 2 seeds generated successfully.")
@@ -1,5 +1,17 @@
+import asyncio
+import datetime
+import os
+import pickle
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+import zlib
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import websockets
+
+from MultiServer import Client, Context, ServerCommandProcessor, collect_hints
+from NetUtils import Hint, NetworkItem, NetworkSlot, SlotType, decode, encode, encode_multidata
+from Utils import data_package_checksum
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +50,249 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class TestLocationIndexes(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.ctx.games = {1: "Archipelago", 2: "Archipelago", 3: "Archipelago"}
+        self.ctx.groups = {3: {1, 2}}
+        #                         location: item, receiving slot, flags
+        self.ctx.locations = {1: {10: (100, 1, 0), 11: (101, 2, 1), 12: (100, 3, 0)},
+                              2: {20: (100, 1, 0), 21: (102, 2, 0)},
+                              3: {}}
+        self.ctx._index_locations()
+
+    def test_receiving_locations(self) -> None:
+        self.assertEqual(self.ctx.receiving_locations, {1: [(1, 10), (2, 20)], 2: [(1, 11), (2, 21)], 3: [(1, 12)]})
+        self.assertEqual(self.ctx.item_locations[1, 100], [(1, 10), (2, 20)])
+        self.assertNotIn((2, 100), self.ctx.item_locations)
+
+    def test_collect_hints(self) -> None:
+        self.ctx.location_checks[0, 2] = {20}
+        hints = collect_hints(self.ctx, 0, 1, 100)
+        self.assertEqual({(hint.receiving_player, hint.finding_player, hint.location, hint.found) for hint in hints},
+                         {(1, 1, 10, False), (1, 2, 20, True), (3, 1, 12, False)})
+        self.assertEqual([(hint.location, hint.item_flags) for hint in collect_hints(self.ctx, 0, 2, 101)],
+                         [(11, 1)])
+
+
+class TestSaveJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def load_ctx(self) -> Context:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.connect_names = {"Player1": (0, 1), "Player2": (0, 2)}
+        ctx.save_filename = os.path.join(self.directory.name, "test.apsave")
+        with mock.patch.object(Context, "_start_async_saving"):
+            ctx.init_save()
+        return ctx
+
+    def test_restore(self) -> None:
+        ctx = self.load_ctx()
+        ctx.location_checks[0, 1] = {1, 2}
+        ctx.received_items[0, 2, True] = [NetworkItem(10, 1, 1, 0)]
+        ctx.stored_data["key"] = 1
+        ctx.stored_data_changes.add("key")
+        self.assertTrue(ctx._save())
+        self.assertEqual(os.path.getsize(ctx.save_filename + ".journal"), 0)
+
+        ctx.location_checks[0, 1].add(3)
+        ctx.location_checks[0, 2] = {4}
+        ctx.received_items[0, 2, True].append(NetworkItem(11, 3, 1, 0))
+        ctx.received_items[0, 1, True] = [NetworkItem(12, 4, 2, 0)]
+        ctx.hints[0, 1] = {Hint(1, 2, 5, 13, False)}
+        ctx.hints_used[0, 1] += 1
+        ctx.stored_data["other"] = [1, 2]
+        ctx.stored_data_changes.add("other")
+        ctx.client_activity_timers[0, 1] = datetime.datetime.now(datetime.timezone.utc)
+        self.assertTrue(ctx._save())
+        self.assertGreater(os.path.getsize(ctx.save_filename + ".journal"), 0)
+        record = ctx.get_save_record()
+        self.assertEqual(record, {"save_generation": 1}, "nothing changed since the last save")
+
+        ctx.location_checks[0, 2].add(5)
+        self.assertTrue(ctx._save())
+        restored = self.load_ctx()
+        self.assertEqual(restored.get_save(), ctx.get_save())
+        self.assertIn(Hint(1, 2, 5, 13, True), restored.hints[0, 1])
+
+        # a snapshot on exit takes in the records
+        self.assertTrue(restored._save(True))
+        self.assertEqual(os.path.getsize(ctx.save_filename + ".journal"), 0)
+        self.assertEqual(self.load_ctx().get_save(), restored.get_save())
+
+    def test_interrupted_record(self) -> None:
+        ctx = self.load_ctx()
+        ctx.location_checks[0, 1] = {1}
+        ctx._save()
+        ctx.location_checks[0, 1].add(2)
+        ctx._save()
+        with open(ctx.save_filename + ".journal", "ab") as f:
+            f.write(b"\xff\x00\x00\x00partial")
+
+        restored = self.load_ctx()
+        self.assertEqual(restored.location_checks[0, 1], {1, 2})
+        restored.location_checks[0, 1].add(3)
+        restored._save()
+        self.assertEqual(self.load_ctx().location_checks[0, 1], {1, 2, 3})
+
+
+    def test_save_during_changes(self) -> None:
+        ctx = self.load_ctx()
+        ctx.received_items[0, 1, True] = [NetworkItem(10, 1, 2, 0)]
+        save = ctx.get_save()
+        # the saver thread works on copies, the event loop may add slots in the meantime
+        ctx.received_items[0, 2, True] = [NetworkItem(11, 2, 1, 0)]
+        self.assertNotIn((0, 2, True), save["received_items"])
+        self.assertTrue(ctx._save())
+        ctx.received_items[0, 1, True].append(NetworkItem(12, 3, 2, 0))
+        self.assertEqual({(0, 1, True): [NetworkItem(12, 3, 2, 0)]}, ctx.get_save_record()["received_items"])
+
+    def test_changes_while_saving(self) -> None:
+        ctx = self.load_ctx()
+        ctx.received_items[0, 1, True] = [NetworkItem(10, 1, 2, 0)]
+        ctx.location_checks[0, 2] = {1}
+        store_save_snapshot = ctx._store_save_snapshot
+
+        def change_while_storing(save: dict) -> int:
+            size = store_save_snapshot(save)
+            # the event loop goes on between writing the snapshot and remembering what it held
+            ctx.received_items[0, 1, True].append(NetworkItem(11, 2, 2, 0))
+            ctx.location_checks[0, 2].add(2)
+            ctx.stored_data["key"] = 1
+            ctx.stored_data_changes.add("key")
+            return size
+
+        with mock.patch.object(ctx, "_store_save_snapshot", side_effect=change_while_storing):
+            self.assertTrue(ctx._save(True))
+        self.assertNotIn(NetworkItem(11, 2, 2, 0), self.load_ctx().received_items[0, 1, True])
+        self.assertTrue(ctx._save())
+        restored = self.load_ctx()
+        self.assertEqual([NetworkItem(10, 1, 2, 0), NetworkItem(11, 2, 2, 0)], restored.received_items[0, 1, True])
+        self.assertEqual({1, 2}, restored.location_checks[0, 2])
+        self.assertEqual(1, restored.stored_data["key"])
+
+    def test_write_save_once(self) -> None:
+        ctx = self.load_ctx()
+        ctx.location_checks[0, 1] = {1}
+        # snapshot, then record, each made from a single get_save, which is handed back for further use
+        for _ in range(2):
+            ctx.location_checks[0, 1].add(len(ctx.location_checks[0, 1]) + 1)
+            with mock.patch.object(ctx, "get_save", wraps=ctx.get_save) as get_save:
+                save = ctx._write_save()
+            get_save.assert_called_once()
+            self.assertEqual(ctx.location_checks, save["location_checks"])
+        self.assertGreater(os.path.getsize(ctx.save_filename + ".journal"), 0)
+
+
+class TestMultiDataFormat(unittest.TestCase):
+    multidata = {
+        "slot_data": {1: {"goal": 1}, 2: {"goal": 2}},
+        "slot_info": {1: NetworkSlot("Player1", "Archipelago", SlotType.player),
+                      2: NetworkSlot("Player2", "Archipelago", SlotType.player)},
+        "names": [["Player1", "Player2"]],
+        "games": {1: "Archipelago", 2: "Archipelago"},
+        "connect_names": {"Player1": (0, 1), "Player2": (0, 2)},
+        "remote_items": {1, 2},
+        "remote_start_inventory": {1, 2},
+        "locations": {1: {10: (100, 2, 0)}, 2: {20: (101, 1, 1)}},
+        "server_options": {},
+        "er_hint_data": {1: {10: "Entrance"}},
+        "precollected_items": {1: [102], 2: []},
+        "precollected_hints": {1: {Hint(2, 1, 10, 100, False)}, 2: set()},
+        "version": (0, 3, 6),
+        "tags": ["AP"],
+        "minimum_versions": {"server": (0, 0, 0), "clients": {}},
+        "seed_name": "12345",
+    }
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def load_ctx(self, data: bytes) -> Context:
+        # the file stays until the test is done with the ctx
+        path = os.path.join(self.directory.name, f"test{data[0]}.archipelago")
+        with open(path, "wb") as f:
+            f.write(data)
+        ctx = Context("", 0, "", "", 0, 0, False)
+        ctx.load(path)
+        return ctx
+
+    def test_sections(self) -> None:
+        decoded = Context.decompress(encode_multidata(self.multidata))
+        self.assertEqual(set(decoded), set(self.multidata))
+        self.assertEqual(dict(decoded["slot_data"]), self.multidata["slot_data"])
+        for key, value in self.multidata.items():
+            if key != "slot_data":
+                self.assertEqual(decoded[key], value)
+
+    def test_load(self) -> None:
+        ctx = self.load_ctx(encode_multidata(self.multidata))
+        old_ctx = self.load_ctx(bytes([3]) + zlib.compress(pickle.dumps(self.multidata)))
+        self.assertEqual(ctx.slot_data._decoded, {}, "slot data should only be decoded on access")
+        self.assertEqual(ctx.slot_data[2], {"goal": 2})
+        self.assertEqual(list(ctx.slot_data._decoded), [2])
+        for attribute in ("player_names", "locations", "receiving_locations", "er_hint_data", "start_inventory",
+                          "hints", "slot_info", "games", "remote_items"):
+            self.assertEqual(getattr(ctx, attribute), getattr(old_ctx, attribute), attribute)
+
+
+class TestOutboundQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.clients = [Client(mock.Mock(open=True, send=mock.AsyncMock()), self.ctx) for _ in range(3)]
+        self.ctx.clients = {0: {1: self.clients[:1], 2: self.clients[1:]}}
+
+    def test_coalesce(self) -> None:
+        ctx, clients = self.ctx, self.clients
+
+        async def send() -> bool:
+            ctx.broadcast_team(0, [{"cmd": "Print", "text": "1"}, {"cmd": "Print", "text": "2"}])
+            ctx.queue_msgs(clients[0], [{"cmd": "Print", "text": "3"}])
+            ctx.broadcast_team(0, [])
+            ctx.broadcast(ctx.clients[0][1], [{"cmd": "Print", "text": "4"}])
+            return await ctx.send_msgs(clients[0], [{"cmd": "Print", "text": "5"}])
+
+        with mock.patch("websockets.broadcast") as broadcast:
+            self.assertTrue(asyncio.run(send()))
+        # a frame for a single endpoint is awaited, only frames shared by several endpoints are broadcast
+        clients[0].socket.send.assert_awaited_once()
+        self.assertEqual([msg["text"] for msg in decode(clients[0].socket.send.call_args.args[0])],
+                         ["1", "2", "3", "4", "5"])
+        frames = [([clients.index(next(client for client in clients if client.socket is socket)) for socket in sockets],
+                   [msg["text"] for msg in decode(msg)]) for (sockets, msg), _ in broadcast.call_args_list]
+        self.assertEqual(frames, [([1, 2], ["1", "2"])])
+        self.assertEqual((ctx.frames_queued, ctx.frames_sent), (9, 3))
+
+    def test_connection_closed(self) -> None:
+        ctx, client = self.ctx, self.clients[0]
+        client.socket.send.side_effect = websockets.ConnectionClosed(None, None)
+
+        async def send() -> bool:
+            return await ctx.send_msgs(client, [{"cmd": "Print", "text": "1"}])
+
+        with mock.patch.object(ctx, "disconnect", mock.AsyncMock()) as disconnect, self.assertLogs(level="ERROR"):
+            self.assertFalse(asyncio.run(send()))
+        disconnect.assert_awaited_once_with(client)
+        self.assertEqual(ctx.frames_sent, 0)
+
+
+class TestDataPackage(unittest.TestCase):
+    def test_cached_msg(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        games = list(ctx.gamespackage)[:2]
+        msg = ctx.get_datapackage_msg(games)
+        self.assertEqual(msg, encode([{"cmd": "DataPackage",
+                                       "data": {"games": {game: ctx.gamespackage[game] for game in games}}}]))
+        self.assertIs(ctx.get_datapackage_msg(iter(games)), msg)
+        self.assertEqual(ctx.get_datapackage_msg([]), encode([{"cmd": "DataPackage", "data": {"games": {}}}]))
+        self.assertEqual(decode(ctx.get_datapackage_msg(ctx.gamespackage))[0]["data"]["games"], ctx.gamespackage)
+
+    def test_checksum(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        for game, game_data in ctx.gamespackage.items():
+            self.assertEqual(game_data["checksum"], data_package_checksum(dict(reversed(game_data.items()))), game)
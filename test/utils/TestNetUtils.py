@@ -0,0 +1,63 @@
+import json
+import unittest
+from unittest import mock
+
+import NetUtils
+from NetUtils import ClientStatus, Hint, NetworkItem, NetworkPlayer, NetworkSlot, SlotType, decode
+
+
+class TestEncode(unittest.TestCase):
+    packets = [
+        {"cmd": "Connected", "team": 0, "slot": 1,
+         "players": [NetworkPlayer(0, 1, "Ålias", "Name \"1\"")],
+         "missing_locations": {3, 4}, "checked_locations": (1, 2),
+         "slot_data": {"nested": {1: [1.5, None, True, False], None: "null", 2.5: -0.5}},
+         "slot_info": {1: NetworkSlot("Name", "Game", SlotType.player),
+                       2: NetworkSlot("Group", "Game", SlotType.group, [1])}},
+        {"cmd": "ReceivedItems", "index": 0, "items": [NetworkItem(1, 2, 3, 4), NetworkItem(5, -2, 0)]},
+        {"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL},
+        {"cmd": "PrintJSON", "hint": Hint(1, 2, 3, 4, True, "Entrance")},
+    ]
+    expected = [
+        {"cmd": "Connected", "team": 0, "slot": 1,
+         "players": [NetworkPlayer(0, 1, "Ålias", "Name \"1\"")],
+         "missing_locations": [3, 4], "checked_locations": [1, 2],
+         "slot_data": {"nested": {"1": [1.5, None, True, False], "null": "null", "2.5": -0.5}},
+         "slot_info": {"1": NetworkSlot("Name", "Game", SlotType.player, []),
+                       "2": NetworkSlot("Group", "Game", SlotType.group, [1])}},
+        {"cmd": "ReceivedItems", "index": 0, "items": [NetworkItem(1, 2, 3, 4), NetworkItem(5, -2, 0, 0)]},
+        {"cmd": "StatusUpdate", "status": 30},
+        {"cmd": "PrintJSON", "hint": {"receiving_player": 1, "finding_player": 2, "location": 3, "item": 4,
+                                      "found": True, "entrance": "Entrance", "item_flags": 0, "class": "Hint"}},
+    ]
+
+    def check_encoder(self, encoder) -> None:
+        encoded = encoder(self.packets)
+        self.assertEqual(decode(encoded), self.expected)
+        self.assertNotIn(" ", encoded.replace("Name \\\"1\\\"", ""), "should be encoded without whitespace")
+        self.assertIn("Ålias", encoded)
+        self.assertEqual(json.loads(encoder([NetworkItem(1, 2, 3, 4)])),
+                         [{"item": 1, "location": 2, "player": 3, "flags": 4, "class": "NetworkItem"}])
+        # like JSONEncoder
+        self.assertEqual('[Infinity,{"-Infinity":NaN}]', encoder([float("inf"), {-float("inf"): float("nan")}]))
+        with self.assertRaises(TypeError):
+            encoder([object()])
+
+    def test_python(self) -> None:
+        self.check_encoder(NetUtils._encode_python)
+
+    @unittest.skipUnless(NetUtils.orjson, "orjson is not installed")
+    def test_orjson(self) -> None:
+        with mock.patch.object(NetUtils, "_encode_python", side_effect=AssertionError("fell back to Python")):
+            encoded = NetUtils._encode_orjson(self.packets)
+        self.assertEqual(decode(encoded), self.expected)
+        self.check_encoder(NetUtils._encode_orjson)
+
+    @unittest.skipUnless(NetUtils.orjson, "orjson is not installed")
+    def test_orjson_fallback(self) -> None:
+        # what orjson can't encode, or encodes differently, is encoded like the Python encoder does
+        for packets in ([{"cmd": "Bounced", "data": {"big": 2 ** 70}}],
+                        [{"cmd": "Connected", "slot_data": {"a": float("inf"), "b": [None, -float("inf")]}}],
+                        [{"cmd": "Retrieved", "keys": {"nan": (float("nan"),), float("inf"): 1}}]):
+            self.assertEqual(NetUtils._encode_python(packets), NetUtils._encode_orjson(packets))
+        self.assertIn("Infinity", NetUtils._encode_orjson([{"a": float("inf")}]))
@@ -0,0 +1,49 @@
+# Tests for StageProfiler in Utils.py
+
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from Utils import StageProfiler
+
+
+class TestStageProfiler(unittest.TestCase):
+    """This tests the generation stage profiler in Utils.py"""
+
+    def test_stages(self):
+        profiler = StageProfiler()
+        with profiler.part("Game A"):
+            pass
+        with profiler.part("Game A"):
+            pass
+        profiler.stage_done("first")
+        with profiler.part("Game B"):
+            pass
+        profiler.stage_done("second")
+
+        self.assertEqual(list(profiler.stage_times), ["first", "second"])
+        self.assertEqual(profiler.stages["first"]["parts"]["Game A"]["calls"], 2)
+        self.assertEqual(list(profiler.stages["second"]["parts"]), ["Game B"])
+        self.assertGreaterEqual(profiler.stages["first"]["wall"], profiler.stages["first"]["parts"]["Game A"]["wall"])
+        self.assertEqual(len(profiler.summary().splitlines()), 2)
+
+    def test_memory(self):
+        # the process peak only ever rises, each stage reads it once when done and once as the next one starts
+        with mock.patch("Utils.get_peak_rss", side_effect=[1024, 4096, 4096, 8192, 8192, 8192, 8192]):
+            profiler = StageProfiler()
+            for stage in ("first", "second", "third"):
+                profiler.stage_done(stage)
+        self.assertEqual([record["peak_rss"] for record in profiler.stages.values()], [4096, 8192, 8192])
+        self.assertEqual([record["peak_rss_increase"] for record in profiler.stages.values()], [3072, 4096, 0])
+        self.assertIn("8.00 KiB process peak (+0.00 B)", profiler.summary().splitlines()[2])
+
+    def test_files(self):
+        with TemporaryDirectory() as directory:
+            profiler = StageProfiler(os.path.join(directory, "AP_test"))
+            profiler.stage_done("setup")
+            profiler.to_file(os.path.join(directory, "AP_test_Profile.json"))
+            self.assertTrue(os.path.exists(os.path.join(directory, "AP_test_setup.prof")))
+            with open(os.path.join(directory, "AP_test_Profile.json")) as f:
+                self.assertEqual(list(json.load(f)), ["setup"])
@@ -0,0 +1,64 @@
+import io
+import json
+import unittest
+import zipfile
+
+from WebHostLib.downloads import replace_manifest
+
+
+class Unseekable(io.RawIOBase):
+    """Makes zipfile write data descriptors, as it does when streaming a zip."""
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+class TestReplaceManifest(unittest.TestCase):
+    members = {"archipelago.json": json.dumps({"server": None, "player": 1}).encode(),
+               "delta.bsdiff4": bytes(range(256)) * 64,
+               "data/text.txt": b"Archipelago " * 1000}
+
+    def write_zip(self, filelike) -> None:
+        with zipfile.ZipFile(filelike, "w") as zf:
+            zf.comment = b"patch"
+            for name, data in self.members.items():
+                compress_type = zipfile.ZIP_DEFLATED if name.endswith(".txt") else zipfile.ZIP_STORED
+                zf.writestr(zipfile.ZipInfo(name), data, compress_type)
+
+    def assertReplaced(self, data: bytes) -> None:
+        manifest = json.dumps({"server": "localhost:38281", "player": 1}).encode()
+        new_data = replace_manifest(data, manifest)
+        with zipfile.ZipFile(io.BytesIO(new_data)) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(list(self.members), zf.namelist())
+            self.assertEqual(b"patch", zf.comment)
+            for name, member in self.members.items():
+                self.assertEqual(manifest if name == "archipelago.json" else member, zf.read(name))
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            # members other than the manifest keep their compressed data
+            for info in zf.infolist():
+                if info.filename != "archipelago.json":
+                    start = info.header_offset
+                    self.assertIn(data[start:start + 30 + len(info.filename) + info.compress_size], new_data)
+
+    def testReplaceManifest(self):
+        data = io.BytesIO()
+        self.write_zip(data)
+        self.assertReplaced(data.getvalue())
+
+    def testDataDescriptors(self):
+        data = Unseekable()
+        self.write_zip(data)
+        self.assertReplaced(bytes(data.data))
+
+    def testPrependedData(self):
+        data = io.BytesIO()
+        self.write_zip(data)
+        with self.assertRaises(zipfile.BadZipFile):
+            replace_manifest(b"stub" + data.getvalue(), b"{}")
@@ -0,0 +1,45 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from WebHostLib.filestore import FileStore
+from worlds.Files import APContainer
+
+
+class TestFileStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_store = FileStore(self.directory.name)
+        self.file_store.chunk_size = 1000
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def testPut(self):
+        data = bytes(range(256)) * 20
+        digest = self.file_store.put(io.BytesIO(data))
+        self.assertEqual(hashlib.sha256(data).hexdigest(), digest)
+        self.assertEqual(data, self.file_store.read(digest))
+
+    def testDeduplication(self):
+        digest = self.file_store.put(io.BytesIO(b"patch"))
+        self.assertEqual(digest, self.file_store.put(io.BytesIO(b"patch")))
+        self.assertNotEqual(digest, self.file_store.put(io.BytesIO(b"other patch")))
+        files = [file for _, _, files in os.walk(self.directory.name) for file in files]
+        self.assertEqual(2, len(files))
+
+    def testReadManifest(self):
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, "w") as zf:
+            zf.writestr("archipelago.json", json.dumps({"server": "", "player": 2, "player_name": "Player2",
+                                                        "compatible_version": 5}))
+            zf.writestr("delta.bsdiff4", b"not a delta")
+        data.seek(0)
+        patch = APContainer()
+        with self.file_store.open(self.file_store.put(data)) as f:
+            patch.read_manifest(f)
+        self.assertEqual((2, "Player2"), (patch.player, patch.player_name))
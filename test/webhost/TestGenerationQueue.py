@@ -0,0 +1,67 @@
+import socket
+import unittest
+import uuid
+
+from WebHostLib import app
+from WebHostLib.autolauncher import GenerationQueue, JobListener, get_generation_queue_stats, notify_generation, \
+    notify_room
+
+
+class TestGenerationQueue(unittest.TestCase):
+    def testStats(self):
+        generation_queue = GenerationQueue()
+        generation_queue.generators = 2
+        generations = [uuid.uuid4() for _ in range(3)]
+        for generation in generations:
+            generation_queue.dispatch(generation)
+        stats = generation_queue.get_stats()
+        self.assertEqual((2, 1), (stats["running"], stats["queued"]))
+        self.assertGreaterEqual(stats["oldest_wait"], 0)
+
+        generation_queue.finish(generations[0], 3)
+        generation_queue.finish(generations[1], 5)
+        generation_queue.finish(generations[2])
+        stats = generation_queue.get_stats()
+        self.assertEqual((0, 0, 0.0), (stats["running"], stats["queued"], stats["oldest_wait"]))
+        self.assertEqual((4, 5), (stats["mean_wait"], stats["max_wait"]))
+
+
+class TestJobListener(unittest.TestCase):
+    def setUp(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as free:
+            free.bind(("127.0.0.1", 0))
+            self.port = free.getsockname()[1]
+        self.old_port = app.config["QUEUE_PORT"]
+        app.config["QUEUE_PORT"] = self.port
+        self.listener = JobListener(self.port)
+
+    def tearDown(self) -> None:
+        app.config["QUEUE_PORT"] = self.old_port
+        self.listener.socket.close()
+
+    def testNotifications(self):
+        generations = self.listener.listen_for_generations()
+        self.listener.listen_for_rooms()
+        room_id = uuid.uuid4()
+        notify_room(room_id)
+        self.assertEqual({room_id}, self.listener.get_rooms(timeout=5))
+        notify_generation()
+        self.assertTrue(generations.wait(5))
+        self.assertIn("queued", get_generation_queue_stats())
+
+    def testUnconsumedNotifications(self):
+        # without autohost and autogen listening, their notifications are dropped instead of kept
+        room_id = uuid.uuid4()
+        notify_room(room_id)
+        notify_generation()
+        self.assertIn("queued", get_generation_queue_stats())  # answered after the notifications got handled
+        self.assertIsNone(self.listener.rooms)
+        self.assertIsNone(self.listener.generations)
+
+        # rooms notified again before autohost takes them are only kept once
+        self.listener.listen_for_rooms()
+        for _ in range(3):
+            notify_room(room_id)
+        get_generation_queue_stats()
+        self.assertEqual({room_id}, self.listener.get_rooms(timeout=5))
+        self.assertEqual(set(), self.listener.get_rooms(timeout=0))
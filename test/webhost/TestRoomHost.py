@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import os
+import queue
+import tempfile
+import types
+import unittest
+import uuid
+from unittest import mock
+
+import websockets
+from pony.orm import db_session
+
+from NetUtils import NetworkSlot, SlotType, encode_multidata
+from Utils import restricted_loads
+from WebHostLib import autolauncher
+from WebHostLib.autolauncher import CommonLocker, MultiworldInstance, RoomHostProcess
+from WebHostLib.customserver import RoomHost, get_static_server_data, notify_room_commands
+from WebHostLib.models import Command, Room, Seed, TrackerSnapshot
+from . import bind_db
+
+multidata = {
+    "slot_data": {1: {}, 2: {}},
+    "slot_info": {1: NetworkSlot("Player1", "Archipelago", SlotType.player),
+                  2: NetworkSlot("Player2", "Archipelago", SlotType.player)},
+    "names": [["Player1", "Player2"]],
+    "games": {1: "Archipelago", 2: "Archipelago"},
+    "connect_names": {"Player1": (0, 1), "Player2": (0, 2)},
+    "remote_items": {1, 2},
+    "remote_start_inventory": {1, 2},
+    "locations": {1: {10: (100, 2, 0)}, 2: {20: (101, 1, 0)}},
+    "server_options": {},
+    "er_hint_data": {},
+    "precollected_items": {1: [], 2: []},
+    "precollected_hints": {1: set(), 2: set()},
+    "version": (0, 3, 6),
+    "tags": ["AP"],
+    "minimum_versions": {"server": (0, 0, 0), "clients": {}},
+    "seed_name": "12345",
+}
+
+
+def create_room() -> uuid.UUID:
+    with db_session:
+        seed = Seed(multidata=encode_multidata(multidata), owner=uuid.uuid4())
+        return Room(seed=seed, owner=uuid.uuid4()).id
+
+
+@unittest.skipIf(int(websockets.__version__.split(".")[0]) >= 14,
+                 "rooms are served with the legacy websockets server, which websockets 14 replaced")
+class RoomHostTestCase(unittest.TestCase):
+    """Keeps the locks and logs of hosted rooms in a temporary directory."""
+
+    def setUp(self) -> None:
+        bind_db()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        os.makedirs(os.path.join(directory.name, "logs"))
+        for patch in (mock.patch.object(CommonLocker, "lock_folder", directory.name),
+                      mock.patch("WebHostLib.customserver.user_path",
+                                 lambda *path: os.path.join(directory.name, *path))):
+            patch.start()
+            self.addCleanup(patch.stop)
+        root_logger = logging.getLogger()
+        handlers = [(handler, handler.filters[:]) for handler in root_logger.handlers]
+
+        def restore_logging():
+            root_logger.handlers = [handler for handler, _ in handlers]
+            for handler, filters in handlers:
+                handler.filters = filters
+        self.addCleanup(restore_logging)
+
+    async def start_rooms(self, room_ids):
+        room_host = RoomHost(get_static_server_data())
+        tasks = [asyncio.create_task(room_host.host_room(room_id)) for room_id in room_ids]
+
+        async def started():
+            while len(room_host.rooms) < len(room_ids) or \
+                    not all(ctx.shutdown_task for ctx in room_host.rooms.values()):
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(started(), 10)
+        return room_host, tasks
+
+
+class TestRoomHost(RoomHostTestCase):
+    def testSaveAndStop(self):
+        room_ids = [create_room() for _ in range(2)]
+
+        async def host():
+            room_host, tasks = await self.start_rooms(room_ids)
+            for ctx in room_host.rooms.values():
+                ctx.location_checks[0, 1].add(10)
+                ctx.save_dirty = True
+            # a room failing to save doesn't stop the others from saving
+            failing = room_host.rooms[room_ids[0]]
+            with mock.patch.object(failing, "_save", side_effect=RuntimeError("save failed")):
+                with self.assertLogs(level=logging.ERROR):
+                    room_host.save_all()
+            self.assertTrue(failing.save_dirty)
+            self.assertFalse(room_host.rooms[room_ids[1]].save_dirty)
+            with db_session:
+                self.assertIsNone(Room[room_ids[0]].multisave)
+                self.assertIsNotNone(Room[room_ids[1]].multisave)
+            room_host.save_all()
+            self.assertFalse(failing.save_dirty)
+
+            # only the tracker snapshots of slots that changed get written again
+            with db_session:
+                TrackerSnapshot[room_ids[1], 0, 2].data = b"unchanged"
+            room_host.rooms[room_ids[1]].location_checks[0, 1].add(11)
+            room_host.rooms[room_ids[1]].save_dirty = True
+            room_host.save_all()
+            with db_session:
+                self.assertEqual(b"unchanged", TrackerSnapshot[room_ids[1], 0, 2].data)
+                self.assertEqual({10, 11}, restricted_loads(TrackerSnapshot[room_ids[1], 0, 1].data)
+                                 ["location_checks"])
+
+            for room_id in room_ids:
+                room_host.stop_room(room_id)
+            await asyncio.wait_for(asyncio.gather(*tasks), 10)
+            self.assertEqual({}, room_host.rooms)
+
+        asyncio.run(host())
+        with db_session:
+            for room_id, checks in zip(room_ids, ({10}, {10, 11})):
+                room = Room[room_id]
+                self.assertTrue(room.last_port)
+                self.assertEqual({(0, 1), (0, 2)}, {(tracker_snapshot.team, tracker_snapshot.slot)
+                                                    for tracker_snapshot in room.tracker_snapshots})
+                self.assertEqual(checks, restricted_loads(room.multisave)["location_checks"][0, 1])
+
+
+class TestRoomCommands(RoomHostTestCase):
+    def run_command(self, room_id, hint_cost: int, notify: bool):
+        """Queues a command setting the hint cost of the hosted room, waits for the room to run it."""
+        async def host():
+            room_host, tasks = await self.start_rooms([room_id])
+            ctx = room_host.rooms[room_id]
+            with db_session:
+                room = Room[room_id]
+                Command(room=room, commandtext=f"/option hint_cost {hint_cost}")
+                port = room.last_port
+            if notify:
+                notify_room_commands(room_id, port)
+
+            async def handled():
+                while ctx.hint_cost != hint_cost:
+                    await asyncio.sleep(0.01)
+            try:
+                await asyncio.wait_for(handled(), 5)
+            finally:
+                room_host.stop_room(room_id)
+                await asyncio.wait_for(asyncio.gather(*tasks), 10)
+            return ctx
+
+        ctx = asyncio.run(host())
+        self.assertEqual(hint_cost, ctx.hint_cost)
+        with db_session:
+            self.assertFalse(Command.exists(lambda command: command.room.id == room_id))
+        return ctx
+
+    def testNotification(self):
+        # runs long before the fallback polling would
+        ctx = self.run_command(create_room(), 42, True)
+        self.assertIsNotNone(ctx.command_listener)
+
+    def testFallback(self):
+        with mock.patch.object(RoomHost, "command_interval", 0.05):
+            self.run_command(create_room(), 7, False)
+
+
+class TestRoomHostProcess(unittest.TestCase):
+    def setUp(self) -> None:
+        for patch in (mock.patch.object(autolauncher, "room_hosts", []),
+                      mock.patch.object(autolauncher, "multiworlds", {}),
+                      mock.patch.object(autolauncher, "room_done_queue", None),
+                      mock.patch.object(RoomHostProcess, "start")):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def testLeastBusy(self):
+        config = {"HOSTERS": 2, "PONY": {}}
+        instances = [MultiworldInstance(types.SimpleNamespace(id=uuid.uuid4()), config) for _ in range(3)]
+        autolauncher.room_done_queue = queue.Queue()
+        for instance in instances:
+            instance.start()
+        room_hosts = autolauncher.room_hosts
+        self.assertEqual([2, 1], [len(room_host.rooms) for room_host in room_hosts])
+        self.assertIs(instances[0].room_host, instances[2].room_host)
+        self.assertFalse(instances[0].start(), "already hosted")
+
+        autolauncher.room_done_queue.put(instances[0].room_id)
+        autolauncher.update_room_hosts()
+        self.assertTrue(instances[0].done())
+        # a host that died forgets its rooms, so they get launched again
+        room_hosts[1].process = mock.Mock(is_alive=mock.Mock(return_value=False))
+        autolauncher.update_room_hosts()
+        self.assertTrue(instances[1].done())
+        self.assertFalse(instances[2].done())
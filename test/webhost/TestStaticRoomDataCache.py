@@ -0,0 +1,35 @@
+import os
+import unittest
+import uuid
+from tempfile import TemporaryDirectory
+
+from WebHostLib.tracker import StaticRoomDataCache
+
+
+class TestStaticRoomDataCache(unittest.TestCase):
+    def testEviction(self):
+        cache = StaticRoomDataCache(800)
+        seeds = [uuid.uuid4() for _ in range(3)]
+        cache.put(seeds[0], ({1: "a" * 300},))
+        cache.put(seeds[1], ({1: "b" * 300},))
+        self.assertEqual(({1: "a" * 300},), cache.get(seeds[0]))
+        cache.put(seeds[2], ({1: "c" * 300},))
+        # the least recently used entry goes first
+        self.assertIsNone(cache.get(seeds[1]))
+        self.assertIsNotNone(cache.get(seeds[0]))
+        self.assertIsNotNone(cache.get(seeds[2]))
+        self.assertEqual((3, 1, 1), (cache.hits, cache.misses, cache.evictions))
+        self.assertLessEqual(cache.size, cache.max_size)
+
+        cache.put(seeds[1], ({1: "b" * 2000},))
+        self.assertEqual([seeds[1]], list(cache.entries))
+
+    def testDirectory(self):
+        with TemporaryDirectory() as directory:
+            seed = uuid.uuid4()
+            StaticRoomDataCache(1000, directory).put(seed, ({1: {2: (3, 4, 0)}}, {5}))
+            self.assertEqual([f"{seed}.pickle"], os.listdir(directory))
+            cache = StaticRoomDataCache(1000, directory)
+            self.assertEqual(({1: {2: (3, 4, 0)}}, {5}), cache.get(seed))
+            self.assertEqual(1, cache.disk_hits)
+            self.assertEqual(1, len(cache.entries))
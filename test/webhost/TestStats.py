@@ -0,0 +1,76 @@
+import threading
+import unittest
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from unittest import mock
+
+from pony.orm import db_session
+
+from WebHostLib import app
+from WebHostLib.models import GameDailyCount, Room, Seed, Slot
+from WebHostLib.stats import add_game_counts, backfill_stats, count_room_games
+from . import bind_db
+
+
+def get_counts(day: date):
+    with db_session:
+        return {game_count.game: game_count.count for game_count in GameDailyCount.select(day=day)}
+
+
+def create_room(creation_time: datetime, games) -> uuid.UUID:
+    with db_session:
+        seed = Seed(multidata=b"", owner=uuid.uuid4())
+        for player_id, game in enumerate(games, 1):
+            Slot(player_id=player_id, player_name=f"Player{player_id}", seed=seed, game=game)
+        return Room(seed=seed, owner=uuid.uuid4(), creation_time=creation_time).id
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self) -> None:
+        bind_db()
+
+    def testDailyCounts(self):
+        day = date(2001, 1, 1)
+        room_id = create_room(datetime(2001, 1, 1, 12), ["Game A", "Game A", "Game B"])
+        with db_session:
+            count_room_games(Room[room_id])
+        self.assertEqual({"Game A": 2, "Game B": 1}, get_counts(day))
+        with db_session:
+            add_game_counts(day, Counter({"Game A": 1, "Game C": 4}))
+        self.assertEqual({"Game A": 3, "Game B": 1, "Game C": 4}, get_counts(day))
+
+    def testConcurrentRooms(self):
+        day = date(2002, 1, 1)
+        get_for_update = GameDailyCount.get_for_update
+
+        @db_session
+        def add_other_room():
+            GameDailyCount(day=day, game="Game A", count=1)
+
+        def add_concurrently(**kwargs):
+            # another room adds the first count in between looking for it and adding it
+            if not get_counts(day):
+                thread = threading.Thread(target=add_other_room)
+                thread.start()
+                thread.join()
+                return None
+            return get_for_update(**kwargs)
+
+        with db_session:
+            with mock.patch.object(GameDailyCount, "get_for_update", side_effect=add_concurrently):
+                add_game_counts(day, Counter({"Game A": 2}))
+        self.assertEqual({"Game A": 3}, get_counts(day))
+
+    def testBackfill(self):
+        day = date(2003, 1, 1)
+        create_room(datetime(2003, 1, 1, 8), ["Game A", "Game B"])
+        create_room(datetime(2003, 1, 1, 20), ["Game A"])
+        create_room(datetime(2003, 1, 2), ["Game A"])
+        with db_session:
+            GameDailyCount(day=day, game="Game A", count=10)
+        result = app.test_cli_runner().invoke(backfill_stats)
+        self.assertEqual(0, result.exit_code, result.output)
+        self.assertIn("slots over", result.output)
+        self.assertEqual({"Game A": 2, "Game B": 1}, get_counts(day))
+        self.assertEqual({"Game A": 1}, get_counts(date(2003, 1, 2)))
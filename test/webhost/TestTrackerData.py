@@ -0,0 +1,48 @@
+import unittest
+
+from NetUtils import Hint, NetworkItem
+from WebHostLib.customserver import TrackerData, get_location_areas
+
+
+class TestTrackerData(unittest.TestCase):
+    def setUp(self) -> None:
+        # slot 3 is a group of slots 1 and 2
+        locations = {1: {10: (100, 2, 0), 11: (101, 3, 0), 12: (102, 1, 0)},
+                     2: {20: (100, 1, 0)}}
+        checks_in_area = {1: {"Light World": [10, 11], "Dark World": [12], "Total": 3},
+                          2: {"Light World": [20], "Total": 1}}
+        self.tracker_data = TrackerData(locations, {3: {1, 2}}, get_location_areas(checks_in_area))
+
+    def testCheckLocations(self):
+        self.tracker_data.check_locations(0, 1, [10, 11, 99])
+        self.tracker_data.check_locations(0, 2, [20])
+        self.assertEqual({(0, 1): {100: 1, 101: 1}, (0, 2): {100: 1, 101: 1}}, self.tracker_data.inventory)
+        self.assertEqual({(0, 1): {"Light World": 2, "Total": 2}, (0, 2): {"Light World": 1, "Total": 1}},
+                         self.tracker_data.checks_done)
+
+        self.tracker_data.clear()
+        self.tracker_data.check_locations(0, 1, [12])
+        self.assertEqual({(0, 1): {102: 1}}, self.tracker_data.inventory)
+        self.assertEqual({(0, 1): {"Dark World": 1, "Total": 1}}, self.tracker_data.checks_done)
+
+    def testSnapshot(self):
+        self.tracker_data.check_locations(0, 1, [12])
+        item = NetworkItem(102, 12, 1, 0)
+        hint = Hint(1, 1, 12, 102, True)
+        save = {"connect_names": {"Player1": (0, 1), "Player2": (0, 2)}, "location_checks": {(0, 1): {12}},
+                "client_game_state": {(0, 1): 30}, "client_activity_timers": (((0, 1), 1.5),),
+                "received_items": {(0, 1, True): [item], (0, 1, False): []}, "hints": {(0, 1): {hint}},
+                "name_aliases": {(0, 1): "Alias"}, "video": [((0, 1), ("Twitch", "channel"))], "random_state": None}
+        snapshot = self.tracker_data.get_snapshot(save)
+        self.assertEqual({(0, 1), (0, 2)}, set(snapshot))
+        self.assertEqual({"inventory": {102: 1}, "checks_done": {"Dark World": 1, "Total": 1},
+                          "location_checks": {12}, "received_items": [item], "hints": {hint}, "game_state": 30,
+                          "activity_timer": 1.5, "alias": "Alias", "video": ("Twitch", "channel")}, snapshot[0, 1])
+        self.assertEqual((set(), [], 0, None), tuple(snapshot[0, 2][part] for part in
+                                                     ("location_checks", "received_items", "game_state", "alias")))
+        # copies, which keep their counts as the room goes on
+        self.tracker_data.check_locations(0, 1, [10])
+        self.assertEqual({102: 1}, snapshot[0, 1]["inventory"])
+        # saves before version 1 kept the received items of each slot without the remote flag
+        self.assertEqual([item], self.tracker_data.get_snapshot({"received_items": {(0, 1): [item]}})
+                         [0, 1]["received_items"])
@@ -0,0 +1,8 @@
+from WebHostLib.models import db
+
+
+def bind_db() -> None:
+    """Binds the WebHost database, once, to one in memory that all threads share."""
+    if not db.provider:
+        db.bind(provider="sqlite", filename=":sharedmemory:")
+        db.generate_mapping(create_tables=True)
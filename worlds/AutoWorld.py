@@ -73,7 +73,8 @@ class AutoLogicRegister(type):
 
 def call_single(world: "MultiWorld", method_name: str, player: int, *args: Any) -> Any:
     method = getattr(world.worlds[player], method_name)
-    return method(*args)
+    with world.profiler.part(world.game[player]):
+        return method(*args)
 
 
 def call_all(world: "MultiWorld", method_name: str, *args: Any) -> None:
@@ -95,7 +96,8 @@ def call_all(world: "MultiWorld", method_name: str, *args: Any) -> None:
     for world_type in world_types:
         stage_callable = getattr(world_type, f"stage_{method_name}", None)
         if stage_callable:
-            stage_callable(world, *args)
+            with world.profiler.part(world_type.game):
+                stage_callable(world, *args)
 
 
 def call_stage(world: "MultiWorld", method_name: str, *args: Any) -> None:
@@ -103,7 +105,8 @@ def call_stage(world: "MultiWorld", method_name: str, *args: Any) -> None:
     for world_type in world_types:
         stage_callable = getattr(world_type, f"stage_{method_name}", None)
         if stage_callable:
-            stage_callable(world, *args)
+            with world.profiler.part(world_type.game):
+                stage_callable(world, *args)
 
 
 class WebWorld:
@@ -178,6 +181,11 @@ class World(metaclass=AutoWorldRegister):
     # Hide World Type from various views. Does not remove functionality.
     hidden: bool = False
 
+    # If all access rules of this world's entrances declare the item names they read via an item_dependencies
+    # attribute (rules without it are always retried), collecting an item only retries the blocked entrances
+    # depending on it. Leave off if rules read other players' items or other state without declaring it.
+    incremental_reachability: bool = False
+
     # see WebWorld for options
     web: WebWorld = WebWorld()
 
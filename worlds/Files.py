@@ -82,6 +82,11 @@ class APContainer:
                 self.path = zf.filename
             self.read_contents(zf)
 
+    def read_manifest(self, file: Union[str, BinaryIO]) -> None:
+        """Read only archipelago.json into patch object, leaving other contents, like a delta, unread."""
+        with zipfile.ZipFile(file, "r") as zf:
+            APContainer.read_contents(self, zf)
+
     def read_contents(self, opened_zipfile: zipfile.ZipFile) -> None:
         with opened_zipfile.open("archipelago.json", "r") as f:
             manifest = json.load(f)
@@ -5,6 +5,8 @@ import typing
 import warnings
 import zipimport
 
+from Utils import data_package_checksum
+
 folder = os.path.dirname(__file__)
 
 __all__ = {
@@ -66,6 +68,7 @@ for world_name, world in AutoWorldRegister.world_types.items():
         # seems clients don't actually want this. Keeping it here in case someone changes their mind.
         # "item_name_groups": {name: tuple(items) for name, items in world.item_name_groups.items()}
     }
+    games[world_name]["checksum"] = data_package_checksum(games[world_name])
     lookup_any_item_id_to_name.update(world.item_id_to_name)
     lookup_any_location_id_to_name.update(world.location_id_to_name)
 
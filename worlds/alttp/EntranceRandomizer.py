@@ -243,6 +243,10 @@ def parse_arguments(argv, no_defaults=False):
     parser.add_argument('--game', default="A Link to the Past")
     parser.add_argument('--race', default=defval(False), action='store_true')
     parser.add_argument('--outputname')
+    parser.add_argument('--profile', default=defval(False), action='store_true',
+                        help='Write wall and cpu time and peak memory of each generation stage to a json file.')
+    parser.add_argument('--cprofile', default=defval(False), action='store_true',
+                        help='Dump a cProfile of each generation stage to the output directory.')
     if multiargs.multi:
         for player in range(1, multiargs.multi + 1):
             parser.add_argument(f'--p{player}', default=defval(''), help=argparse.SUPPRESS)
@@ -7,10 +7,41 @@ from worlds.alttp.OverworldGlitchRules import overworld_glitches_rules, no_logic
 from worlds.alttp.UnderworldGlitchRules import underworld_glitches_rules
 from worlds.alttp.Bosses import GanonDefeatRule
 from worlds.generic.Rules import set_rule, add_rule, forbid_item, add_item_rule, item_in_locations, \
-    item_name
+    item_name, Rule, Constant, Has, HasAny, And, Or, CanReach
 from worlds.alttp.Options import smallkey_shuffle
 
 
+# rule object versions of the CollectionState helpers, for rules that only check items
+
+def can_lift_rocks(player: int) -> Rule:
+    return HasAny(('Power Glove', 'Titans Mitts'), player)
+
+
+def can_lift_heavy_rocks(player: int) -> Rule:
+    return Has('Titans Mitts', player)
+
+
+def has_sword(player: int) -> Rule:
+    return HasAny(('Fighter Sword', 'Master Sword', 'Tempered Sword', 'Golden Sword'), player)
+
+
+def has_beam_sword(player: int) -> Rule:
+    return HasAny(('Master Sword', 'Tempered Sword', 'Golden Sword'), player)
+
+
+def has_fire_source(player: int) -> Rule:
+    return HasAny(('Fire Rod', 'Lamp'), player)
+
+
+def has_key(world: MultiWorld, item: str, player: int, count: int = 1):
+    """Same as ALttPLogic._lttp_has_key, with the key logic picked once."""
+    if world.logic[player] == 'nologic':
+        return Constant(True)
+    if world.smallkey_shuffle[player] == smallkey_shuffle.option_universal:
+        return lambda state: state.can_buy_unlimited('Small Key (Universal)', player)
+    return Has(item, player, count)
+
+
 def set_rules(world):
     player = world.player
     world = world.multiworld
@@ -33,7 +64,7 @@ def set_rules(world):
             world.progression_balancing[player].value = 0
 
     else:
-        world.completion_condition[player] = lambda state: state.has('Triforce', player)
+        world.completion_condition[player] = Has('Triforce', player)
 
     global_rules(world, player)
     dungeon_boss_rules(world, player)
@@ -72,10 +103,10 @@ def set_rules(world):
 
     if world.goal[player] == 'bosses':
         # require all bosses to beat ganon
-        add_rule(world.get_location('Ganon', player), lambda state: state.can_reach('Master Sword Pedestal', 'Location', player) and state.has('Beat Agahnim 1', player) and state.has('Beat Agahnim 2', player) and state.has_crystals(7, player))
+        add_rule(world.get_location('Ganon', player), And(CanReach('Master Sword Pedestal', 'Location', player), Has('Beat Agahnim 1', player), Has('Beat Agahnim 2', player), lambda state: state.has_crystals(7, player)))
     elif world.goal[player] == 'ganon':
         # require aga2 to beat ganon
-        add_rule(world.get_location('Ganon', player), lambda state: state.has('Beat Agahnim 2', player))
+        add_rule(world.get_location('Ganon', player), Has('Beat Agahnim 2', player))
 
     if world.mode[player] != 'inverted':
         set_big_bomb_rules(world, player)
@@ -88,7 +119,7 @@ def set_rules(world):
     # if swamp and dam have not been moved we require mirror for swamp palace
     # however there is mirrorless swamp in hybrid MG, so we don't necessarily want this. HMG handles this requirement itself. 
     if not world.swamp_patch_required[player] and world.logic[player] not in ['hybridglitches', 'nologic']:
-        add_rule(world.get_entrance('Swamp Palace Moat', player), lambda state: state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Swamp Palace Moat', player), Has('Magic Mirror', player))
 
     # GT Entrance may be required for Turtle Rock for OWG and < 7 required
     ganons_tower = world.get_entrance('Inverted Ganons Tower' if world.mode[player] == 'inverted' else 'Ganons Tower', player)
@@ -134,12 +165,12 @@ def set_always_allow(spot, rule):
 
 def add_lamp_requirement(world: MultiWorld, spot, player: int, has_accessible_torch: bool = False):
     if world.dark_room_logic[player] == "lamp":
-        add_rule(spot, lambda state: state.has('Lamp', player))
+        add_rule(spot, Has('Lamp', player))
     elif world.dark_room_logic[player] == "torches":  # implicitly lamp as well
         if has_accessible_torch:
-            add_rule(spot, lambda state: state.has('Lamp', player) or state.has('Fire Rod', player))
+            add_rule(spot, Or(Has('Lamp', player), Has('Fire Rod', player)))
         else:
-            add_rule(spot, lambda state: state.has('Lamp', player))
+            add_rule(spot, Has('Lamp', player))
     elif world.dark_room_logic[player] == "none":
         pass
     else:
@@ -181,200 +212,189 @@ def global_rules(world, player):
     for exit in world.get_region('Menu', player).exits:
         exit.hide_path = True
 
-    set_rule(world.get_entrance('Old Man S&Q', player), lambda state: state.can_reach('Old Man', 'Location', player))
+    set_rule(world.get_entrance('Old Man S&Q', player), CanReach('Old Man', 'Location', player))
 
-    set_rule(world.get_location('Sunken Treasure', player), lambda state: state.has('Open Floodgate', player))
-    set_rule(world.get_location('Dark Blacksmith Ruins', player), lambda state: state.has('Return Smith', player))
+    set_rule(world.get_location('Sunken Treasure', player), Has('Open Floodgate', player))
+    set_rule(world.get_location('Dark Blacksmith Ruins', player), Has('Return Smith', player))
     set_rule(world.get_location('Purple Chest', player),
-             lambda state: state.has('Pick Up Purple Chest', player))  # Can S&Q with chest
+             Has('Pick Up Purple Chest', player))  # Can S&Q with chest
     set_rule(world.get_location('Ether Tablet', player), lambda state: state.can_retrieve_tablet(player))
-    set_rule(world.get_location('Master Sword Pedestal', player), lambda state: state.has('Red Pendant', player) and state.has('Blue Pendant', player) and state.has('Green Pendant', player))
-
-    set_rule(world.get_location('Missing Smith', player), lambda state: state.has('Get Frog', player) and state.can_reach('Blacksmiths Hut', 'Region', player)) # Can't S&Q with smith
-    set_rule(world.get_location('Blacksmith', player), lambda state: state.has('Return Smith', player))
-    set_rule(world.get_location('Magic Bat', player), lambda state: state.has('Magic Powder', player))
-    set_rule(world.get_location('Sick Kid', player), lambda state: state.has_group("Bottles", player))
-    set_rule(world.get_location('Library', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_location('Mimic Cave', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_location('Sahasrahla', player), lambda state: state.has('Green Pendant', player))
-
-
-    set_rule(world.get_location('Spike Cave', player), lambda state:
-             state.has('Hammer', player) and state.can_lift_rocks(player) and
-             ((state.has('Cape', player) and state.can_extend_magic(player, 16, True)) or
-              (state.has('Cane of Byrna', player) and
-               (state.can_extend_magic(player, 12, True) or
-                (state.multiworld.can_take_damage[player] and (state.has('Pegasus Boots', player) or state.has_hearts(player, 4))))))
-             )
-
-    set_rule(world.get_location('Hookshot Cave - Top Right', player), lambda state: state.has('Hookshot', player))
-    set_rule(world.get_location('Hookshot Cave - Top Left', player), lambda state: state.has('Hookshot', player))
+    set_rule(world.get_location('Master Sword Pedestal', player), And(Has('Red Pendant', player), Has('Blue Pendant', player), Has('Green Pendant', player)))
+
+    set_rule(world.get_location('Missing Smith', player), And(Has('Get Frog', player), CanReach('Blacksmiths Hut', 'Region', player))) # Can't S&Q with smith
+    set_rule(world.get_location('Blacksmith', player), Has('Return Smith', player))
+    set_rule(world.get_location('Magic Bat', player), Has('Magic Powder', player))
+    set_rule(world.get_location('Sick Kid', player), HasAny(item_name_groups['Bottles'], player))
+    set_rule(world.get_location('Library', player), Has('Pegasus Boots', player))
+    set_rule(world.get_location('Mimic Cave', player), Has('Hammer', player))
+    set_rule(world.get_location('Sahasrahla', player), Has('Green Pendant', player))
+
+
+    set_rule(world.get_location('Spike Cave', player), And(
+             Has('Hammer', player), can_lift_rocks(player),
+             Or(And(Has('Cape', player), lambda state: state.can_extend_magic(player, 16, True)),
+                And(Has('Cane of Byrna', player),
+                    Or(lambda state: state.can_extend_magic(player, 12, True),
+                       And(lambda state: state.multiworld.can_take_damage[player],
+                           Or(Has('Pegasus Boots', player), lambda state: state.has_hearts(player, 4))))))
+             ))
+
+    set_rule(world.get_location('Hookshot Cave - Top Right', player), Has('Hookshot', player))
+    set_rule(world.get_location('Hookshot Cave - Top Left', player), Has('Hookshot', player))
     set_rule(world.get_location('Hookshot Cave - Bottom Right', player),
-             lambda state: state.has('Hookshot', player) or state.has('Pegasus Boots', player))
-    set_rule(world.get_location('Hookshot Cave - Bottom Left', player), lambda state: state.has('Hookshot', player))
+             Or(Has('Hookshot', player), Has('Pegasus Boots', player)))
+    set_rule(world.get_location('Hookshot Cave - Bottom Left', player), Has('Hookshot', player))
 
     set_rule(world.get_entrance('Sewers Door', player),
-             lambda state: state._lttp_has_key('Small Key (Hyrule Castle)', player) or (
-                         world.smallkey_shuffle[player] == smallkey_shuffle.option_universal and world.mode[
-                     player] == 'standard'))  # standard universal small keys cannot access the shop
+             Or(has_key(world, 'Small Key (Hyrule Castle)', player), world.smallkey_shuffle[player] == smallkey_shuffle.option_universal and world.mode[player] == 'standard'))  # standard universal small keys cannot access the shop
     set_rule(world.get_entrance('Sewers Back Door', player),
-             lambda state: state._lttp_has_key('Small Key (Hyrule Castle)', player))
+             has_key(world, 'Small Key (Hyrule Castle)', player))
     set_rule(world.get_entrance('Agahnim 1', player),
-             lambda state: state.has_sword(player) and state._lttp_has_key('Small Key (Agahnims Tower)', player, 2))
+             And(has_sword(player), has_key(world, 'Small Key (Agahnims Tower)', player, 2)))
 
     set_rule(world.get_location('Castle Tower - Room 03', player), lambda state: state.can_kill_most_things(player, 8))
     set_rule(world.get_location('Castle Tower - Dark Maze', player),
-             lambda state: state.can_kill_most_things(player, 8) and state._lttp_has_key('Small Key (Agahnims Tower)',
-                                                                                   player))
+             And(lambda state: state.can_kill_most_things(player, 8), has_key(world, 'Small Key (Agahnims Tower)', player)))
 
     set_rule(world.get_location('Eastern Palace - Big Chest', player),
-             lambda state: state.has('Big Key (Eastern Palace)', player))
+             Has('Big Key (Eastern Palace)', player))
     ep_boss = world.get_location('Eastern Palace - Boss', player)
-    set_rule(ep_boss, lambda state: state.has('Big Key (Eastern Palace)', player) and
-                                    ep_boss.parent_region.dungeon.boss.can_defeat(state))
+    set_rule(ep_boss, And(Has('Big Key (Eastern Palace)', player), lambda state: ep_boss.parent_region.dungeon.boss.can_defeat(state)))
     ep_prize = world.get_location('Eastern Palace - Prize', player)
-    set_rule(ep_prize, lambda state: state.has('Big Key (Eastern Palace)', player) and
-                                     ep_prize.parent_region.dungeon.boss.can_defeat(state))
+    set_rule(ep_prize, And(Has('Big Key (Eastern Palace)', player), lambda state: ep_prize.parent_region.dungeon.boss.can_defeat(state)))
     if not world.enemy_shuffle[player]:
         add_rule(ep_boss, lambda state: state.can_shoot_arrows(player))
         add_rule(ep_prize, lambda state: state.can_shoot_arrows(player))
 
-    set_rule(world.get_location('Desert Palace - Big Chest', player), lambda state: state.has('Big Key (Desert Palace)', player))
-    set_rule(world.get_location('Desert Palace - Torch', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('Desert Palace East Wing', player), lambda state: state._lttp_has_key('Small Key (Desert Palace)', player))
-    set_rule(world.get_location('Desert Palace - Prize', player), lambda state: state._lttp_has_key('Small Key (Desert Palace)', player) and state.has('Big Key (Desert Palace)', player) and state.has_fire_source(player) and state.multiworld.get_location('Desert Palace - Prize', player).parent_region.dungeon.boss.can_defeat(state))
-    set_rule(world.get_location('Desert Palace - Boss', player), lambda state: state._lttp_has_key('Small Key (Desert Palace)', player) and state.has('Big Key (Desert Palace)', player) and state.has_fire_source(player) and state.multiworld.get_location('Desert Palace - Boss', player).parent_region.dungeon.boss.can_defeat(state))
+    set_rule(world.get_location('Desert Palace - Big Chest', player), Has('Big Key (Desert Palace)', player))
+    set_rule(world.get_location('Desert Palace - Torch', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('Desert Palace East Wing', player), has_key(world, 'Small Key (Desert Palace)', player))
+    set_rule(world.get_location('Desert Palace - Prize', player), And(has_key(world, 'Small Key (Desert Palace)', player), Has('Big Key (Desert Palace)', player), has_fire_source(player), lambda state: state.multiworld.get_location('Desert Palace - Prize', player).parent_region.dungeon.boss.can_defeat(state)))
+    set_rule(world.get_location('Desert Palace - Boss', player), And(has_key(world, 'Small Key (Desert Palace)', player), Has('Big Key (Desert Palace)', player), has_fire_source(player), lambda state: state.multiworld.get_location('Desert Palace - Boss', player).parent_region.dungeon.boss.can_defeat(state)))
 
     # logic patch to prevent placing a crystal in Desert that's required to reach the required keys
     if not (world.smallkey_shuffle[player] and world.bigkey_shuffle[player]):
         add_rule(world.get_location('Desert Palace - Prize', player), lambda state: state.multiworld.get_region('Desert Palace Main (Outer)', player).can_reach(state))
 
-    set_rule(world.get_entrance('Tower of Hera Small Key Door', player), lambda state: state._lttp_has_key('Small Key (Tower of Hera)', player) or item_name(state, 'Tower of Hera - Big Key Chest', player) == ('Small Key (Tower of Hera)', player))
-    set_rule(world.get_entrance('Tower of Hera Big Key Door', player), lambda state: state.has('Big Key (Tower of Hera)', player))
-    set_rule(world.get_location('Tower of Hera - Big Chest', player), lambda state: state.has('Big Key (Tower of Hera)', player))
-    set_rule(world.get_location('Tower of Hera - Big Key Chest', player), lambda state: state.has_fire_source(player))
+    set_rule(world.get_entrance('Tower of Hera Small Key Door', player), Or(has_key(world, 'Small Key (Tower of Hera)', player), lambda state: item_name(state, 'Tower of Hera - Big Key Chest', player) == ('Small Key (Tower of Hera)', player)))
+    set_rule(world.get_entrance('Tower of Hera Big Key Door', player), Has('Big Key (Tower of Hera)', player))
+    set_rule(world.get_location('Tower of Hera - Big Chest', player), Has('Big Key (Tower of Hera)', player))
+    set_rule(world.get_location('Tower of Hera - Big Key Chest', player), has_fire_source(player))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Tower of Hera - Big Key Chest', player), lambda state, item: item.name == 'Small Key (Tower of Hera)' and item.player == player)
 
-    set_rule(world.get_entrance('Swamp Palace Moat', player), lambda state: state.has('Flippers', player) and state.has('Open Floodgate', player))
-    set_rule(world.get_entrance('Swamp Palace Small Key Door', player), lambda state: state._lttp_has_key('Small Key (Swamp Palace)', player))
-    set_rule(world.get_entrance('Swamp Palace (Center)', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_location('Swamp Palace - Big Chest', player), lambda state: state.has('Big Key (Swamp Palace)', player) or item_name(state, 'Swamp Palace - Big Chest', player) == ('Big Key (Swamp Palace)', player))
+    set_rule(world.get_entrance('Swamp Palace Moat', player), And(Has('Flippers', player), Has('Open Floodgate', player)))
+    set_rule(world.get_entrance('Swamp Palace Small Key Door', player), has_key(world, 'Small Key (Swamp Palace)', player))
+    set_rule(world.get_entrance('Swamp Palace (Center)', player), Has('Hammer', player))
+    set_rule(world.get_location('Swamp Palace - Big Chest', player), Or(Has('Big Key (Swamp Palace)', player), lambda state: item_name(state, 'Swamp Palace - Big Chest', player) == ('Big Key (Swamp Palace)', player)))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Swamp Palace - Big Chest', player), lambda state, item: item.name == 'Big Key (Swamp Palace)' and item.player == player)
-    set_rule(world.get_entrance('Swamp Palace (North)', player), lambda state: state.has('Hookshot', player))
+    set_rule(world.get_entrance('Swamp Palace (North)', player), Has('Hookshot', player))
     if not world.smallkey_shuffle[player] and world.logic[player] not in ['hybridglitches', 'nologic']:
         forbid_item(world.get_location('Swamp Palace - Entrance', player), 'Big Key (Swamp Palace)', player)
 
-    set_rule(world.get_entrance('Thieves Town Big Key Door', player), lambda state: state.has('Big Key (Thieves Town)', player))
-    set_rule(world.get_entrance('Blind Fight', player), lambda state: state._lttp_has_key('Small Key (Thieves Town)', player))
-    set_rule(world.get_location('Thieves\' Town - Big Chest', player), lambda state: (state._lttp_has_key('Small Key (Thieves Town)', player) or item_name(state, 'Thieves\' Town - Big Chest', player) == ('Small Key (Thieves Town)', player)) and state.has('Hammer', player))
+    set_rule(world.get_entrance('Thieves Town Big Key Door', player), Has('Big Key (Thieves Town)', player))
+    set_rule(world.get_entrance('Blind Fight', player), has_key(world, 'Small Key (Thieves Town)', player))
+    set_rule(world.get_location('Thieves\' Town - Big Chest', player), And(Or(has_key(world, 'Small Key (Thieves Town)', player), lambda state: item_name(state, "Thieves' Town - Big Chest", player) == ('Small Key (Thieves Town)', player)), Has('Hammer', player)))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Thieves\' Town - Big Chest', player), lambda state, item: item.name == 'Small Key (Thieves Town)' and item.player == player and state.has('Hammer', player))
-    set_rule(world.get_location('Thieves\' Town - Attic', player), lambda state: state._lttp_has_key('Small Key (Thieves Town)', player))
+    set_rule(world.get_location('Thieves\' Town - Attic', player), has_key(world, 'Small Key (Thieves Town)', player))
 
-    set_rule(world.get_entrance('Skull Woods First Section South Door', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player))
-    set_rule(world.get_entrance('Skull Woods First Section (Right) North Door', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player))
-    set_rule(world.get_entrance('Skull Woods First Section West Door', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player, 2))  # ideally would only be one key, but we may have spent thst key already on escaping the right section
-    set_rule(world.get_entrance('Skull Woods First Section (Left) Door to Exit', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player, 2))
-    set_rule(world.get_location('Skull Woods - Big Chest', player), lambda state: state.has('Big Key (Skull Woods)', player) or item_name(state, 'Skull Woods - Big Chest', player) == ('Big Key (Skull Woods)', player))
+    set_rule(world.get_entrance('Skull Woods First Section South Door', player), has_key(world, 'Small Key (Skull Woods)', player))
+    set_rule(world.get_entrance('Skull Woods First Section (Right) North Door', player), has_key(world, 'Small Key (Skull Woods)', player))
+    set_rule(world.get_entrance('Skull Woods First Section West Door', player), has_key(world, 'Small Key (Skull Woods)', player, 2))  # ideally would only be one key, but we may have spent thst key already on escaping the right section
+    set_rule(world.get_entrance('Skull Woods First Section (Left) Door to Exit', player), has_key(world, 'Small Key (Skull Woods)', player, 2))
+    set_rule(world.get_location('Skull Woods - Big Chest', player), Or(Has('Big Key (Skull Woods)', player), lambda state: item_name(state, 'Skull Woods - Big Chest', player) == ('Big Key (Skull Woods)', player)))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Skull Woods - Big Chest', player), lambda state, item: item.name == 'Big Key (Skull Woods)' and item.player == player)
-    set_rule(world.get_entrance('Skull Woods Torch Room', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player, 3) and state.has('Fire Rod', player) and state.has_sword(player))  # sword required for curtain
+    set_rule(world.get_entrance('Skull Woods Torch Room', player), And(has_key(world, 'Small Key (Skull Woods)', player, 3), Has('Fire Rod', player), has_sword(player)))  # sword required for curtain
 
     set_rule(world.get_entrance('Ice Palace Entrance Room', player), lambda state: state.can_melt_things(player))
-    set_rule(world.get_location('Ice Palace - Big Chest', player), lambda state: state.has('Big Key (Ice Palace)', player))
-    set_rule(world.get_entrance('Ice Palace (Kholdstare)', player), lambda state: state.can_lift_rocks(player) and state.has('Hammer', player) and state.has('Big Key (Ice Palace)', player) and (state._lttp_has_key('Small Key (Ice Palace)', player, 2) or (state.has('Cane of Somaria', player) and state._lttp_has_key('Small Key (Ice Palace)', player, 1))))
-    set_rule(world.get_entrance('Ice Palace (East)', player), lambda state: (state.has('Hookshot', player) or (
-                item_in_locations(state, 'Big Key (Ice Palace)', player, [('Ice Palace - Spike Room', player), ('Ice Palace - Big Key Chest', player), ('Ice Palace - Map Chest', player)]) and state._lttp_has_key('Small Key (Ice Palace)', player))) and (state.multiworld.can_take_damage[player] or state.has('Hookshot', player) or state.has('Cape', player) or state.has('Cane of Byrna', player)))
-    set_rule(world.get_entrance('Ice Palace (East Top)', player), lambda state: state.can_lift_rocks(player) and state.has('Hammer', player))
-
-    set_rule(world.get_entrance('Misery Mire Entrance Gap', player), lambda state: (state.has('Pegasus Boots', player) or state.has('Hookshot', player)) and (state.has_sword(player) or state.has('Fire Rod', player) or state.has('Ice Rod', player) or state.has('Hammer', player) or state.has('Cane of Somaria', player) or state.can_shoot_arrows(player)))  # need to defeat wizzrobes, bombs don't work ...
-    set_rule(world.get_location('Misery Mire - Big Chest', player), lambda state: state.has('Big Key (Misery Mire)', player))
-    set_rule(world.get_location('Misery Mire - Spike Chest', player), lambda state: (state.multiworld.can_take_damage[player] and state.has_hearts(player, 4)) or state.has('Cane of Byrna', player) or state.has('Cape', player))
-    set_rule(world.get_entrance('Misery Mire Big Key Door', player), lambda state: state.has('Big Key (Misery Mire)', player))
+    set_rule(world.get_location('Ice Palace - Big Chest', player), Has('Big Key (Ice Palace)', player))
+    set_rule(world.get_entrance('Ice Palace (Kholdstare)', player), And(can_lift_rocks(player), Has('Hammer', player), Has('Big Key (Ice Palace)', player), Or(has_key(world, 'Small Key (Ice Palace)', player, 2), And(Has('Cane of Somaria', player), has_key(world, 'Small Key (Ice Palace)', player, 1)))))
+    set_rule(world.get_entrance('Ice Palace (East)', player), And(Or(Has('Hookshot', player), And(lambda state: item_in_locations(state, 'Big Key (Ice Palace)', player, [('Ice Palace - Spike Room', player), ('Ice Palace - Big Key Chest', player), ('Ice Palace - Map Chest', player)]), has_key(world, 'Small Key (Ice Palace)', player))), Or(lambda state: state.multiworld.can_take_damage[player], Has('Hookshot', player), Has('Cape', player), Has('Cane of Byrna', player))))
+    set_rule(world.get_entrance('Ice Palace (East Top)', player), And(can_lift_rocks(player), Has('Hammer', player)))
+
+    set_rule(world.get_entrance('Misery Mire Entrance Gap', player), And(Or(Has('Pegasus Boots', player), Has('Hookshot', player)), Or(has_sword(player), Has('Fire Rod', player), Has('Ice Rod', player), Has('Hammer', player), Has('Cane of Somaria', player), lambda state: state.can_shoot_arrows(player))))  # need to defeat wizzrobes, bombs don't work ...
+    set_rule(world.get_location('Misery Mire - Big Chest', player), Has('Big Key (Misery Mire)', player))
+    set_rule(world.get_location('Misery Mire - Spike Chest', player), Or(lambda state: state.multiworld.can_take_damage[player] and state.has_hearts(player, 4), Has('Cane of Byrna', player), Has('Cape', player)))
+    set_rule(world.get_entrance('Misery Mire Big Key Door', player), Has('Big Key (Misery Mire)', player))
     # you can squander the free small key from the pot by opening the south door to the north west switch room, locking you out of accessing a color switch ...
     # big key gives backdoor access to that from the teleporter in the north west
-    set_rule(world.get_location('Misery Mire - Map Chest', player), lambda state: state._lttp_has_key('Small Key (Misery Mire)', player, 1) or state.has('Big Key (Misery Mire)', player))
-    set_rule(world.get_location('Misery Mire - Main Lobby', player), lambda state: state._lttp_has_key('Small Key (Misery Mire)', player, 1) or state._lttp_has_key('Big Key (Misery Mire)', player))
+    set_rule(world.get_location('Misery Mire - Map Chest', player), Or(has_key(world, 'Small Key (Misery Mire)', player, 1), Has('Big Key (Misery Mire)', player)))
+    set_rule(world.get_location('Misery Mire - Main Lobby', player), Or(has_key(world, 'Small Key (Misery Mire)', player, 1), has_key(world, 'Big Key (Misery Mire)', player)))
     # we can place a small key in the West wing iff it also contains/blocks the Big Key, as we cannot reach and softlock with the basement key door yet
     set_rule(world.get_entrance('Misery Mire (West)', player), lambda state: state._lttp_has_key('Small Key (Misery Mire)', player, 2) if ((
                                                                                                                                                  item_name(state, 'Misery Mire - Compass Chest', player) in [('Big Key (Misery Mire)', player)]) or
                                                                                                                                      (
                                                                                                                                                  item_name(state, 'Misery Mire - Big Key Chest', player) in [('Big Key (Misery Mire)', player)])) else state._lttp_has_key('Small Key (Misery Mire)', player, 3))
-    set_rule(world.get_location('Misery Mire - Compass Chest', player), lambda state: state.has_fire_source(player))
-    set_rule(world.get_location('Misery Mire - Big Key Chest', player), lambda state: state.has_fire_source(player))
-    set_rule(world.get_entrance('Misery Mire (Vitreous)', player), lambda state: state.has('Cane of Somaria', player))
-
-    set_rule(world.get_entrance('Turtle Rock Entrance Gap', player), lambda state: state.has('Cane of Somaria', player))
-    set_rule(world.get_entrance('Turtle Rock Entrance Gap Reverse', player), lambda state: state.has('Cane of Somaria', player))
-    set_rule(world.get_location('Turtle Rock - Compass Chest', player), lambda state: state.has('Cane of Somaria', player))  # We could get here from the middle section without Cane as we don't cross the entrance gap!
-    set_rule(world.get_location('Turtle Rock - Roller Room - Left', player), lambda state: state.has('Cane of Somaria', player) and state.has('Fire Rod', player))
-    set_rule(world.get_location('Turtle Rock - Roller Room - Right', player), lambda state: state.has('Cane of Somaria', player) and state.has('Fire Rod', player))
-    set_rule(world.get_location('Turtle Rock - Big Chest', player), lambda state: state.has('Big Key (Turtle Rock)', player) and (state.has('Cane of Somaria', player) or state.has('Hookshot', player)))
-    set_rule(world.get_entrance('Turtle Rock (Big Chest) (North)', player), lambda state: state.has('Cane of Somaria', player) or state.has('Hookshot', player))
-    set_rule(world.get_entrance('Turtle Rock Big Key Door', player), lambda state: state.has('Big Key (Turtle Rock)', player))
-    set_rule(world.get_entrance('Turtle Rock (Dark Room) (North)', player), lambda state: state.has('Cane of Somaria', player))
-    set_rule(world.get_entrance('Turtle Rock (Dark Room) (South)', player), lambda state: state.has('Cane of Somaria', player))
-    set_rule(world.get_location('Turtle Rock - Eye Bridge - Bottom Left', player), lambda state: state.has('Cane of Byrna', player) or state.has('Cape', player) or state.has('Mirror Shield', player))
-    set_rule(world.get_location('Turtle Rock - Eye Bridge - Bottom Right', player), lambda state: state.has('Cane of Byrna', player) or state.has('Cape', player) or state.has('Mirror Shield', player))
-    set_rule(world.get_location('Turtle Rock - Eye Bridge - Top Left', player), lambda state: state.has('Cane of Byrna', player) or state.has('Cape', player) or state.has('Mirror Shield', player))
-    set_rule(world.get_location('Turtle Rock - Eye Bridge - Top Right', player), lambda state: state.has('Cane of Byrna', player) or state.has('Cape', player) or state.has('Mirror Shield', player))
-    set_rule(world.get_entrance('Turtle Rock (Trinexx)', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 4) and state.has('Big Key (Turtle Rock)', player) and state.has('Cane of Somaria', player))
+    set_rule(world.get_location('Misery Mire - Compass Chest', player), has_fire_source(player))
+    set_rule(world.get_location('Misery Mire - Big Key Chest', player), has_fire_source(player))
+    set_rule(world.get_entrance('Misery Mire (Vitreous)', player), Has('Cane of Somaria', player))
+
+    set_rule(world.get_entrance('Turtle Rock Entrance Gap', player), Has('Cane of Somaria', player))
+    set_rule(world.get_entrance('Turtle Rock Entrance Gap Reverse', player), Has('Cane of Somaria', player))
+    set_rule(world.get_location('Turtle Rock - Compass Chest', player), Has('Cane of Somaria', player))  # We could get here from the middle section without Cane as we don't cross the entrance gap!
+    set_rule(world.get_location('Turtle Rock - Roller Room - Left', player), And(Has('Cane of Somaria', player), Has('Fire Rod', player)))
+    set_rule(world.get_location('Turtle Rock - Roller Room - Right', player), And(Has('Cane of Somaria', player), Has('Fire Rod', player)))
+    set_rule(world.get_location('Turtle Rock - Big Chest', player), And(Has('Big Key (Turtle Rock)', player), Or(Has('Cane of Somaria', player), Has('Hookshot', player))))
+    set_rule(world.get_entrance('Turtle Rock (Big Chest) (North)', player), Or(Has('Cane of Somaria', player), Has('Hookshot', player)))
+    set_rule(world.get_entrance('Turtle Rock Big Key Door', player), Has('Big Key (Turtle Rock)', player))
+    set_rule(world.get_entrance('Turtle Rock (Dark Room) (North)', player), Has('Cane of Somaria', player))
+    set_rule(world.get_entrance('Turtle Rock (Dark Room) (South)', player), Has('Cane of Somaria', player))
+    set_rule(world.get_location('Turtle Rock - Eye Bridge - Bottom Left', player), Or(Has('Cane of Byrna', player), Has('Cape', player), Has('Mirror Shield', player)))
+    set_rule(world.get_location('Turtle Rock - Eye Bridge - Bottom Right', player), Or(Has('Cane of Byrna', player), Has('Cape', player), Has('Mirror Shield', player)))
+    set_rule(world.get_location('Turtle Rock - Eye Bridge - Top Left', player), Or(Has('Cane of Byrna', player), Has('Cape', player), Has('Mirror Shield', player)))
+    set_rule(world.get_location('Turtle Rock - Eye Bridge - Top Right', player), Or(Has('Cane of Byrna', player), Has('Cape', player), Has('Mirror Shield', player)))
+    set_rule(world.get_entrance('Turtle Rock (Trinexx)', player), And(has_key(world, 'Small Key (Turtle Rock)', player, 4), Has('Big Key (Turtle Rock)', player), Has('Cane of Somaria', player)))
 
     if not world.enemy_shuffle[player]:
         set_rule(world.get_entrance('Palace of Darkness Bonk Wall', player), lambda state: state.can_shoot_arrows(player))
-    set_rule(world.get_entrance('Palace of Darkness Hammer Peg Drop', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Palace of Darkness Bridge Room', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 1))  # If we can reach any other small key door, we already have back door access to this area
-    set_rule(world.get_entrance('Palace of Darkness Big Key Door', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 6) and state.has('Big Key (Palace of Darkness)', player) and state.can_shoot_arrows(player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('Palace of Darkness (North)', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 4))
-    set_rule(world.get_location('Palace of Darkness - Big Chest', player), lambda state: state.has('Big Key (Palace of Darkness)', player))
-
-    set_rule(world.get_entrance('Palace of Darkness Big Key Chest Staircase', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 6) or (
-                item_name(state, 'Palace of Darkness - Big Key Chest', player) in [('Small Key (Palace of Darkness)', player)] and state._lttp_has_key('Small Key (Palace of Darkness)', player, 3)))
+    set_rule(world.get_entrance('Palace of Darkness Hammer Peg Drop', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Palace of Darkness Bridge Room', player), has_key(world, 'Small Key (Palace of Darkness)', player, 1))  # If we can reach any other small key door, we already have back door access to this area
+    set_rule(world.get_entrance('Palace of Darkness Big Key Door', player), And(has_key(world, 'Small Key (Palace of Darkness)', player, 6), Has('Big Key (Palace of Darkness)', player), lambda state: state.can_shoot_arrows(player), Has('Hammer', player)))
+    set_rule(world.get_entrance('Palace of Darkness (North)', player), has_key(world, 'Small Key (Palace of Darkness)', player, 4))
+    set_rule(world.get_location('Palace of Darkness - Big Chest', player), Has('Big Key (Palace of Darkness)', player))
+
+    set_rule(world.get_entrance('Palace of Darkness Big Key Chest Staircase', player), Or(has_key(world, 'Small Key (Palace of Darkness)', player, 6), And(lambda state: item_name(state, 'Palace of Darkness - Big Key Chest', player) in [('Small Key (Palace of Darkness)', player)], has_key(world, 'Small Key (Palace of Darkness)', player, 3))))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Palace of Darkness - Big Key Chest', player), lambda state, item: item.name == 'Small Key (Palace of Darkness)' and item.player == player and state._lttp_has_key('Small Key (Palace of Darkness)', player, 5))
 
-    set_rule(world.get_entrance('Palace of Darkness Spike Statue Room Door', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 6) or (
-                item_name(state, 'Palace of Darkness - Harmless Hellway', player) in [('Small Key (Palace of Darkness)', player)] and state._lttp_has_key('Small Key (Palace of Darkness)', player, 4)))
+    set_rule(world.get_entrance('Palace of Darkness Spike Statue Room Door', player), Or(has_key(world, 'Small Key (Palace of Darkness)', player, 6), And(lambda state: item_name(state, 'Palace of Darkness - Harmless Hellway', player) in [('Small Key (Palace of Darkness)', player)], has_key(world, 'Small Key (Palace of Darkness)', player, 4))))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Palace of Darkness - Harmless Hellway', player), lambda state, item: item.name == 'Small Key (Palace of Darkness)' and item.player == player and state._lttp_has_key('Small Key (Palace of Darkness)', player, 5))
 
-    set_rule(world.get_entrance('Palace of Darkness Maze Door', player), lambda state: state._lttp_has_key('Small Key (Palace of Darkness)', player, 6))
+    set_rule(world.get_entrance('Palace of Darkness Maze Door', player), has_key(world, 'Small Key (Palace of Darkness)', player, 6))
 
     # these key rules are conservative, you might be able to get away with more lenient rules
     randomizer_room_chests = ['Ganons Tower - Randomizer Room - Top Left', 'Ganons Tower - Randomizer Room - Top Right', 'Ganons Tower - Randomizer Room - Bottom Left', 'Ganons Tower - Randomizer Room - Bottom Right']
     compass_room_chests = ['Ganons Tower - Compass Room - Top Left', 'Ganons Tower - Compass Room - Top Right', 'Ganons Tower - Compass Room - Bottom Left', 'Ganons Tower - Compass Room - Bottom Right']
 
-    set_rule(world.get_location('Ganons Tower - Bob\'s Torch', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('Ganons Tower (Tile Room)', player), lambda state: state.has('Cane of Somaria', player))
-    set_rule(world.get_entrance('Ganons Tower (Hookshot Room)', player), lambda state: state.has('Hammer', player) and (state.has('Hookshot', player) or state.has('Pegasus Boots', player)))
-    set_rule(world.get_entrance('Ganons Tower (Map Room)', player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 4) or (
-                item_name(state, 'Ganons Tower - Map Chest', player) in [('Big Key (Ganons Tower)', player), ('Small Key (Ganons Tower)', player)] and state._lttp_has_key('Small Key (Ganons Tower)', player, 3)))
+    set_rule(world.get_location('Ganons Tower - Bob\'s Torch', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('Ganons Tower (Tile Room)', player), Has('Cane of Somaria', player))
+    set_rule(world.get_entrance('Ganons Tower (Hookshot Room)', player), And(Has('Hammer', player), Or(Has('Hookshot', player), Has('Pegasus Boots', player))))
+    set_rule(world.get_entrance('Ganons Tower (Map Room)', player), Or(has_key(world, 'Small Key (Ganons Tower)', player, 4), And(lambda state: item_name(state, 'Ganons Tower - Map Chest', player) in [('Big Key (Ganons Tower)', player), ('Small Key (Ganons Tower)', player)], has_key(world, 'Small Key (Ganons Tower)', player, 3))))
     if world.accessibility[player] != 'locations':
         set_always_allow(world.get_location('Ganons Tower - Map Chest', player), lambda state, item: item.name == 'Small Key (Ganons Tower)' and item.player == player and state._lttp_has_key('Small Key (Ganons Tower)', player, 3) and state.can_reach('Ganons Tower (Hookshot Room)', 'region', player))
 
     # It is possible to need more than 2 keys to get through this entrance if you spend keys elsewhere. We reflect this in the chest requirements.
     # However we need to leave these at the lower values to derive that with 3 keys it is always possible to reach Bob and Ice Armos.
-    set_rule(world.get_entrance('Ganons Tower (Double Switch Room)', player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 2))
+    set_rule(world.get_entrance('Ganons Tower (Double Switch Room)', player), has_key(world, 'Small Key (Ganons Tower)', player, 2))
     # It is possible to need more than 3 keys ....
-    set_rule(world.get_entrance('Ganons Tower (Firesnake Room)', player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 3))
+    set_rule(world.get_entrance('Ganons Tower (Firesnake Room)', player), has_key(world, 'Small Key (Ganons Tower)', player, 3))
 
     #The actual requirements for these rooms to avoid key-lock
-    set_rule(world.get_location('Ganons Tower - Firesnake Room', player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 3) or ((
-                                                                                                                                                             item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(randomizer_room_chests, [player] * len(randomizer_room_chests))) or item_in_locations(state, 'Small Key (Ganons Tower)', player, [('Ganons Tower - Firesnake Room', player)])) and state._lttp_has_key('Small Key (Ganons Tower)', player, 2)))
+    set_rule(world.get_location('Ganons Tower - Firesnake Room', player), Or(has_key(world, 'Small Key (Ganons Tower)', player, 3), And(lambda state: item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(randomizer_room_chests, [player] * len(randomizer_room_chests))) or item_in_locations(state, 'Small Key (Ganons Tower)', player, [('Ganons Tower - Firesnake Room', player)]), has_key(world, 'Small Key (Ganons Tower)', player, 2))))
     for location in randomizer_room_chests:
-        set_rule(world.get_location(location, player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 4) or (
-                    item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(randomizer_room_chests, [player] * len(randomizer_room_chests))) and state._lttp_has_key('Small Key (Ganons Tower)', player, 3)))
+        set_rule(world.get_location(location, player), Or(has_key(world, 'Small Key (Ganons Tower)', player, 4), And(lambda state: item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(randomizer_room_chests, [player] * len(randomizer_room_chests))), has_key(world, 'Small Key (Ganons Tower)', player, 3))))
 
     # Once again it is possible to need more than 3 keys...
-    set_rule(world.get_entrance('Ganons Tower (Tile Room) Key Door', player), lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 3) and state.has('Fire Rod', player))
+    set_rule(world.get_entrance('Ganons Tower (Tile Room) Key Door', player), And(has_key(world, 'Small Key (Ganons Tower)', player, 3), Has('Fire Rod', player)))
     # Actual requirements
     for location in compass_room_chests:
-        set_rule(world.get_location(location, player), lambda state: state.has('Fire Rod', player) and (state._lttp_has_key('Small Key (Ganons Tower)', player, 4) or (
-                    item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(compass_room_chests, [player] * len(compass_room_chests))) and state._lttp_has_key('Small Key (Ganons Tower)', player, 3))))
+        set_rule(world.get_location(location, player), And(Has('Fire Rod', player), Or(has_key(world, 'Small Key (Ganons Tower)', player, 4), And(lambda state: item_in_locations(state, 'Big Key (Ganons Tower)', player, zip(compass_room_chests, [player] * len(compass_room_chests))), has_key(world, 'Small Key (Ganons Tower)', player, 3)))))
 
-    set_rule(world.get_location('Ganons Tower - Big Chest', player), lambda state: state.has('Big Key (Ganons Tower)', player))
+    set_rule(world.get_location('Ganons Tower - Big Chest', player), Has('Big Key (Ganons Tower)', player))
 
     set_rule(world.get_location('Ganons Tower - Big Key Room - Left', player),
              lambda state: state.multiworld.get_location('Ganons Tower - Big Key Room - Left', player).parent_region.dungeon.bosses['bottom'].can_defeat(state))
@@ -384,138 +404,138 @@ def global_rules(world, player):
              lambda state: state.multiworld.get_location('Ganons Tower - Big Key Room - Right', player).parent_region.dungeon.bosses['bottom'].can_defeat(state))
     if world.enemy_shuffle[player]:
         set_rule(world.get_entrance('Ganons Tower Big Key Door', player),
-                 lambda state: state.has('Big Key (Ganons Tower)', player))
+                 Has('Big Key (Ganons Tower)', player))
     else:
         set_rule(world.get_entrance('Ganons Tower Big Key Door', player),
-                 lambda state: state.has('Big Key (Ganons Tower)', player) and state.can_shoot_arrows(player))
+                 And(Has('Big Key (Ganons Tower)', player), lambda state: state.can_shoot_arrows(player)))
     set_rule(world.get_entrance('Ganons Tower Torch Rooms', player),
-             lambda state: state.has_fire_source(player) and state.multiworld.get_entrance('Ganons Tower Torch Rooms', player).parent_region.dungeon.bosses['middle'].can_defeat(state))
+             And(has_fire_source(player), lambda state: state.multiworld.get_entrance('Ganons Tower Torch Rooms', player).parent_region.dungeon.bosses['middle'].can_defeat(state)))
     set_rule(world.get_location('Ganons Tower - Pre-Moldorm Chest', player),
-             lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 3))
+             has_key(world, 'Small Key (Ganons Tower)', player, 3))
     set_rule(world.get_entrance('Ganons Tower Moldorm Door', player),
-             lambda state: state._lttp_has_key('Small Key (Ganons Tower)', player, 4))
+             has_key(world, 'Small Key (Ganons Tower)', player, 4))
     set_rule(world.get_entrance('Ganons Tower Moldorm Gap', player),
-             lambda state: state.has('Hookshot', player) and state.multiworld.get_entrance('Ganons Tower Moldorm Gap', player).parent_region.dungeon.bosses['top'].can_defeat(state))
+             And(Has('Hookshot', player), lambda state: state.multiworld.get_entrance('Ganons Tower Moldorm Gap', player).parent_region.dungeon.bosses['top'].can_defeat(state)))
     set_defeat_dungeon_boss_rule(world.get_location('Agahnim 2', player))
     ganon = world.get_location('Ganon', player)
     set_rule(ganon, lambda state: GanonDefeatRule(state, player))
     if world.goal[player] in ['ganontriforcehunt', 'localganontriforcehunt']:
         add_rule(ganon, lambda state: state.has_triforce_pieces(state.multiworld.treasure_hunt_count[player], player))
     elif world.goal[player] == 'ganonpedestal':
-        add_rule(world.get_location('Ganon', player), lambda state: state.can_reach('Master Sword Pedestal', 'Location', player))
+        add_rule(world.get_location('Ganon', player), CanReach('Master Sword Pedestal', 'Location', player))
     else:
         add_rule(ganon, lambda state: state.has_crystals(state.multiworld.crystals_needed_for_ganon[player], player))
-    set_rule(world.get_entrance('Ganon Drop', player), lambda state: state.has_beam_sword(player))  # need to damage ganon to get tiles to drop
+    set_rule(world.get_entrance('Ganon Drop', player), has_beam_sword(player))  # need to damage ganon to get tiles to drop
 
-    set_rule(world.get_location('Flute Activation Spot', player), lambda state: state.has('Flute', player))
+    set_rule(world.get_location('Flute Activation Spot', player), Has('Flute', player))
 
 
 def default_rules(world, player):
     """Default world rules when world state is not inverted."""
     # overworld requirements
-    set_rule(world.get_entrance('Kings Grave', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('Kings Grave Outer Rocks', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Kings Grave Inner Rocks', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Kings Grave Mirror Spot', player), lambda state: state.has('Moon Pearl', player) and state.has('Magic Mirror', player))
+    set_rule(world.get_entrance('Kings Grave', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('Kings Grave Outer Rocks', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Kings Grave Inner Rocks', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Kings Grave Mirror Spot', player), And(Has('Moon Pearl', player), Has('Magic Mirror', player)))
     # Caution: If king's grave is releaxed at all to account for reaching it via a two way cave's exit in insanity mode, then the bomb shop logic will need to be updated (that would involve create a small ledge-like Region for it)
-    set_rule(world.get_entrance('Bonk Fairy (Light)', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('Lumberjack Tree Tree', player), lambda state: state.has('Pegasus Boots', player) and state.has('Beat Agahnim 1', player))
-    set_rule(world.get_entrance('Bonk Rock Cave', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('Desert Palace Stairs', player), lambda state: state.has('Book of Mudora', player))
-    set_rule(world.get_entrance('Sanctuary Grave', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('20 Rupee Cave', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('50 Rupee Cave', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Death Mountain Entrance Rock', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Bumper Cave Entrance Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Flute Spot 1', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('Lake Hylia Central Island Teleporter', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Dark Desert Teleporter', player), lambda state: state.has('Activated Flute', player) and state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('East Hyrule Teleporter', player), lambda state: state.has('Hammer', player) and state.can_lift_rocks(player) and state.has('Moon Pearl', player)) # bunny cannot use hammer
-    set_rule(world.get_entrance('South Hyrule Teleporter', player), lambda state: state.has('Hammer', player) and state.can_lift_rocks(player) and state.has('Moon Pearl', player)) # bunny cannot use hammer
-    set_rule(world.get_entrance('Kakariko Teleporter', player), lambda state: ((state.has('Hammer', player) and state.can_lift_rocks(player)) or state.can_lift_heavy_rocks(player)) and state.has('Moon Pearl', player)) # bunny cannot lift bushes
-    set_rule(world.get_location('Flute Spot', player), lambda state: state.has('Shovel', player))
-    set_rule(world.get_entrance('Bat Cave Drop Ledge', player), lambda state: state.has('Hammer', player))
-
-    set_rule(world.get_location('Zora\'s Ledge', player), lambda state: state.has('Flippers', player))
-    set_rule(world.get_entrance('Waterfall of Wishing', player), lambda state: state.has('Flippers', player))
-    set_rule(world.get_location('Frog', player), lambda state: state.can_lift_heavy_rocks(player)) # will get automatic moon pearl requirement
-    set_rule(world.get_location('Potion Shop', player), lambda state: state.has('Mushroom', player))
-    set_rule(world.get_entrance('Desert Palace Entrance (North) Rocks', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Desert Ledge Return Rocks', player), lambda state: state.can_lift_rocks(player))  # should we decide to place something that is not a dungeon end up there at some point
-    set_rule(world.get_entrance('Checkerboard Cave', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Agahnims Tower', player), lambda state: state.has('Cape', player) or state.has_beam_sword(player) or state.has('Beat Agahnim 1', player))  # barrier gets removed after killing agahnim, relevant for entrance shuffle
-    set_rule(world.get_entrance('Top of Pyramid', player), lambda state: state.has('Beat Agahnim 1', player))
+    set_rule(world.get_entrance('Bonk Fairy (Light)', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('Lumberjack Tree Tree', player), And(Has('Pegasus Boots', player), Has('Beat Agahnim 1', player)))
+    set_rule(world.get_entrance('Bonk Rock Cave', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('Desert Palace Stairs', player), Has('Book of Mudora', player))
+    set_rule(world.get_entrance('Sanctuary Grave', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('20 Rupee Cave', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('50 Rupee Cave', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Death Mountain Entrance Rock', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Bumper Cave Entrance Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Flute Spot 1', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('Lake Hylia Central Island Teleporter', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Dark Desert Teleporter', player), And(Has('Activated Flute', player), can_lift_heavy_rocks(player)))
+    set_rule(world.get_entrance('East Hyrule Teleporter', player), And(Has('Hammer', player), can_lift_rocks(player), Has('Moon Pearl', player))) # bunny cannot use hammer
+    set_rule(world.get_entrance('South Hyrule Teleporter', player), And(Has('Hammer', player), can_lift_rocks(player), Has('Moon Pearl', player))) # bunny cannot use hammer
+    set_rule(world.get_entrance('Kakariko Teleporter', player), And(Or(And(Has('Hammer', player), can_lift_rocks(player)), can_lift_heavy_rocks(player)), Has('Moon Pearl', player))) # bunny cannot lift bushes
+    set_rule(world.get_location('Flute Spot', player), Has('Shovel', player))
+    set_rule(world.get_entrance('Bat Cave Drop Ledge', player), Has('Hammer', player))
+
+    set_rule(world.get_location('Zora\'s Ledge', player), Has('Flippers', player))
+    set_rule(world.get_entrance('Waterfall of Wishing', player), Has('Flippers', player))
+    set_rule(world.get_location('Frog', player), can_lift_heavy_rocks(player)) # will get automatic moon pearl requirement
+    set_rule(world.get_location('Potion Shop', player), Has('Mushroom', player))
+    set_rule(world.get_entrance('Desert Palace Entrance (North) Rocks', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Desert Ledge Return Rocks', player), can_lift_rocks(player))  # should we decide to place something that is not a dungeon end up there at some point
+    set_rule(world.get_entrance('Checkerboard Cave', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Agahnims Tower', player), Or(Has('Cape', player), has_beam_sword(player), Has('Beat Agahnim 1', player)))  # barrier gets removed after killing agahnim, relevant for entrance shuffle
+    set_rule(world.get_entrance('Top of Pyramid', player), Has('Beat Agahnim 1', player))
     set_rule(world.get_entrance('Old Man Cave Exit (West)', player), lambda state: False)  # drop cannot be climbed up
-    set_rule(world.get_entrance('Broken Bridge (West)', player), lambda state: state.has('Hookshot', player))
-    set_rule(world.get_entrance('Broken Bridge (East)', player), lambda state: state.has('Hookshot', player))
-    set_rule(world.get_entrance('East Death Mountain Teleporter', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Fairy Ascension Rocks', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Paradox Cave Push Block Reverse', player), lambda state: state.has('Mirror', player))  # can erase block
-    set_rule(world.get_entrance('Death Mountain (Top)', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Turtle Rock Teleporter', player), lambda state: state.can_lift_heavy_rocks(player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('East Death Mountain (Top)', player), lambda state: state.has('Hammer', player))
-
-    set_rule(world.get_entrance('Catfish Exit Rock', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Catfish Entrance Rock', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Northeast Dark World Broken Bridge Pass', player), lambda state: state.has('Moon Pearl', player) and (state.can_lift_rocks(player) or state.has('Hammer', player) or state.has('Flippers', player)))
-    set_rule(world.get_entrance('East Dark World Broken Bridge Pass', player), lambda state: state.has('Moon Pearl', player) and (state.can_lift_rocks(player) or state.has('Hammer', player)))
-    set_rule(world.get_entrance('South Dark World Bridge', player), lambda state: state.has('Hammer', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bonk Fairy (Dark)', player), lambda state: state.has('Moon Pearl', player) and state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('West Dark World Gap', player), lambda state: state.has('Moon Pearl', player) and state.has('Hookshot', player))
-    set_rule(world.get_entrance('Palace of Darkness', player), lambda state: state.has('Moon Pearl', player)) # kiki needs pearl
-    set_rule(world.get_entrance('Hyrule Castle Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Hyrule Castle Main Gate', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: (state.has('Moon Pearl', player) and state.has('Flippers', player) or state.has('Magic Mirror', player)))  # Overworld Bunny Revival
+    set_rule(world.get_entrance('Broken Bridge (West)', player), Has('Hookshot', player))
+    set_rule(world.get_entrance('Broken Bridge (East)', player), Has('Hookshot', player))
+    set_rule(world.get_entrance('East Death Mountain Teleporter', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Fairy Ascension Rocks', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Paradox Cave Push Block Reverse', player), Has('Mirror', player))  # can erase block
+    set_rule(world.get_entrance('Death Mountain (Top)', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Turtle Rock Teleporter', player), And(can_lift_heavy_rocks(player), Has('Hammer', player)))
+    set_rule(world.get_entrance('East Death Mountain (Top)', player), Has('Hammer', player))
+
+    set_rule(world.get_entrance('Catfish Exit Rock', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Catfish Entrance Rock', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Northeast Dark World Broken Bridge Pass', player), And(Has('Moon Pearl', player), Or(can_lift_rocks(player), Has('Hammer', player), Has('Flippers', player))))
+    set_rule(world.get_entrance('East Dark World Broken Bridge Pass', player), And(Has('Moon Pearl', player), Or(can_lift_rocks(player), Has('Hammer', player))))
+    set_rule(world.get_entrance('South Dark World Bridge', player), And(Has('Hammer', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Bonk Fairy (Dark)', player), And(Has('Moon Pearl', player), Has('Pegasus Boots', player)))
+    set_rule(world.get_entrance('West Dark World Gap', player), And(Has('Moon Pearl', player), Has('Hookshot', player)))
+    set_rule(world.get_entrance('Palace of Darkness', player), Has('Moon Pearl', player)) # kiki needs pearl
+    set_rule(world.get_entrance('Hyrule Castle Ledge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Hyrule Castle Main Gate', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), Or(And(Has('Moon Pearl', player), Has('Flippers', player)), Has('Magic Mirror', player)))  # Overworld Bunny Revival
     set_rule(world.get_location('Bombos Tablet', player), lambda state: state.can_retrieve_tablet(player))
-    set_rule(world.get_entrance('Dark Lake Hylia Drop (South)', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))  # ToDo any fake flipper set up?
-    set_rule(world.get_entrance('Dark Lake Hylia Ledge Fairy', player), lambda state: state.has('Moon Pearl', player)) # bomb required
-    set_rule(world.get_entrance('Dark Lake Hylia Ledge Spike Cave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Village of Outcasts Heavy Rock', player), lambda state: state.has('Moon Pearl', player) and state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Hype Cave', player), lambda state: state.has('Moon Pearl', player)) # bomb required
-    set_rule(world.get_entrance('Brewery', player), lambda state: state.has('Moon Pearl', player)) # bomb required
-    set_rule(world.get_entrance('Thieves Town', player), lambda state: state.has('Moon Pearl', player)) # bunny cannot pull
-    set_rule(world.get_entrance('Skull Woods First Section Hole (North)', player), lambda state: state.has('Moon Pearl', player)) # bunny cannot lift bush
-    set_rule(world.get_entrance('Skull Woods Second Section Hole', player), lambda state: state.has('Moon Pearl', player)) # bunny cannot lift bush
-    set_rule(world.get_entrance('Maze Race Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Cave 45 Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Bombos Tablet Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('East Dark World Bridge', player), lambda state: state.has('Moon Pearl', player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('Lake Hylia Island Mirror Spot', player), lambda state: state.has('Moon Pearl', player) and state.has('Magic Mirror', player) and state.has('Flippers', player))
-    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('East Dark World River Pier', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-    set_rule(world.get_entrance('Graveyard Ledge Mirror Spot', player), lambda state: state.has('Moon Pearl', player) and state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Bumper Cave Entrance Rock', player), lambda state: state.has('Moon Pearl', player) and state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Bumper Cave Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Bat Cave Drop Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark World Hammer Peg Cave', player), lambda state: state.has('Moon Pearl', player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('Village of Outcasts Eastern Rocks', player), lambda state: state.has('Moon Pearl', player) and state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Peg Area Rocks', player), lambda state: state.has('Moon Pearl', player) and state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Village of Outcasts Pegs', player), lambda state: state.has('Moon Pearl', player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('Grassy Lawn Pegs', player), lambda state: state.has('Moon Pearl', player) and state.has('Hammer', player))
-    set_rule(world.get_entrance('Bumper Cave Exit (Top)', player), lambda state: state.has('Cape', player))
-    set_rule(world.get_entrance('Bumper Cave Exit (Bottom)', player), lambda state: state.has('Cape', player) or state.has('Hookshot', player))
-
-    set_rule(world.get_entrance('Skull Woods Final Section', player), lambda state: state.has('Fire Rod', player) and state.has('Moon Pearl', player)) # bunny cannot use fire rod
-    set_rule(world.get_entrance('Misery Mire', player), lambda state: state.has('Moon Pearl', player) and state.has_sword(player) and state.has_misery_mire_medallion(player))  # sword required to cast magic (!)
-    set_rule(world.get_entrance('Desert Ledge (Northeast) Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-
-    set_rule(world.get_entrance('Desert Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Desert Palace Stairs Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Desert Palace Entrance (North) Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Spectacle Rock Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Hookshot Cave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-
-    set_rule(world.get_entrance('East Death Mountain (Top) Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Mimic Cave Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Spiral Cave Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Fairy Ascension Mirror Spot', player), lambda state: state.has('Magic Mirror', player) and state.has('Moon Pearl', player))  # need to lift flowers
-    set_rule(world.get_entrance('Isolated Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark Lake Hylia Drop (South)', player), And(Has('Moon Pearl', player), Has('Flippers', player)))  # ToDo any fake flipper set up?
+    set_rule(world.get_entrance('Dark Lake Hylia Ledge Fairy', player), Has('Moon Pearl', player)) # bomb required
+    set_rule(world.get_entrance('Dark Lake Hylia Ledge Spike Cave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Village of Outcasts Heavy Rock', player), And(Has('Moon Pearl', player), can_lift_heavy_rocks(player)))
+    set_rule(world.get_entrance('Hype Cave', player), Has('Moon Pearl', player)) # bomb required
+    set_rule(world.get_entrance('Brewery', player), Has('Moon Pearl', player)) # bomb required
+    set_rule(world.get_entrance('Thieves Town', player), Has('Moon Pearl', player)) # bunny cannot pull
+    set_rule(world.get_entrance('Skull Woods First Section Hole (North)', player), Has('Moon Pearl', player)) # bunny cannot lift bush
+    set_rule(world.get_entrance('Skull Woods Second Section Hole', player), Has('Moon Pearl', player)) # bunny cannot lift bush
+    set_rule(world.get_entrance('Maze Race Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Cave 45 Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Bombos Tablet Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('East Dark World Bridge', player), And(Has('Moon Pearl', player), Has('Hammer', player)))
+    set_rule(world.get_entrance('Lake Hylia Island Mirror Spot', player), And(Has('Moon Pearl', player), Has('Magic Mirror', player), Has('Flippers', player)))
+    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('East Dark World River Pier', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+    set_rule(world.get_entrance('Graveyard Ledge Mirror Spot', player), And(Has('Moon Pearl', player), Has('Magic Mirror', player)))
+    set_rule(world.get_entrance('Bumper Cave Entrance Rock', player), And(Has('Moon Pearl', player), can_lift_rocks(player)))
+    set_rule(world.get_entrance('Bumper Cave Ledge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Bat Cave Drop Ledge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark World Hammer Peg Cave', player), And(Has('Moon Pearl', player), Has('Hammer', player)))
+    set_rule(world.get_entrance('Village of Outcasts Eastern Rocks', player), And(Has('Moon Pearl', player), can_lift_heavy_rocks(player)))
+    set_rule(world.get_entrance('Peg Area Rocks', player), And(Has('Moon Pearl', player), can_lift_heavy_rocks(player)))
+    set_rule(world.get_entrance('Village of Outcasts Pegs', player), And(Has('Moon Pearl', player), Has('Hammer', player)))
+    set_rule(world.get_entrance('Grassy Lawn Pegs', player), And(Has('Moon Pearl', player), Has('Hammer', player)))
+    set_rule(world.get_entrance('Bumper Cave Exit (Top)', player), Has('Cape', player))
+    set_rule(world.get_entrance('Bumper Cave Exit (Bottom)', player), Or(Has('Cape', player), Has('Hookshot', player)))
+
+    set_rule(world.get_entrance('Skull Woods Final Section', player), And(Has('Fire Rod', player), Has('Moon Pearl', player))) # bunny cannot use fire rod
+    set_rule(world.get_entrance('Misery Mire', player), And(Has('Moon Pearl', player), has_sword(player), lambda state: state.has_misery_mire_medallion(player)))  # sword required to cast magic (!)
+    set_rule(world.get_entrance('Desert Ledge (Northeast) Mirror Spot', player), Has('Magic Mirror', player))
+
+    set_rule(world.get_entrance('Desert Ledge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Desert Palace Stairs Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Desert Palace Entrance (North) Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Spectacle Rock Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Hookshot Cave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+
+    set_rule(world.get_entrance('East Death Mountain (Top) Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Mimic Cave Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Spiral Cave Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Fairy Ascension Mirror Spot', player), And(Has('Magic Mirror', player), Has('Moon Pearl', player)))  # need to lift flowers
+    set_rule(world.get_entrance('Isolated Ledge Mirror Spot', player), Has('Magic Mirror', player))
     set_rule(world.get_entrance('Superbunny Cave Exit (Bottom)', player), lambda state: False)  # Cannot get to bottom exit from top. Just exists for shuffling
-    set_rule(world.get_entrance('Floating Island Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Turtle Rock', player), lambda state: state.has('Moon Pearl', player) and state.has_sword(player) and state.has_turtle_rock_medallion(player) and state.can_reach('Turtle Rock (Top)', 'Region', player))  # sword required to cast magic (!)
+    set_rule(world.get_entrance('Floating Island Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Turtle Rock', player), And(Has('Moon Pearl', player), has_sword(player), lambda state: state.has_turtle_rock_medallion(player), CanReach('Turtle Rock (Top)', 'Region', player)))  # sword required to cast magic (!)
 
-    set_rule(world.get_entrance('Pyramid Hole', player), lambda state: state.has('Beat Agahnim 2', player) or world.open_pyramid[player])
+    set_rule(world.get_entrance('Pyramid Hole', player), Or(Has('Beat Agahnim 2', player), world.open_pyramid[player]))
 
     if world.swordless[player]:
         swordless_rules(world, player)
@@ -523,151 +543,151 @@ def default_rules(world, player):
 
 def inverted_rules(world, player):
     # s&q regions.
-    set_rule(world.get_entrance('Castle Ledge S&Q', player), lambda state: state.has('Magic Mirror', player) and state.has('Beat Agahnim 1', player))
+    set_rule(world.get_entrance('Castle Ledge S&Q', player), And(Has('Magic Mirror', player), Has('Beat Agahnim 1', player)))
 
     # overworld requirements 
-    set_rule(world.get_location('Maze Race', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Mini Moldorm Cave', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Ice Rod Cave', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Light Hype Fairy', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Potion Shop Pier', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Light World Pier', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Kings Grave', player), lambda state: state.has('Pegasus Boots', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Kings Grave Outer Rocks', player), lambda state: state.can_lift_heavy_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Kings Grave Inner Rocks', player), lambda state: state.can_lift_heavy_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Potion Shop Inner Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Potion Shop Outer Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Potion Shop Outer Rock', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Potion Shop Inner Rock', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Graveyard Cave Inner Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Graveyard Cave Outer Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Secret Passage Inner Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Secret Passage Outer Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bonk Fairy (Light)', player), lambda state: state.has('Pegasus Boots', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bat Cave Drop Ledge', player), lambda state: state.has('Hammer', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Lumberjack Tree Tree', player), lambda state: state.has('Pegasus Boots', player) and state.has('Moon Pearl', player) and state.has('Beat Agahnim 1', player))
-    set_rule(world.get_entrance('Bonk Rock Cave', player), lambda state: state.has('Pegasus Boots', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Desert Palace Stairs', player), lambda state: state.has('Book of Mudora', player))  # bunny can use book
-    set_rule(world.get_entrance('Sanctuary Grave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('20 Rupee Cave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('50 Rupee Cave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Death Mountain Entrance Rock', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bumper Cave Entrance Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark Lake Hylia Central Island Teleporter', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Dark Desert Teleporter', player), lambda state: state.has('Activated Flute', player) and state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('East Dark World Teleporter', player), lambda state: state.has('Hammer', player) and state.can_lift_rocks(player) and state.has('Moon Pearl', player)) # bunny cannot use hammer
-    set_rule(world.get_entrance('South Dark World Teleporter', player), lambda state: state.has('Hammer', player) and state.can_lift_rocks(player) and state.has('Moon Pearl', player)) # bunny cannot use hammer
-    set_rule(world.get_entrance('West Dark World Teleporter', player), lambda state: ((state.has('Hammer', player) and state.can_lift_rocks(player)) or state.can_lift_heavy_rocks(player)) and state.has('Moon Pearl', player))
-    set_rule(world.get_location('Flute Spot', player), lambda state: state.has('Shovel', player) and state.has('Moon Pearl', player))
-
-    set_rule(world.get_location('Zora\'s Ledge', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Waterfall of Wishing Cave', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Northeast Light World Return', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_location('Frog', player), lambda state: state.can_lift_heavy_rocks(player) and (state.has('Moon Pearl', player) or state.has('Beat Agahnim 1', player)) or (state.can_reach('Light World', 'Region', player) and state.has('Magic Mirror', player))) # Need LW access using Mirror or Portal
-    set_rule(world.get_location('Missing Smith', player), lambda state: state.has('Get Frog', player) and state.can_reach('Blacksmiths Hut', 'Region', player)) # Can't S&Q with smith
-    set_rule(world.get_location('Blacksmith', player), lambda state: state.has('Return Smith', player))
-    set_rule(world.get_location('Magic Bat', player), lambda state: state.has('Magic Powder', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_location('Sick Kid', player), lambda state: state.has_group("Bottles", player))
-    set_rule(world.get_location('Mushroom', player), lambda state: state.has('Moon Pearl', player)) # need pearl to pick up bushes
-    set_rule(world.get_entrance('Bush Covered Lawn Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Bush Covered Lawn Inner Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bush Covered Lawn Outer Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bomb Hut Inner Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Bomb Hut Outer Bushes', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Light World Bomb Hut', player), lambda state: state.has('Moon Pearl', player)) # need bomb
-    set_rule(world.get_entrance('North Fairy Cave Drop', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Lost Woods Hideout Drop', player), lambda state: state.has('Moon Pearl', player))
-    set_rule(world.get_location('Potion Shop', player), lambda state: state.has('Mushroom', player) and (state.can_reach('Potion Shop Area', 'Region', player))) # new inverted region, need pearl for bushes or access to potion shop door/waterfall fairy
-    set_rule(world.get_entrance('Desert Palace Entrance (North) Rocks', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Desert Ledge Return Rocks', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))  # should we decide to place something that is not a dungeon end up there at some point
-    set_rule(world.get_entrance('Checkerboard Cave', player), lambda state: state.can_lift_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Hyrule Castle Secret Entrance Drop', player), lambda state: state.has('Moon Pearl', player))
+    set_rule(world.get_location('Maze Race', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Mini Moldorm Cave', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Ice Rod Cave', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Light Hype Fairy', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Potion Shop Pier', player), And(Has('Flippers', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Light World Pier', player), And(Has('Flippers', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Kings Grave', player), And(Has('Pegasus Boots', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Kings Grave Outer Rocks', player), And(can_lift_heavy_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Kings Grave Inner Rocks', player), And(can_lift_heavy_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Potion Shop Inner Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Potion Shop Outer Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Potion Shop Outer Rock', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Potion Shop Inner Rock', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Graveyard Cave Inner Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Graveyard Cave Outer Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Secret Passage Inner Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Secret Passage Outer Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Bonk Fairy (Light)', player), And(Has('Pegasus Boots', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Bat Cave Drop Ledge', player), And(Has('Hammer', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Lumberjack Tree Tree', player), And(Has('Pegasus Boots', player), Has('Moon Pearl', player), Has('Beat Agahnim 1', player)))
+    set_rule(world.get_entrance('Bonk Rock Cave', player), And(Has('Pegasus Boots', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Desert Palace Stairs', player), Has('Book of Mudora', player))  # bunny can use book
+    set_rule(world.get_entrance('Sanctuary Grave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('20 Rupee Cave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('50 Rupee Cave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Death Mountain Entrance Rock', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Bumper Cave Entrance Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark Lake Hylia Central Island Teleporter', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Dark Desert Teleporter', player), And(Has('Activated Flute', player), can_lift_heavy_rocks(player)))
+    set_rule(world.get_entrance('East Dark World Teleporter', player), And(Has('Hammer', player), can_lift_rocks(player), Has('Moon Pearl', player))) # bunny cannot use hammer
+    set_rule(world.get_entrance('South Dark World Teleporter', player), And(Has('Hammer', player), can_lift_rocks(player), Has('Moon Pearl', player))) # bunny cannot use hammer
+    set_rule(world.get_entrance('West Dark World Teleporter', player), And(Or(And(Has('Hammer', player), can_lift_rocks(player)), can_lift_heavy_rocks(player)), Has('Moon Pearl', player)))
+    set_rule(world.get_location('Flute Spot', player), And(Has('Shovel', player), Has('Moon Pearl', player)))
+
+    set_rule(world.get_location('Zora\'s Ledge', player), And(Has('Flippers', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Waterfall of Wishing Cave', player), And(Has('Flippers', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Northeast Light World Return', player), And(Has('Flippers', player), Has('Moon Pearl', player)))
+    set_rule(world.get_location('Frog', player), Or(And(can_lift_heavy_rocks(player), Or(Has('Moon Pearl', player), Has('Beat Agahnim 1', player))), And(CanReach('Light World', 'Region', player), Has('Magic Mirror', player)))) # Need LW access using Mirror or Portal
+    set_rule(world.get_location('Missing Smith', player), And(Has('Get Frog', player), CanReach('Blacksmiths Hut', 'Region', player))) # Can't S&Q with smith
+    set_rule(world.get_location('Blacksmith', player), Has('Return Smith', player))
+    set_rule(world.get_location('Magic Bat', player), And(Has('Magic Powder', player), Has('Moon Pearl', player)))
+    set_rule(world.get_location('Sick Kid', player), HasAny(item_name_groups['Bottles'], player))
+    set_rule(world.get_location('Mushroom', player), Has('Moon Pearl', player)) # need pearl to pick up bushes
+    set_rule(world.get_entrance('Bush Covered Lawn Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Bush Covered Lawn Inner Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Bush Covered Lawn Outer Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Bomb Hut Inner Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Bomb Hut Outer Bushes', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Light World Bomb Hut', player), Has('Moon Pearl', player)) # need bomb
+    set_rule(world.get_entrance('North Fairy Cave Drop', player), Has('Moon Pearl', player))
+    set_rule(world.get_entrance('Lost Woods Hideout Drop', player), Has('Moon Pearl', player))
+    set_rule(world.get_location('Potion Shop', player), And(Has('Mushroom', player), CanReach('Potion Shop Area', 'Region', player))) # new inverted region, need pearl for bushes or access to potion shop door/waterfall fairy
+    set_rule(world.get_entrance('Desert Palace Entrance (North) Rocks', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Desert Ledge Return Rocks', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))  # should we decide to place something that is not a dungeon end up there at some point
+    set_rule(world.get_entrance('Checkerboard Cave', player), And(can_lift_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Hyrule Castle Secret Entrance Drop', player), Has('Moon Pearl', player))
     set_rule(world.get_entrance('Old Man Cave Exit (West)', player), lambda state: False)  # drop cannot be climbed up
-    set_rule(world.get_entrance('Broken Bridge (West)', player), lambda state: state.has('Hookshot', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Broken Bridge (East)', player), lambda state: state.has('Hookshot', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Dark Death Mountain Teleporter (East Bottom)', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Fairy Ascension Rocks', player), lambda state: state.can_lift_heavy_rocks(player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Paradox Cave Push Block Reverse', player), lambda state: state.has('Mirror', player))  # can erase block
-    set_rule(world.get_entrance('Death Mountain (Top)', player), lambda state: state.has('Hammer', player) and state.has('Moon Pearl', player))
-    set_rule(world.get_entrance('Dark Death Mountain Teleporter (East)', player), lambda state: state.can_lift_heavy_rocks(player) and state.has('Hammer', player) and state.has('Moon Pearl', player))  # bunny cannot use hammer
-    set_rule(world.get_entrance('East Death Mountain (Top)', player), lambda state: state.has('Hammer', player) and state.has('Moon Pearl', player))  # bunny can not use hammer
-
-    set_rule(world.get_entrance('Catfish Entrance Rock', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Northeast Dark World Broken Bridge Pass', player), lambda state: ((state.can_lift_rocks(player) or state.has('Hammer', player)) or state.has('Flippers', player)))
-    set_rule(world.get_entrance('East Dark World Broken Bridge Pass', player), lambda state: (state.can_lift_rocks(player) or state.has('Hammer', player)))
-    set_rule(world.get_entrance('South Dark World Bridge', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Bonk Fairy (Dark)', player), lambda state: state.has('Pegasus Boots', player))
-    set_rule(world.get_entrance('West Dark World Gap', player), lambda state: state.has('Hookshot', player))
-    set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: state.has('Flippers', player))
+    set_rule(world.get_entrance('Broken Bridge (West)', player), And(Has('Hookshot', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Broken Bridge (East)', player), And(Has('Hookshot', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Dark Death Mountain Teleporter (East Bottom)', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Fairy Ascension Rocks', player), And(can_lift_heavy_rocks(player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Paradox Cave Push Block Reverse', player), Has('Mirror', player))  # can erase block
+    set_rule(world.get_entrance('Death Mountain (Top)', player), And(Has('Hammer', player), Has('Moon Pearl', player)))
+    set_rule(world.get_entrance('Dark Death Mountain Teleporter (East)', player), And(can_lift_heavy_rocks(player), Has('Hammer', player), Has('Moon Pearl', player)))  # bunny cannot use hammer
+    set_rule(world.get_entrance('East Death Mountain (Top)', player), And(Has('Hammer', player), Has('Moon Pearl', player)))  # bunny can not use hammer
+
+    set_rule(world.get_entrance('Catfish Entrance Rock', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Northeast Dark World Broken Bridge Pass', player), Or(Or(can_lift_rocks(player), Has('Hammer', player)), Has('Flippers', player)))
+    set_rule(world.get_entrance('East Dark World Broken Bridge Pass', player), Or(can_lift_rocks(player), Has('Hammer', player)))
+    set_rule(world.get_entrance('South Dark World Bridge', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Bonk Fairy (Dark)', player), Has('Pegasus Boots', player))
+    set_rule(world.get_entrance('West Dark World Gap', player), Has('Hookshot', player))
+    set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), Has('Flippers', player))
     set_rule(world.get_location('Bombos Tablet', player), lambda state: state.can_retrieve_tablet(player))
-    set_rule(world.get_entrance('Dark Lake Hylia Drop (South)', player), lambda state: state.has('Flippers', player))  # ToDo any fake flipper set up?
-    set_rule(world.get_entrance('Dark Lake Hylia Ledge Pier', player), lambda state: state.has('Flippers', player))
-    set_rule(world.get_entrance('Dark Lake Hylia Ledge Spike Cave', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: state.has('Flippers', player))  # Fake Flippers
-    set_rule(world.get_entrance('Dark Lake Hylia Shallows', player), lambda state: state.has('Flippers', player))
-    set_rule(world.get_entrance('Village of Outcasts Heavy Rock', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('East Dark World Bridge', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('East Dark World River Pier', player), lambda state: state.has('Flippers', player))
-    set_rule(world.get_entrance('Bumper Cave Entrance Rock', player), lambda state: state.can_lift_rocks(player))
-    set_rule(world.get_entrance('Bumper Cave Ledge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Hammer Peg Area Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark World Hammer Peg Cave', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Village of Outcasts Eastern Rocks', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Peg Area Rocks', player), lambda state: state.can_lift_heavy_rocks(player))
-    set_rule(world.get_entrance('Village of Outcasts Pegs', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Grassy Lawn Pegs', player), lambda state: state.has('Hammer', player))
-    set_rule(world.get_entrance('Bumper Cave Exit (Top)', player), lambda state: state.has('Cape', player))
-    set_rule(world.get_entrance('Bumper Cave Exit (Bottom)', player), lambda state: state.has('Cape', player) or state.has('Hookshot', player))
-
-    set_rule(world.get_entrance('Skull Woods Final Section', player), lambda state: state.has('Fire Rod', player))
-    set_rule(world.get_entrance('Misery Mire', player), lambda state: state.has_sword(player) and state.has_misery_mire_medallion(player))  # sword required to cast magic (!)
-
-    set_rule(world.get_entrance('Hookshot Cave', player), lambda state: state.can_lift_rocks(player))
-
-    set_rule(world.get_entrance('East Death Mountain Mirror Spot (Top)', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Death Mountain (Top) Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-
-    set_rule(world.get_entrance('East Death Mountain Mirror Spot (Bottom)', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark Death Mountain Ledge Mirror Spot (East)', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Dark Death Mountain Ledge Mirror Spot (West)', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Laser Bridge Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Floating Island Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Turtle Rock', player), lambda state: state.has_sword(player) and state.has_turtle_rock_medallion(player) and state.can_reach('Turtle Rock (Top)', 'Region', player)) # sword required to cast magic (!)
+    set_rule(world.get_entrance('Dark Lake Hylia Drop (South)', player), Has('Flippers', player))  # ToDo any fake flipper set up?
+    set_rule(world.get_entrance('Dark Lake Hylia Ledge Pier', player), Has('Flippers', player))
+    set_rule(world.get_entrance('Dark Lake Hylia Ledge Spike Cave', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), Has('Flippers', player))  # Fake Flippers
+    set_rule(world.get_entrance('Dark Lake Hylia Shallows', player), Has('Flippers', player))
+    set_rule(world.get_entrance('Village of Outcasts Heavy Rock', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('East Dark World Bridge', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Lake Hylia Central Island Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('East Dark World River Pier', player), Has('Flippers', player))
+    set_rule(world.get_entrance('Bumper Cave Entrance Rock', player), can_lift_rocks(player))
+    set_rule(world.get_entrance('Bumper Cave Ledge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Hammer Peg Area Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark World Hammer Peg Cave', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Village of Outcasts Eastern Rocks', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Peg Area Rocks', player), can_lift_heavy_rocks(player))
+    set_rule(world.get_entrance('Village of Outcasts Pegs', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Grassy Lawn Pegs', player), Has('Hammer', player))
+    set_rule(world.get_entrance('Bumper Cave Exit (Top)', player), Has('Cape', player))
+    set_rule(world.get_entrance('Bumper Cave Exit (Bottom)', player), Or(Has('Cape', player), Has('Hookshot', player)))
+
+    set_rule(world.get_entrance('Skull Woods Final Section', player), Has('Fire Rod', player))
+    set_rule(world.get_entrance('Misery Mire', player), And(has_sword(player), lambda state: state.has_misery_mire_medallion(player)))  # sword required to cast magic (!)
+
+    set_rule(world.get_entrance('Hookshot Cave', player), can_lift_rocks(player))
+
+    set_rule(world.get_entrance('East Death Mountain Mirror Spot (Top)', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Death Mountain (Top) Mirror Spot', player), Has('Magic Mirror', player))
+
+    set_rule(world.get_entrance('East Death Mountain Mirror Spot (Bottom)', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark Death Mountain Ledge Mirror Spot (East)', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Dark Death Mountain Ledge Mirror Spot (West)', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Laser Bridge Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Floating Island Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Turtle Rock', player), And(has_sword(player), lambda state: state.has_turtle_rock_medallion(player), CanReach('Turtle Rock (Top)', 'Region', player))) # sword required to cast magic (!)
 
     # new inverted spots
-    set_rule(world.get_entrance('Post Aga Teleporter', player), lambda state: state.has('Beat Agahnim 1', player))
-    set_rule(world.get_entrance('Mire Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Desert Palace Stairs Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Death Mountain Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('East Dark World Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('West Dark World Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('South Dark World Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Catfish Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Potion Shop Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Shopping Mall Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Maze Race Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Desert Palace North Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Death Mountain (Top) Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Graveyard Cave Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Bomb Hut Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
-    set_rule(world.get_entrance('Skull Woods Mirror Spot', player), lambda state: state.has('Magic Mirror', player))
+    set_rule(world.get_entrance('Post Aga Teleporter', player), Has('Beat Agahnim 1', player))
+    set_rule(world.get_entrance('Mire Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Desert Palace Stairs Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Death Mountain Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('East Dark World Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('West Dark World Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('South Dark World Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Catfish Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Potion Shop Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Shopping Mall Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Maze Race Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Desert Palace North Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Death Mountain (Top) Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Graveyard Cave Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Bomb Hut Mirror Spot', player), Has('Magic Mirror', player))
+    set_rule(world.get_entrance('Skull Woods Mirror Spot', player), Has('Magic Mirror', player))
 
     # inverted flute spots
 
-    set_rule(world.get_entrance('DDM Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('NEDW Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('WDW Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('SDW Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('EDW Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('DLHL Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('DD Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('EDDM Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('Dark Grassy Lawn Flute', player), lambda state: state.has('Activated Flute', player))
-    set_rule(world.get_entrance('Hammer Peg Area Flute', player), lambda state: state.has('Activated Flute', player))
+    set_rule(world.get_entrance('DDM Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('NEDW Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('WDW Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('SDW Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('EDW Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('DLHL Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('DD Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('EDDM Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('Dark Grassy Lawn Flute', player), Has('Activated Flute', player))
+    set_rule(world.get_entrance('Hammer Peg Area Flute', player), Has('Activated Flute', player))
 
-    set_rule(world.get_entrance('Inverted Pyramid Hole', player), lambda state: state.has('Beat Agahnim 2', player) or world.open_pyramid[player])
+    set_rule(world.get_entrance('Inverted Pyramid Hole', player), Or(Has('Beat Agahnim 2', player), world.open_pyramid[player]))
 
     if world.swordless[player]:
         swordless_rules(world, player)
@@ -675,38 +695,38 @@ def inverted_rules(world, player):
 def no_glitches_rules(world, player):
     """"""
     if world.mode[player] == 'inverted':
-        set_rule(world.get_entrance('Zoras River', player), lambda state: state.has('Moon Pearl', player) and (state.has('Flippers', player) or state.can_lift_rocks(player)))
-        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))  # can be fake flippered to
-        set_rule(world.get_entrance('Lake Hylia Island Pier', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))  # can be fake flippered to
-        set_rule(world.get_entrance('Lake Hylia Warp', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))  # can be fake flippered to
-        set_rule(world.get_entrance('Northeast Light World Warp', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))  # can be fake flippered to
-        set_rule(world.get_entrance('Hobo Bridge', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), lambda state: state.has('Flippers', player))
-        set_rule(world.get_entrance('East Dark World Pier', player), lambda state: state.has('Flippers', player))
+        set_rule(world.get_entrance('Zoras River', player), And(Has('Moon Pearl', player), Or(Has('Flippers', player), can_lift_rocks(player))))
+        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), And(Has('Moon Pearl', player), Has('Flippers', player)))  # can be fake flippered to
+        set_rule(world.get_entrance('Lake Hylia Island Pier', player), And(Has('Moon Pearl', player), Has('Flippers', player)))  # can be fake flippered to
+        set_rule(world.get_entrance('Lake Hylia Warp', player), And(Has('Moon Pearl', player), Has('Flippers', player)))  # can be fake flippered to
+        set_rule(world.get_entrance('Northeast Light World Warp', player), And(Has('Moon Pearl', player), Has('Flippers', player)))  # can be fake flippered to
+        set_rule(world.get_entrance('Hobo Bridge', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), Has('Flippers', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), Has('Flippers', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), Has('Flippers', player))
+        set_rule(world.get_entrance('East Dark World Pier', player), Has('Flippers', player))
     else:
-        set_rule(world.get_entrance('Zoras River', player), lambda state: state.has('Flippers', player) or state.can_lift_rocks(player))
-        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), lambda state: state.has('Flippers', player))  # can be fake flippered to
-        set_rule(world.get_entrance('Hobo Bridge', player), lambda state: state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-
-    add_rule(world.get_entrance('Ganons Tower (Double Switch Room)', player), lambda state: state.has('Hookshot', player))
+        set_rule(world.get_entrance('Zoras River', player), Or(Has('Flippers', player), can_lift_rocks(player)))
+        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), Has('Flippers', player))  # can be fake flippered to
+        set_rule(world.get_entrance('Hobo Bridge', player), Has('Flippers', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+
+    add_rule(world.get_entrance('Ganons Tower (Double Switch Room)', player), Has('Hookshot', player))
     set_rule(world.get_entrance('Paradox Cave Push Block Reverse', player), lambda state: False)  # no glitches does not require block override
     forbid_bomb_jump_requirements(world, player)
     add_conditional_lamps(world, player)
 
 def fake_flipper_rules(world, player):
     if world.mode[player] == 'inverted':
-        set_rule(world.get_entrance('Zoras River', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Lake Hylia Island Pier', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Lake Hylia Warp', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Northeast Light World Warp', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Hobo Bridge', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: state.has('Flippers', player))
+        set_rule(world.get_entrance('Zoras River', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Lake Hylia Island Pier', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Lake Hylia Warp', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Northeast Light World Warp', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Hobo Bridge', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), Has('Flippers', player))
         set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: True)
         set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), lambda state: True)
         set_rule(world.get_entrance('East Dark World Pier', player), lambda state: True)
@@ -716,17 +736,17 @@ def fake_flipper_rules(world, player):
         set_rule(world.get_entrance('Zoras River', player), lambda state: True)
         set_rule(world.get_entrance('Lake Hylia Central Island Pier', player), lambda state: True)
         set_rule(world.get_entrance('Hobo Bridge', player), lambda state: True)
-        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), lambda state: state.has('Moon Pearl', player) and state.has('Flippers', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), lambda state: state.has('Moon Pearl', player))
-        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), lambda state: state.has('Moon Pearl', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Drop (East)', player), And(Has('Moon Pearl', player), Has('Flippers', player)))
+        set_rule(world.get_entrance('Dark Lake Hylia Teleporter', player), Has('Moon Pearl', player))
+        set_rule(world.get_entrance('Dark Lake Hylia Ledge Drop', player), Has('Moon Pearl', player))
         #qirn jump
-        set_rule(world.get_entrance('East Dark World River Pier', player), lambda state: state.has('Moon Pearl', player))
+        set_rule(world.get_entrance('East Dark World River Pier', player), Has('Moon Pearl', player))
 
 
 def forbid_bomb_jump_requirements(world, player):
     DMs_room_chests = ['Ganons Tower - DMs Room - Top Left', 'Ganons Tower - DMs Room - Top Right', 'Ganons Tower - DMs Room - Bottom Left', 'Ganons Tower - DMs Room - Bottom Right']
     for location in DMs_room_chests:
-        add_rule(world.get_location(location, player), lambda state: state.has('Hookshot', player))
+        add_rule(world.get_location(location, player), Has('Hookshot', player))
     set_rule(world.get_entrance('Paradox Cave Bomb Jump', player), lambda state: False)
     set_rule(world.get_entrance('Skull Woods First Section Bomb Jump', player), lambda state: False)
 
@@ -802,24 +822,24 @@ def add_conditional_lamps(world, player):
 def open_rules(world, player):
     # softlock protection as you can reach the sewers small key door with a guard drop key
     set_rule(world.get_location('Hyrule Castle - Boomerang Chest', player),
-             lambda state: state._lttp_has_key('Small Key (Hyrule Castle)', player))
+             has_key(world, 'Small Key (Hyrule Castle)', player))
     set_rule(world.get_location('Hyrule Castle - Zelda\'s Chest', player),
-             lambda state: state._lttp_has_key('Small Key (Hyrule Castle)', player))
+             has_key(world, 'Small Key (Hyrule Castle)', player))
 
 
 def swordless_rules(world, player):
-    set_rule(world.get_entrance('Agahnim 1', player), lambda state: (state.has('Hammer', player) or state.has('Fire Rod', player) or state.can_shoot_arrows(player) or state.has('Cane of Somaria', player)) and state._lttp_has_key('Small Key (Agahnims Tower)', player, 2))
-    set_rule(world.get_entrance('Skull Woods Torch Room', player), lambda state: state._lttp_has_key('Small Key (Skull Woods)', player, 3) and state.has('Fire Rod', player))  # no curtain
-    set_rule(world.get_entrance('Ice Palace Entrance Room', player), lambda state: state.has('Fire Rod', player) or state.has('Bombos', player)) #in swordless mode bombos pads are present in the relevant parts of ice palace
-    set_rule(world.get_entrance('Ganon Drop', player), lambda state: state.has('Hammer', player))  # need to damage ganon to get tiles to drop
+    set_rule(world.get_entrance('Agahnim 1', player), And(Or(Has('Hammer', player), Has('Fire Rod', player), lambda state: state.can_shoot_arrows(player), Has('Cane of Somaria', player)), has_key(world, 'Small Key (Agahnims Tower)', player, 2)))
+    set_rule(world.get_entrance('Skull Woods Torch Room', player), And(has_key(world, 'Small Key (Skull Woods)', player, 3), Has('Fire Rod', player)))  # no curtain
+    set_rule(world.get_entrance('Ice Palace Entrance Room', player), Or(Has('Fire Rod', player), Has('Bombos', player))) #in swordless mode bombos pads are present in the relevant parts of ice palace
+    set_rule(world.get_entrance('Ganon Drop', player), Has('Hammer', player))  # need to damage ganon to get tiles to drop
 
     if world.mode[player] != 'inverted':
-        set_rule(world.get_entrance('Agahnims Tower', player), lambda state: state.has('Cape', player) or state.has('Hammer', player) or state.has('Beat Agahnim 1', player))  # barrier gets removed after killing agahnim, relevant for entrance shuffle
-        set_rule(world.get_entrance('Turtle Rock', player), lambda state: state.has('Moon Pearl', player) and state.has_turtle_rock_medallion(player) and state.can_reach('Turtle Rock (Top)', 'Region', player))   # sword not required to use medallion for opening in swordless (!)
-        set_rule(world.get_entrance('Misery Mire', player), lambda state: state.has('Moon Pearl', player) and state.has_misery_mire_medallion(player))  # sword not required to use medallion for opening in swordless (!)
+        set_rule(world.get_entrance('Agahnims Tower', player), Or(Has('Cape', player), Has('Hammer', player), Has('Beat Agahnim 1', player)))  # barrier gets removed after killing agahnim, relevant for entrance shuffle
+        set_rule(world.get_entrance('Turtle Rock', player), And(Has('Moon Pearl', player), lambda state: state.has_turtle_rock_medallion(player), CanReach('Turtle Rock (Top)', 'Region', player)))   # sword not required to use medallion for opening in swordless (!)
+        set_rule(world.get_entrance('Misery Mire', player), And(Has('Moon Pearl', player), lambda state: state.has_misery_mire_medallion(player)))  # sword not required to use medallion for opening in swordless (!)
     else:
         # only need ddm access for aga tower in inverted
-        set_rule(world.get_entrance('Turtle Rock', player), lambda state: state.has_turtle_rock_medallion(player) and state.can_reach('Turtle Rock (Top)', 'Region', player))   # sword not required to use medallion for opening in swordless (!)
+        set_rule(world.get_entrance('Turtle Rock', player), And(lambda state: state.has_turtle_rock_medallion(player), CanReach('Turtle Rock (Top)', 'Region', player)))   # sword not required to use medallion for opening in swordless (!)
         set_rule(world.get_entrance('Misery Mire', player), lambda state: state.has_misery_mire_medallion(player))  # sword not required to use medallion for opening in swordless (!)
 
 
@@ -833,10 +853,10 @@ def add_connection(parent_name, target_name, entrance_name, world, player):
 def standard_rules(world, player):
     add_connection('Menu', 'Hyrule Castle Secret Entrance', 'Uncle S&Q', world, player)
     world.get_entrance('Uncle S&Q', player).hide_path = True
-    set_rule(world.get_entrance('Hyrule Castle Exit (East)', player), lambda state: state.can_reach('Sanctuary', 'Region', player))
-    set_rule(world.get_entrance('Hyrule Castle Exit (West)', player), lambda state: state.can_reach('Sanctuary', 'Region', player))
-    set_rule(world.get_entrance('Links House S&Q', player), lambda state: state.can_reach('Sanctuary', 'Region', player))
-    set_rule(world.get_entrance('Sanctuary S&Q', player), lambda state: state.can_reach('Sanctuary', 'Region', player))
+    set_rule(world.get_entrance('Hyrule Castle Exit (East)', player), CanReach('Sanctuary', 'Region', player))
+    set_rule(world.get_entrance('Hyrule Castle Exit (West)', player), CanReach('Sanctuary', 'Region', player))
+    set_rule(world.get_entrance('Links House S&Q', player), CanReach('Sanctuary', 'Region', player))
+    set_rule(world.get_entrance('Sanctuary S&Q', player), CanReach('Sanctuary', 'Region', player))
 
 def toss_junk_item(world, player):
     items = ['Rupees (20)', 'Bombs (3)', 'Arrows (10)', 'Rupees (5)', 'Rupee (1)', 'Bombs (10)',
@@ -884,19 +904,19 @@ def set_trock_key_rules(world, player):
 
     # Big key door requires the big key, obviously. We removed this rule in the previous section to flag front_locked_locations correctly,
     # otherwise crystaroller room might not be properly marked as reachable through the back.
-    set_rule(world.get_entrance('Turtle Rock Big Key Door', player), lambda state: state.has('Big Key (Turtle Rock)', player))
+    set_rule(world.get_entrance('Turtle Rock Big Key Door', player), Has('Big Key (Turtle Rock)', player))
 
     # No matter what, the key requirement for going from the middle to the bottom should be three keys.
-    set_rule(world.get_entrance('Turtle Rock Dark Room Staircase', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 3))
+    set_rule(world.get_entrance('Turtle Rock Dark Room Staircase', player), has_key(world, 'Small Key (Turtle Rock)', player, 3))
 
     # Now we need to set rules based on which entrances we have access to. The most important point is whether we have back access. If we have back access, we
     # might open all the locked doors in any order so we need maximally restrictive rules.
     if can_reach_back:
-        set_rule(world.get_location('Turtle Rock - Big Key Chest', player), lambda state: (state._lttp_has_key('Small Key (Turtle Rock)', player, 4) or item_name(state, 'Turtle Rock - Big Key Chest', player) == ('Small Key (Turtle Rock)', player)))
-        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (South)', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 4))
+        set_rule(world.get_location('Turtle Rock - Big Key Chest', player), Or(has_key(world, 'Small Key (Turtle Rock)', player, 4), lambda state: item_name(state, 'Turtle Rock - Big Key Chest', player) == ('Small Key (Turtle Rock)', player)))
+        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (South)', player), has_key(world, 'Small Key (Turtle Rock)', player, 4))
         # Only consider wasting the key on the Trinexx door for going from the front entrance to middle section.  If other key doors are accessible, then these doors can be avoided
-        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (North)', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 3))
-        set_rule(world.get_entrance('Turtle Rock Pokey Room', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 2))
+        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (North)', player), has_key(world, 'Small Key (Turtle Rock)', player, 3))
+        set_rule(world.get_entrance('Turtle Rock Pokey Room', player), has_key(world, 'Small Key (Turtle Rock)', player, 2))
     else:
         # Middle to front requires 2 keys if the back is locked, otherwise 4
         set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (South)', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 2)
@@ -904,8 +924,8 @@ def set_trock_key_rules(world, player):
                 else state._lttp_has_key('Small Key (Turtle Rock)', player, 4))
 
         # Front to middle requires 2 keys (if the middle is accessible then these doors can be avoided, otherwise no keys can be wasted)
-        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (North)', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 2))
-        set_rule(world.get_entrance('Turtle Rock Pokey Room', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, 1))
+        set_rule(world.get_entrance('Turtle Rock (Chain Chomp Room) (North)', player), has_key(world, 'Small Key (Turtle Rock)', player, 2))
+        set_rule(world.get_entrance('Turtle Rock Pokey Room', player), has_key(world, 'Small Key (Turtle Rock)', player, 1))
 
         set_rule(world.get_location('Turtle Rock - Big Key Chest', player), lambda state: state._lttp_has_key('Small Key (Turtle Rock)', player, tr_big_key_chest_keys_needed(state)))
 
@@ -1062,7 +1082,7 @@ def set_big_bomb_rules(world, player):
                                          'Desert Palace Entrance (South)',
                                          'Checkerboard Cave']
 
-    set_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.can_reach('East Dark World', 'Region', player) and state.can_reach('Big Bomb Shop', 'Region', player) and state.has('Crystal 5', player) and state.has('Crystal 6', player))
+    set_rule(world.get_entrance('Pyramid Fairy', player), And(CanReach('East Dark World', 'Region', player), CanReach('Big Bomb Shop', 'Region', player), Has('Crystal 5', player), Has('Crystal 6', player)))
 
     #crossing peg bridge starting from the southern dark world
     def cross_peg_bridge(state):
@@ -1089,92 +1109,92 @@ def set_big_bomb_rules(world, player):
         #1. basic routes
         #2. Can reach Eastern dark world some other way, mirror, get bomb, return to mirror spot, walk to pyramid: Needs mirror
         # -> M or BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: basic_routes(state) or state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(lambda state: basic_routes(state), Has('Magic Mirror', player)))
     elif bombshop_entrance.name in LW_walkable_entrances:
         #1. Mirror then basic routes
         # -> M and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Magic Mirror', player), lambda state: basic_routes(state)))
     elif bombshop_entrance.name in Northern_DW_entrances:
         #1. Mirror and basic routes
         #2. Go to south DW and then cross peg bridge: Need Mitts and hammer and moon pearl
         # -> (Mitts and CPB) or (M and BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.can_lift_heavy_rocks(player) and cross_peg_bridge(state)) or (state.has('Magic Mirror', player) and basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(And(can_lift_heavy_rocks(player), lambda state: cross_peg_bridge(state)), And(Has('Magic Mirror', player), lambda state: basic_routes(state))))
     elif bombshop_entrance.name == 'Bumper Cave (Bottom)':
         #1. Mirror and Lift rock and basic_routes
         #2. Mirror and Flute and basic routes (can make difference if accessed via insanity or w/ mirror from connector, and then via hyrule castle gate, because no gloves are needed in that case)
         #3. Go to south DW and then cross peg bridge: Need Mitts and hammer and moon pearl
         # -> (Mitts and CPB) or (((G or Flute) and M) and BR))
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.can_lift_heavy_rocks(player) and cross_peg_bridge(state)) or (((state.can_lift_rocks(player) or state.has('Flute', player)) and state.has('Magic Mirror', player)) and basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(And(can_lift_heavy_rocks(player), lambda state: cross_peg_bridge(state)), And(And(Or(can_lift_rocks(player), Has('Flute', player)), Has('Magic Mirror', player)), lambda state: basic_routes(state))))
     elif bombshop_entrance.name in Southern_DW_entrances:
         #1. Mirror and enter via gate: Need mirror and Aga1
         #2. cross peg bridge: Need hammer and moon pearl
         # -> CPB or (M and A)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: cross_peg_bridge(state) or (state.has('Magic Mirror', player) and state.has('Beat Agahnim 1', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(lambda state: cross_peg_bridge(state), And(Has('Magic Mirror', player), Has('Beat Agahnim 1', player))))
     elif bombshop_entrance.name in Isolated_DW_entrances:
         # 1. mirror then flute then basic routes
         # -> M and Flute and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player) and state.has('Activated Flute', player) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Magic Mirror', player), Has('Activated Flute', player), lambda state: basic_routes(state)))
     elif bombshop_entrance.name in Isolated_LW_entrances:
         # 1. flute then basic routes
         # Prexisting mirror spot is not permitted, because mirror might have been needed to reach these isolated locations.
         # -> Flute and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Activated Flute', player), lambda state: basic_routes(state)))
     elif bombshop_entrance.name in West_LW_DM_entrances:
         # 1. flute then basic routes or mirror
         # Prexisting mirror spot is permitted, because flute can be used to reach west DM directly.
         # -> Flute and (M or BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) and (state.has('Magic Mirror', player) or basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Activated Flute', player), Or(Has('Magic Mirror', player), lambda state: basic_routes(state))))
     elif bombshop_entrance.name in East_LW_DM_entrances:
         # 1. flute then basic routes or mirror and hookshot
         # Prexisting mirror spot is permitted, because flute can be used to reach west DM directly and then east DM via Hookshot
         # -> Flute and ((M and Hookshot) or BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) and ((state.has('Magic Mirror', player) and state.has('Hookshot', player)) or basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Activated Flute', player), Or(And(Has('Magic Mirror', player), Has('Hookshot', player)), lambda state: basic_routes(state))))
     elif bombshop_entrance.name == 'Fairy Ascension Cave (Bottom)':
         # Same as East_LW_DM_entrances except navigation without BR requires Mitts
         # -> Flute and ((M and Hookshot and Mitts) or BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) and ((state.has('Magic Mirror', player) and state.has('Hookshot', player) and state.can_lift_heavy_rocks(player)) or basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Activated Flute', player), Or(And(Has('Magic Mirror', player), Has('Hookshot', player), can_lift_heavy_rocks(player)), lambda state: basic_routes(state))))
     elif bombshop_entrance.name in Castle_ledge_entrances:
         # 1. mirror on pyramid to castle ledge, grab bomb, return through mirror spot: Needs mirror
         # 2. flute then basic routes
         # -> M or (Flute and BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player) or (state.has('Activated Flute', player) and basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Magic Mirror', player), And(Has('Activated Flute', player), lambda state: basic_routes(state))))
     elif bombshop_entrance.name in Desert_mirrorable_ledge_entrances:
         # Cases when you have mire access: Mirror to reach locations, return via mirror spot, move to center of desert, mirror anagin and:
         # 1. Have mire access, Mirror to reach locations, return via mirror spot, move to center of desert, mirror again and then basic routes
         # 2. flute then basic routes
         # -> (Mire access and M) or Flute) and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: ((state.can_reach('Dark Desert', 'Region', player) and state.has('Magic Mirror', player)) or state.has('Activated Flute', player)) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(And(CanReach('Dark Desert', 'Region', player), Has('Magic Mirror', player)), Has('Activated Flute', player)), lambda state: basic_routes(state)))
     elif bombshop_entrance.name == 'Old Man Cave (West)':
         # 1. Lift rock then basic_routes
         # 2. flute then basic_routes
         # -> (Flute or G) and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Activated Flute', player) or state.can_lift_rocks(player)) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Activated Flute', player), can_lift_rocks(player)), lambda state: basic_routes(state)))
     elif bombshop_entrance.name == 'Graveyard Cave':
         # 1. flute then basic routes
         # 2. (has west dark world access) use existing mirror spot (required Pearl), mirror again off ledge
         # -> (Flute or (M and P and West Dark World access) and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Activated Flute', player) or (state.can_reach('West Dark World', 'Region', player) and state.has('Moon Pearl', player) and state.has('Magic Mirror', player))) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Activated Flute', player), And(CanReach('West Dark World', 'Region', player), Has('Moon Pearl', player), Has('Magic Mirror', player))), lambda state: basic_routes(state)))
     elif bombshop_entrance.name in Mirror_from_SDW_entrances:
         # 1. flute then basic routes
         # 2. (has South dark world access) use existing mirror spot, mirror again off ledge
         # -> (Flute or (M and South Dark World access) and BR
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Activated Flute', player) or (state.can_reach('South Dark World', 'Region', player) and state.has('Magic Mirror', player))) and basic_routes(state))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Activated Flute', player), And(CanReach('South Dark World', 'Region', player), Has('Magic Mirror', player))), lambda state: basic_routes(state)))
     elif bombshop_entrance.name == 'Dark World Potion Shop':
         # 1. walk down by lifting rock: needs gloves and pearl`
         # 2. walk down by hammering peg: needs hammer and pearl
         # 3. mirror and basic routes
         # -> (P and (H or Gloves)) or (M and BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Moon Pearl', player) and (state.has('Hammer', player) or state.can_lift_rocks(player))) or (state.has('Magic Mirror', player) and basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(And(Has('Moon Pearl', player), Or(Has('Hammer', player), can_lift_rocks(player))), And(Has('Magic Mirror', player), lambda state: basic_routes(state))))
     elif bombshop_entrance.name == 'Kings Grave':
         # same as the Normal_LW_entrances case except that the pre-existing mirror is only possible if you have mitts
         # (because otherwise mirror was used to reach the grave, so would cancel a pre-existing mirror spot)
         # to account for insanity, must consider a way to escape without a cave for basic_routes
         # -> (M and Mitts) or ((Mitts or Flute or (M and P and West Dark World access)) and BR)
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.can_lift_heavy_rocks(player) and state.has('Magic Mirror', player)) or ((state.can_lift_heavy_rocks(player) or state.has('Activated Flute', player) or (state.can_reach('West Dark World', 'Region', player) and state.has('Moon Pearl', player) and state.has('Magic Mirror', player))) and basic_routes(state)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(And(can_lift_heavy_rocks(player), Has('Magic Mirror', player)), And(Or(can_lift_heavy_rocks(player), Has('Activated Flute', player), And(CanReach('West Dark World', 'Region', player), Has('Moon Pearl', player), Has('Magic Mirror', player))), lambda state: basic_routes(state))))
     elif bombshop_entrance.name == 'Waterfall of Wishing':
         # same as the Normal_LW_entrances case except in insanity it's possible you could be here without Flippers which
         # means you need an escape route of either Flippers or Flute
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Flippers', player) or state.has('Activated Flute', player)) and (basic_routes(state) or state.has('Magic Mirror', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Flippers', player), Has('Activated Flute', player)), Or(lambda state: basic_routes(state), Has('Magic Mirror', player))))
 
 
 def set_inverted_big_bomb_rules(world, player):
@@ -1297,7 +1317,7 @@ def set_inverted_big_bomb_rules(world, player):
                                  'Spectacle Rock Cave (Bottom)']
 
     set_rule(world.get_entrance('Pyramid Fairy', player),
-             lambda state: state.can_reach('East Dark World', 'Region', player) and state.can_reach('Inverted Big Bomb Shop', 'Region', player) and state.has('Crystal 5', player) and state.has('Crystal 6', player))
+             And(CanReach('East Dark World', 'Region', player), CanReach('Inverted Big Bomb Shop', 'Region', player), Has('Crystal 5', player), Has('Crystal 6', player)))
 
     # Key for below abbreviations:
     # P = pearl
@@ -1310,53 +1330,53 @@ def set_inverted_big_bomb_rules(world, player):
         pass
     elif bombshop_entrance.name in Normal_LW_entrances:
         # Just walk to the castle and mirror.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Has('Magic Mirror', player))
     elif bombshop_entrance.name in Isolated_LW_entrances:
         # For these entrances, you cannot walk to the castle/pyramid and thus must use Mirror and then Flute.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) and state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Activated Flute', player), Has('Magic Mirror', player)))
     elif bombshop_entrance.name in Northern_DW_entrances:
         # You can just fly with the Flute, you can take a long walk with Mitts and Hammer,
         # or you can leave a Mirror portal nearby and then walk to the castle to Mirror again.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) or (state.can_lift_heavy_rocks(player) and state.has('Hammer', player)) or (state.has('Magic Mirror', player) and state.can_reach('Light World', 'Region', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Activated Flute', player), And(can_lift_heavy_rocks(player), Has('Hammer', player)), And(Has('Magic Mirror', player), CanReach('Light World', 'Region', player))))
     elif bombshop_entrance.name in Southern_DW_entrances:
         # This is the same as north DW without the Mitts rock present.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Hammer', player) or state.has('Activated Flute', player) or (state.has('Magic Mirror', player) and state.can_reach('Light World', 'Region', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Hammer', player), Has('Activated Flute', player), And(Has('Magic Mirror', player), CanReach('Light World', 'Region', player))))
     elif bombshop_entrance.name in Isolated_DW_entrances:
         # There's just no way to escape these places with the bomb and no Flute.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Has('Activated Flute', player))
     elif bombshop_entrance.name in LW_walkable_entrances:
         # You can fly with the flute, or leave a mirror portal and walk through the light world
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) or (state.has('Magic Mirror', player) and state.can_reach('Light World', 'Region', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Activated Flute', player), And(Has('Magic Mirror', player), CanReach('Light World', 'Region', player))))
     elif bombshop_entrance.name in LW_bush_entrances:
         # These entrances are behind bushes in LW so you need either Pearl or the tools to solve NDW bomb shop locations.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player) and (state.has('Activated Flute', player) or state.has('Moon Pearl', player) or (state.can_lift_heavy_rocks(player) and state.has('Hammer', player))))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Magic Mirror', player), Or(Has('Activated Flute', player), Has('Moon Pearl', player), And(can_lift_heavy_rocks(player), Has('Hammer', player)))))
     elif bombshop_entrance.name == 'Village of Outcasts Shop':
         # This is mostly the same as NDW but the Mirror path requires the Pearl, or using the Hammer
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) or (state.can_lift_heavy_rocks(player) and state.has('Hammer', player)) or (state.has('Magic Mirror', player) and state.can_reach('Light World', 'Region', player) and (state.has('Moon Pearl', player) or state.has('Hammer', player))))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Activated Flute', player), And(can_lift_heavy_rocks(player), Has('Hammer', player)), And(Has('Magic Mirror', player), CanReach('Light World', 'Region', player), Or(Has('Moon Pearl', player), Has('Hammer', player)))))
     elif bombshop_entrance.name == 'Bumper Cave (Bottom)':
         # This is mostly the same as NDW but the Mirror path requires being able to lift a rock.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) or (state.can_lift_heavy_rocks(player) and state.has('Hammer', player)) or (state.has('Magic Mirror', player) and state.can_lift_rocks(player) and state.can_reach('Light World', 'Region', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Activated Flute', player), And(can_lift_heavy_rocks(player), Has('Hammer', player)), And(Has('Magic Mirror', player), can_lift_rocks(player), CanReach('Light World', 'Region', player))))
     elif bombshop_entrance.name == 'Old Man Cave (West)':
         # The three paths back are Mirror and DW walk, Mirror and Flute, or LW walk and then Mirror.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Magic Mirror', player) and ((state.can_lift_heavy_rocks(player) and state.has('Hammer', player)) or (state.can_lift_rocks(player) and state.has('Moon Pearl', player)) or state.has('Activated Flute', player)))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Magic Mirror', player), Or(And(can_lift_heavy_rocks(player), Has('Hammer', player)), And(can_lift_rocks(player), Has('Moon Pearl', player)), Has('Activated Flute', player))))
     elif bombshop_entrance.name == 'Dark World Potion Shop':
         # You either need to Flute to 5 or cross the rock/hammer choice pass to the south.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Activated Flute', player) or state.has('Hammer', player) or state.can_lift_rocks(player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Activated Flute', player), Has('Hammer', player), can_lift_rocks(player)))
     elif bombshop_entrance.name == 'Kings Grave':
         # Either lift the rock and walk to the castle to Mirror or Mirror immediately and Flute.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Activated Flute', player) or state.can_lift_heavy_rocks(player)) and state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Activated Flute', player), can_lift_heavy_rocks(player)), Has('Magic Mirror', player)))
     elif bombshop_entrance.name == 'Waterfall of Wishing':
         # You absolutely must be able to swim to return it from here.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Flippers', player) and state.has('Moon Pearl', player) and state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Has('Flippers', player), Has('Moon Pearl', player), Has('Magic Mirror', player)))
     elif bombshop_entrance.name == 'Ice Palace':
         # You can swim to the dock or use the Flute to get off the island.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: state.has('Flippers', player) or state.has('Activated Flute', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), Or(Has('Flippers', player), Has('Activated Flute', player)))
     elif bombshop_entrance.name == 'Capacity Upgrade':
         # You must Mirror but then can use either Ice Palace return path.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Flippers', player) or state.has('Activated Flute', player)) and state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Flippers', player), Has('Activated Flute', player)), Has('Magic Mirror', player)))
     elif bombshop_entrance.name == 'Two Brothers House (West)':
         # First you must Mirror. Then you can either Flute, cross the peg bridge, or use the Agah 1 portal to Mirror again.
-        add_rule(world.get_entrance('Pyramid Fairy', player), lambda state: (state.has('Activated Flute', player) or state.has('Hammer', player) or state.has('Beat Agahnim 1', player)) and state.has('Magic Mirror', player))
+        add_rule(world.get_entrance('Pyramid Fairy', player), And(Or(Has('Activated Flute', player), Has('Hammer', player), Has('Beat Agahnim 1', player)), Has('Magic Mirror', player)))
     elif bombshop_entrance.name in LW_inaccessible_entrances:
         # You can't get to the pyramid from these entrances without bomb duping.
         raise Exception('No valid path to open Pyramid Fairy. (Could not route from %s)' % bombshop_entrance.name)
@@ -1407,26 +1427,26 @@ def set_bunny_rules(world: MultiWorld, player: int, inverted: bool):
         # bunny revival accessible.
         if world.logic[player] in ['minorglitches', 'owglitches', 'hybridglitches', 'nologic']:
             if region.name == 'Swamp Palace (Entrance)':  # Need to 0hp revive - not in logic
-                return lambda state: state.has('Moon Pearl', player)
+                return Has('Moon Pearl', player)
             if region.name == 'Tower of Hera (Bottom)':  # Need to hit the crystal switch
-                return lambda state: state.has('Magic Mirror', player) and state.has_sword(player) or state.has('Moon Pearl', player)
+                return Or(And(Has('Magic Mirror', player), has_sword(player)), Has('Moon Pearl', player))
             if region.name in OverworldGlitchRules.get_invalid_bunny_revival_dungeons():
-                return lambda state: state.has('Magic Mirror', player) or state.has('Moon Pearl', player)
+                return Or(Has('Magic Mirror', player), Has('Moon Pearl', player))
             if region.type == RegionType.Dungeon:
                 return lambda state: True
             if (((location is None or location.name not in OverworldGlitchRules.get_superbunny_accessible_locations())
                     or (connecting_entrance is not None and connecting_entrance.name in OverworldGlitchRules.get_invalid_bunny_revival_dungeons()))
                     and not is_link(region)):
-                return lambda state: state.has('Moon Pearl', player)
+                return Has('Moon Pearl', player)
         else:
             if not is_link(region):
-                return lambda state: state.has('Moon Pearl', player)
+                return Has('Moon Pearl', player)
 
         # in this case we are mixed region.
         # we collect possible options.
 
         # The base option is having the moon pearl
-        possible_options = [lambda state: state.has('Moon Pearl', player)]
+        possible_options = [Has('Moon Pearl', player)]
 
         # We will search entrances recursively until we find
         # one that leads to an exclusively link state region
@@ -1447,15 +1467,15 @@ def set_bunny_rules(world: MultiWorld, player: int, inverted: bool):
                     # For glitch rulesets, establish superbunny and revival rules.
                     if world.logic[player] in ['minorglitches', 'owglitches', 'hybridglitches', 'nologic'] and entrance.name not in OverworldGlitchRules.get_invalid_bunny_revival_dungeons():
                         if region.name in OverworldGlitchRules.get_sword_required_superbunny_mirror_regions():
-                            possible_options.append(lambda state: path_to_access_rule(new_path, entrance) and state.has('Magic Mirror', player) and state.has_sword(player))
+                            possible_options.append(And(lambda state: path_to_access_rule(new_path, entrance), Has('Magic Mirror', player), has_sword(player)))
                         elif (region.name in OverworldGlitchRules.get_boots_required_superbunny_mirror_regions()
                               or location is not None and location.name in OverworldGlitchRules.get_boots_required_superbunny_mirror_locations()):
-                            possible_options.append(lambda state: path_to_access_rule(new_path, entrance) and state.has('Magic Mirror', player) and state.has('Pegasus Boots', player))
+                            possible_options.append(And(lambda state: path_to_access_rule(new_path, entrance), Has('Magic Mirror', player), Has('Pegasus Boots', player)))
                         elif location is not None and location.name in OverworldGlitchRules.get_superbunny_accessible_locations():
                             if new_region.name == 'Superbunny Cave (Bottom)' or region.name == 'Kakariko Well (top)':
                                 possible_options.append(lambda state: path_to_access_rule(new_path, entrance))
                             else:
-                                possible_options.append(lambda state: path_to_access_rule(new_path, entrance) and state.has('Magic Mirror', player))
+                                possible_options.append(And(lambda state: path_to_access_rule(new_path, entrance), Has('Magic Mirror', player)))
                         if new_region.type != RegionType.Cave:
                             continue
                     else:
@@ -31,6 +31,7 @@ def fake_pearl_state(state, player):
         return state
     fake_state = state.copy()
     fake_state.prog_items['Moon Pearl', player] += 1
+    fake_state.stale[player] = True
     return fake_state
 
 
@@ -125,6 +125,8 @@ class ALTTPWorld(World):
     remote_start_inventory: bool = False
     required_client_version = (0, 3, 2)
     web = ALTTPWeb()
+    # rules reading other state than own items are lambdas and don't declare dependencies
+    incremental_reachability = True
 
     pedestal_credit_texts: typing.Dict[int, str] = \
         {data.item_code: data.pedestal_credit for data in item_table.values() if data.pedestal_credit}
@@ -92,20 +92,310 @@ def exclusion_rules(world: MultiWorld, player: int, exclude_locations: typing.Se
             location.progress_type = LocationProgressType.EXCLUDED
 
 
-def set_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"], rule: CollectionRule):
+class Rule:
+    """An access rule that can be analyzed before it is run.
+    set_rule and add_rule compile rules into plain closures, which carry the rule as .rule
+    and, if the rule only reads items of one player, the item names it reads as .item_dependencies."""
+    _compiled: typing.Optional[CollectionRule] = None
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
+        return compiled(state)
+
+    def build(self) -> CollectionRule:
+        """Returns a new closure evaluating this rule."""
+        raise NotImplementedError
+
+    def dependencies(self) -> typing.Optional[typing.FrozenSet[typing.Tuple[str, int]]]:
+        """Returns all (item name, player) pairs this rule reads, or None if it reads anything else."""
+        raise NotImplementedError
+
+    def compile(self, player: typing.Optional[int] = None) -> CollectionRule:
+        """Returns the closure for this rule, for use as access rule of a spot of player."""
+        compiled = self._compiled
+        if compiled is None:
+            self._compiled = compiled = self.build()
+            compiled.rule = self
+            dependencies = self.dependencies()
+            if dependencies is not None and len({item_player for _, item_player in dependencies}) < 2:
+                compiled.item_dependencies = frozenset(item_name for item_name, _ in dependencies)
+                compiled.item_player = next(iter(dependencies))[1] if dependencies else None
+        if player is not None and getattr(compiled, "item_player", player) not in {player, None}:
+            # reads items of another player than the spot, so do not claim them as its own dependencies
+            compiled = self.build()
+            compiled.rule = self
+        return compiled
+
+
+class Constant(Rule):
+    def __init__(self, value: typing.Any):
+        self.value = bool(value)
+
+    def build(self) -> CollectionRule:
+        if self.value:
+            return lambda state: True
+        return lambda state: False
+
+    def dependencies(self) -> typing.FrozenSet[typing.Tuple[str, int]]:
+        return frozenset()
+
+    def __repr__(self) -> str:
+        return f"Constant({self.value})"
+
+
+class Has(Rule):
+    def __init__(self, item: str, player: int, count: int = 1):
+        self.item = item
+        self.player = player
+        self.count = count
+
+    def build(self) -> CollectionRule:
+        key = self.item, self.player
+        count = self.count
+        if count == 1:
+            return lambda state: state.prog_items.get(key, 0) > 0
+        return lambda state: state.prog_items.get(key, 0) >= count
+
+    def dependencies(self) -> typing.FrozenSet[typing.Tuple[str, int]]:
+        return frozenset(((self.item, self.player),))
+
+    def __repr__(self) -> str:
+        return f"Has({self.item!r}, {self.player}, {self.count})"
+
+
+class HasAll(Rule):
+    def __init__(self, items: typing.Iterable[str], player: int):
+        self.items = tuple(items)
+        self.player = player
+
+    def build(self) -> CollectionRule:
+        keys = tuple((item, self.player) for item in self.items)
+
+        def has_all(state: "BaseClasses.CollectionState") -> bool:
+            prog_items = state.prog_items
+            for key in keys:
+                if prog_items.get(key, 0) < 1:
+                    return False
+            return True
+
+        return has_all
+
+    def dependencies(self) -> typing.FrozenSet[typing.Tuple[str, int]]:
+        return frozenset((item, self.player) for item in self.items)
+
+    def __repr__(self) -> str:
+        return f"HasAll({self.items!r}, {self.player})"
+
+
+class HasAny(Rule):
+    def __init__(self, items: typing.Iterable[str], player: int):
+        self.items = tuple(items)
+        self.player = player
+
+    def build(self) -> CollectionRule:
+        keys = tuple((item, self.player) for item in self.items)
+
+        def has_any(state: "BaseClasses.CollectionState") -> bool:
+            prog_items = state.prog_items
+            for key in keys:
+                if prog_items.get(key, 0) > 0:
+                    return True
+            return False
+
+        return has_any
+
+    def dependencies(self) -> typing.FrozenSet[typing.Tuple[str, int]]:
+        return frozenset((item, self.player) for item in self.items)
+
+    def __repr__(self) -> str:
+        return f"HasAny({self.items!r}, {self.player})"
+
+
+class Count(Rule):
+    """Requires count of the given items in total."""
+    def __init__(self, items: typing.Iterable[str], player: int, count: int):
+        self.items = tuple(items)
+        self.player = player
+        self.count = count
+
+    def build(self) -> CollectionRule:
+        keys = tuple((item, self.player) for item in self.items)
+        count = self.count
+
+        def has_count(state: "BaseClasses.CollectionState") -> bool:
+            prog_items = state.prog_items
+            found = 0
+            for key in keys:
+                found += prog_items.get(key, 0)
+                if found >= count:
+                    return True
+            return found >= count
+
+        return has_count
+
+    def dependencies(self) -> typing.FrozenSet[typing.Tuple[str, int]]:
+        return frozenset((item, self.player) for item in self.items)
+
+    def __repr__(self) -> str:
+        return f"Count({self.items!r}, {self.player}, {self.count})"
+
+
+class CanReach(Rule):
+    def __init__(self, spot: str, resolution_hint: str, player: int):
+        self.spot = spot
+        self.resolution_hint = resolution_hint
+        self.player = player
+
+    def build(self) -> CollectionRule:
+        spot, resolution_hint, player = self.spot, self.resolution_hint, self.player
+        return lambda state: state.can_reach(spot, resolution_hint, player)
+
+    def dependencies(self) -> None:
+        return None
+
+    def __repr__(self) -> str:
+        return f"CanReach({self.spot!r}, {self.resolution_hint!r}, {self.player})"
+
+
+class _Combination(Rule):
+    rules: typing.Tuple[typing.Union[Rule, CollectionRule], ...]
+    # value of a part that decides the whole combination
+    deciding: bool
+    # rule merging single item parts of one player
+    merged_type: typing.Type[typing.Union[HasAll, HasAny]]
+
+    def __init__(self, *rules: typing.Union[Rule, CollectionRule, bool, int]):
+        """Accepts Rules, plain callables and constants, the latter usually being option values."""
+        merged_items: typing.Dict[int, typing.List[str]] = {}
+        parts: typing.List[typing.Union[Rule, CollectionRule]] = []
+        for rule in rules:
+            compiled_from = getattr(rule, "rule", None)
+            if isinstance(compiled_from, Rule):
+                rule = compiled_from
+            if isinstance(rule, _Combination) and len(rule.rules) == 1:
+                rule = rule.rules[0]
+            if isinstance(rule, Constant) or not callable(rule):
+                if bool(getattr(rule, "value", rule)) == self.deciding:
+                    self.rules = (Constant(self.deciding),)
+                    return
+            elif isinstance(rule, type(self)):
+                for part in rule.rules:
+                    if isinstance(part, self.merged_type):
+                        merged_items.setdefault(part.player, []).extend(part.items)
+                    elif isinstance(part, Has) and part.count == 1:
+                        merged_items.setdefault(part.player, []).append(part.item)
+                    else:
+                        parts.append(part)
+            elif isinstance(rule, self.merged_type):
+                merged_items.setdefault(rule.player, []).extend(rule.items)
+            elif isinstance(rule, Has) and rule.count == 1:
+                merged_items.setdefault(rule.player, []).append(rule.item)
+            else:
+                parts.append(rule)
+        # plain item checks are cheapest, so they go first
+        merged: typing.List[Rule] = []
+        for player, items in merged_items.items():
+            items = list(dict.fromkeys(items))
+            merged.append(Has(items[0], player) if len(items) == 1 else self.merged_type(items, player))
+        self.rules = tuple(merged + parts) or (Constant(not self.deciding),)
+
+    def dependencies(self) -> typing.Optional[typing.FrozenSet[typing.Tuple[str, int]]]:
+        dependencies = frozenset()
+        for rule in self.rules:
+            if not isinstance(rule, Rule):
+                return None
+            rule_dependencies = rule.dependencies()
+            if rule_dependencies is None:
+                return None
+            dependencies |= rule_dependencies
+        return dependencies
+
+    def _build_parts(self) -> typing.List[CollectionRule]:
+        return [rule.compile() if isinstance(rule, Rule) else rule for rule in self.rules]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.rules))})"
+
+
+class And(_Combination):
+    deciding = False
+    merged_type = HasAll
+
+    def build(self) -> CollectionRule:
+        parts = self._build_parts()
+        if len(parts) == 1:
+            part = parts[0]
+            return self.rules[0].build() if isinstance(self.rules[0], Rule) else lambda state: part(state)
+        if len(parts) == 2:
+            first, second = parts
+            return lambda state: first(state) and second(state)
+
+        def all_of(state: "BaseClasses.CollectionState") -> bool:
+            for part in parts:
+                if not part(state):
+                    return False
+            return True
+
+        return all_of
+
+
+class Or(_Combination):
+    deciding = True
+    merged_type = HasAny
+
+    def build(self) -> CollectionRule:
+        parts = self._build_parts()
+        if len(parts) == 1:
+            part = parts[0]
+            return self.rules[0].build() if isinstance(self.rules[0], Rule) else lambda state: part(state)
+        if len(parts) == 2:
+            first, second = parts
+            return lambda state: first(state) or second(state)
+
+        def any_of(state: "BaseClasses.CollectionState") -> bool:
+            for part in parts:
+                if part(state):
+                    return True
+            return False
+
+        return any_of
+
+
+def set_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"],
+             rule: typing.Union[CollectionRule, Rule]):
+    if isinstance(rule, Rule):
+        rule = rule.compile(spot.player)
     spot.access_rule = rule
 
 
-def add_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"], rule: CollectionRule, combine="and"):
+def add_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"],
+             rule: typing.Union[CollectionRule, Rule], combine="and"):
     old_rule = spot.access_rule
     # empty rule, replace instead of add
     if old_rule is spot.__class__.access_rule:
-        spot.access_rule = rule if combine == "and" else old_rule
+        if combine == "and":
+            set_rule(spot, rule)
+    elif isinstance(rule, Rule):
+        set_rule(spot, And(rule, old_rule) if combine == "and" else Or(rule, old_rule))
     else:
         if combine == "and":
             spot.access_rule = lambda state: rule(state) and old_rule(state)
         else:
             spot.access_rule = lambda state: rule(state) or old_rule(state)
+        # the combined rule only reads what both parts read, if both declared it
+        rule_dependencies = getattr(rule, "item_dependencies", None)
+        old_dependencies = getattr(old_rule, "item_dependencies", None)
+        if rule_dependencies is not None and old_dependencies is not None:
+            spot.access_rule.item_dependencies = frozenset(rule_dependencies) | frozenset(old_dependencies)
+
+
+def declare_item_dependencies(rule: CollectionRule, *item_names: str) -> CollectionRule:
+    """Mark rule as only reading the given item names of its own player from state.prog_items,
+    which allows worlds with incremental_reachability to skip retrying it when other items are collected."""
+    rule.item_dependencies = frozenset(item_names)
+    return rule
 
 
 def forbid_item(location: "BaseClasses.Location", item: str, player: int):
@@ -6,6 +6,7 @@ import os
 import json
 import typing
 import ast
+import copy
 
 import jinja2
 
@@ -181,6 +182,53 @@ class Absorber(ast.NodeTransformer):
             return True
 
 
+class RuleObjectTransformer(ast.NodeTransformer):
+    """Turns the state queries written by Absorber into rule objects of worlds.generic.Rules,
+    with option and notch lookups done once in set_generated_rules instead of on every check."""
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        return ast.Call(func=ast.Name(id="And" if type(node.op) == ast.And else "Or", ctx=ast.Load()),
+                        args=[self.visit(value) for value in node.values], keywords=[])
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        left = node.left
+        if self.is_state_call(left, "count") and len(node.ops) == 1 and type(node.ops[0]) == ast.Gt:
+            right = self.visit(node.comparators[0])
+            if isinstance(right, ast.Constant):
+                count = ast.Constant(value=right.value + 1)
+            else:
+                count = ast.BinOp(left=right, op=ast.Add(), right=ast.Constant(value=1))
+            return ast.Call(func=ast.Name(id="Has", ctx=ast.Load()), args=[left.args[0], left.args[1], count],
+                            keywords=[])
+        return self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if self.is_state_call(node, "count"):
+            return ast.Call(func=ast.Name(id="Has", ctx=ast.Load()), args=node.args, keywords=[])
+        if self.is_state_call(node, "can_reach"):
+            return ast.Call(func=ast.Name(id="CanReach", ctx=ast.Load()), args=node.args, keywords=[])
+        for method, helper in (("_hk_option", "option"), ("_hk_notches", "notches"), ("_hk_start", "start")):
+            if self.is_state_call(node, method):
+                # drop the player argument, the helpers are bound to hk_world
+                return ast.Call(func=ast.Name(id=helper, ctx=ast.Load()), args=node.args[1:], keywords=[])
+        return self.generic_visit(node)
+
+    @staticmethod
+    def is_state_call(node: ast.AST, method: str) -> bool:
+        return isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and \
+            isinstance(node.func.value, ast.Name) and node.func.value.id == "state" and node.func.attr == method
+
+
+def rule_object_text(tree: ast.AST) -> str:
+    # macros are shared between rules, so work on a copy
+    tree = RuleObjectTransformer().visit(copy.deepcopy(tree))
+    if isinstance(tree, ast.Expression):
+        tree = tree.body
+    if not (isinstance(tree, ast.Call) and isinstance(tree.func, ast.Name) and
+            tree.func.id in {"And", "Or", "Has", "CanReach"}):
+        tree = ast.Call(func=ast.Name(id="Constant", ctx=ast.Load()), args=[tree], keywords=[])
+    return unparse(tree)
+
+
 def get_parser(truths: typing.Set[str] = frozenset(), falses: typing.Set[str] = frozenset()):
     return Absorber(truths, falses)
 
@@ -413,7 +461,7 @@ for loc_obj in raw_location_rules:
     rule = loc_obj["logic"]
     if rule != "ANY":
         rule = ast_parse(parser, rule)
-        location_rules[loc_name] = unparse(rule)
+        location_rules[loc_name] = rule_object_text(rule)
 location_rules["Salubra_(Requires_Charms)"] = location_rules["Salubra"]
 
 connectors_rules: typing.Dict[str, str] = {}
@@ -421,16 +469,14 @@ for connector_obj in connectors_logic:
     name = connector_obj["Name"]
     rule = connector_obj["logic"]
     rule = ast_parse(parser, rule)
-    rule = unparse(rule)
-    if rule != "True":
-        connectors_rules[name] = rule
+    if unparse(rule) != "True":
+        connectors_rules[name] = rule_object_text(rule)
 
 event_rules: typing.Dict[str, str] = {}
 for event in events:
     rule = ast_parse(parser, event["logic"])
-    rule = unparse(rule)
-    if rule != "True":
-        event_rules[event["name"]] = rule
+    if unparse(rule) != "True":
+        event_rules[event["name"]] = rule_object_text(rule)
 
 
 event_rules.update(connectors_rules)
@@ -1,4 +1,4 @@
-from ..generic.Rules import set_rule, add_rule
+from ..generic.Rules import set_rule, add_rule, Has
 from BaseClasses import MultiWorld
 from ..AutoWorld import World
 from .GeneratedRules import set_generated_rules
@@ -49,4 +49,4 @@ def set_rules(hk_world: World):
                 for term, amount in location.costs.items():
                     if term == "GEO":  # No geo logic!
                         continue
-                    add_rule(location, lambda state, term=term, amount=amount: state.count(term, player) >= amount)
+                    add_rule(location, Has(term, player, amount))
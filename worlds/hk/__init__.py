@@ -155,6 +155,7 @@ class HKWorld(World):
     charm_costs: typing.List[int]
     cached_filler_items = {}
     data_version = 2
+    incremental_reachability = True
 
     def __init__(self, world, player):
         super(HKWorld, self).__init__(world, player)
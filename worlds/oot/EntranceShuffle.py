@@ -463,6 +463,8 @@ def shuffle_random_entrances(ootworld):
     for item_tuple in none_state.prog_items:
         if item_tuple[1] == player:
             none_state.prog_items[item_tuple] = 0
+    # the copy inherits the stale flags of all_state, which may already have been swept with the full item pool
+    none_state.stale[player] = True
 
     # Plando entrances
     if world.plando_connections[player]:
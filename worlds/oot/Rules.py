@@ -44,7 +44,16 @@ class OOTLogic(LogicMixin):
             return can_reach
         return self.age[player] == age
 
+    def _oot_own_player(self, player):
+        self._oot_owned_players.add(player)
+        for per_player in (self.child_reachable_regions, self.adult_reachable_regions,
+                           self.child_blocked_connections, self.adult_blocked_connections,
+                           self.day_reachable_regions, self.dampe_reachable_regions):
+            per_player[player] = per_player[player].copy()
+
     def _oot_reach_at_time(self, regionname, tod, already_checked, player):
+        if player not in self._oot_owned_players:
+            self._oot_own_player(player)
         name_map = {
             TimeOfDay.DAY: self.day_reachable_regions[player],
             TimeOfDay.DAMPE: self.dampe_reachable_regions[player],
@@ -77,6 +86,8 @@ class OOTLogic(LogicMixin):
     # Store the age before calling this!
     def _oot_update_age_reachable_regions(self, player): 
         self.stale[player] = False
+        if player not in self._oot_owned_players:
+            self._oot_own_player(player)
         for age in ['child', 'adult']: 
             self.age[player] = age
             rrp = getattr(self, f'{age}_reachable_regions')[player]
@@ -103,7 +114,7 @@ class OOTLogic(LogicMixin):
                     bc.remove(connection)
                     bc.update(new_region.exits)
                     queue.extend(new_region.exits)
-                    self.path[new_region] = (new_region.name, self.path.get(connection, None))
+                    self.set_path(new_region, (new_region.name, self.path.get(connection, None)))
 
 
 # Sets extra rules on various specific locations not handled by the rule parser.
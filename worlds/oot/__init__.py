@@ -1,6 +1,5 @@
 import logging
 import threading
-import copy
 from typing import Optional, List, AbstractSet  # remove when 3.8 support is dropped
 from collections import Counter, deque
 from string import printable
@@ -51,20 +50,19 @@ class OOTCollectionState(metaclass=AutoLogicRegister):
         self.day_reachable_regions = {player: set() for player in all_ids}
         self.dampe_reachable_regions = {player: set() for player in all_ids}
         self.age = {player: None for player in all_ids}
+        self._oot_owned_players = set(all_ids)
 
     def copy_mixin(self, ret) -> CollectionState:
-        ret.child_reachable_regions = {player: copy.copy(self.child_reachable_regions[player]) for player in
-                                       self.child_reachable_regions}
-        ret.adult_reachable_regions = {player: copy.copy(self.adult_reachable_regions[player]) for player in
-                                       self.adult_reachable_regions}
-        ret.child_blocked_connections = {player: copy.copy(self.child_blocked_connections[player]) for player in
-                                         self.child_blocked_connections}
-        ret.adult_blocked_connections = {player: copy.copy(self.adult_blocked_connections[player]) for player in
-                                         self.adult_blocked_connections}
-        ret.day_reachable_regions = {player: copy.copy(self.adult_reachable_regions[player]) for player in
-                                     self.day_reachable_regions}
-        ret.dampe_reachable_regions = {player: copy.copy(self.adult_reachable_regions[player]) for player in
-                                       self.dampe_reachable_regions}
+        # the per-player sets are shared with the copy until either state writes to them, see _oot_own_player
+        ret.child_reachable_regions = self.child_reachable_regions.copy()
+        ret.adult_reachable_regions = self.adult_reachable_regions.copy()
+        ret.child_blocked_connections = self.child_blocked_connections.copy()
+        ret.adult_blocked_connections = self.adult_blocked_connections.copy()
+        ret.day_reachable_regions = self.day_reachable_regions.copy()
+        ret.dampe_reachable_regions = self.dampe_reachable_regions.copy()
+        ret.age = self.age.copy()
+        ret._oot_owned_players = set()
+        self._oot_owned_players = set()
         return ret
 
 
@@ -950,6 +948,17 @@ class OOTWorld(World):
             item_hint_players = hint_type_players('item')
             barren_hint_players = hint_type_players('barren')
             woth_hint_players = hint_type_players('woth')
+            sphere_model = multiworld.get_sphere_model() if woth_hint_players else None
+
+            def is_required(loc) -> bool:
+                # the game got beaten before the sphere sweep reached loc, so it can't need the item there
+                beaten_sphere = sphere_model.beaten_sphere
+                if beaten_sphere is not None and sphere_model.location_spheres.get(loc, beaten_sphere + 1) > beaten_sphere:
+                    return False
+                # Skip item at location and see if game is still beatable
+                state = CollectionState(multiworld)
+                state.locations_checked.add(loc)
+                return not multiworld.can_beat_game(state)
 
             items_by_region = {}
             for player in barren_hint_players:
@@ -980,12 +989,8 @@ class OOTWorld(World):
                             items_by_region[loc.player][hint_area]['weight'] += 1
                             if loc.item.advancement or loc.item.useful:
                                 items_by_region[loc.player][hint_area]['is_barren'] = False
-                        if loc.player in woth_hint_players and loc.item.advancement:
-                            # Skip item at location and see if game is still beatable
-                            state = CollectionState(multiworld)
-                            state.locations_checked.add(loc)
-                            if not multiworld.can_beat_game(state):
-                                multiworld.worlds[loc.player].required_locations.append(loc)
+                        if loc.player in woth_hint_players and loc.item.advancement and is_required(loc):
+                            multiworld.worlds[loc.player].required_locations.append(loc)
             elif barren_hint_players or woth_hint_players:  # Check only relevant oot locations for barren/woth
                 for player in (barren_hint_players | woth_hint_players):
                     for loc in multiworld.worlds[player].get_locations():
@@ -995,11 +1000,8 @@ class OOTWorld(World):
                                 items_by_region[player][hint_area]['weight'] += 1
                                 if loc.item.advancement or loc.item.useful:
                                     items_by_region[player][hint_area]['is_barren'] = False
-                            if player in woth_hint_players and loc.item.advancement:
-                                state = CollectionState(multiworld)
-                                state.locations_checked.add(loc)
-                                if not multiworld.can_beat_game(state):
-                                    multiworld.worlds[player].required_locations.append(loc)
+                            if player in woth_hint_players and loc.item.advancement and is_required(loc):
+                                multiworld.worlds[player].required_locations.append(loc)
             for player in barren_hint_players:
                 multiworld.worlds[player].empty_areas = {region: info for (region, info) in items_by_region[player].items()
                                                     if info['is_barren']}
@@ -103,11 +103,12 @@ class SubnauticaWorld(World):
         # Victory item
         self.multiworld.get_location("Aurora - Captain Data Terminal", self.player).place_locked_item(
             neptune_launch_platform)
+        goal_event = self.multiworld.goal[self.player].get_event_name()
         for event in Locations.events:
+            # the goal event holds the victory "item"
             self.multiworld.get_location(event, self.player).place_locked_item(
-                SubnauticaItem(event, ItemClassification.progression, None, player=self.player))
-        # make the goal event the victory "item"
-        self.multiworld.get_location(self.multiworld.goal[self.player].get_event_name(), self.player).item.name = "Victory"
+                SubnauticaItem("Victory" if event == goal_event else event, ItemClassification.progression, None,
+                               player=self.player))
 
     def fill_slot_data(self) -> Dict[str, Any]:
         goal: Options.Goal = self.multiworld.goal[self.player]